@@ -0,0 +1,244 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presentation_generator.services.presentation_service import PresentationService
+from presentation_generator.services.rate_limiter import get_rate_limiter
+from presentation_generator.services.hedging import HedgePolicy, get_hedge_policy
+from presentation_generator.services.retry_policy import RetryPolicy
+from presentation_generator.services.json_extractor import get_json_extractor
+from benchmarks.stub_server import StubServer
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def percentile(values: list, percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))]
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def parse_sizes(value: str) -> list:
+    sizes = []
+    for item in value.split(","):
+        sections, slides = item.lower().split("x")
+        sizes.append((int(sections), int(slides)))
+    return sizes
+
+
+def build_service(server: StubServer, work_dir: Path, args) -> PresentationService:
+    service = PresentationService("stub-key", output_dir=str(work_dir / "output"), data_dir=str(work_dir))
+    service.settings.set("concurrent_generation", not args.serial)
+    service.settings.set("max_concurrent_requests", args.requests)
+    service.settings.set("section_batch_generation", args.section_batch)
+    
+    global_hedge = get_hedge_policy()
+    hedge_policy = HedgePolicy(
+        enabled=global_hedge.enabled and not args.no_hedge,
+        percentile=global_hedge.percentile,
+        budget_ratio=global_hedge.budget_ratio
+    )
+    retry_policy = RetryPolicy(base_delay=0.1, attempt_timeout=args.attempt_timeout, deadline=args.attempt_timeout * 3)
+    for ionet_service in (service.ai_service.ionet_service, service.summary_service.ionet_service):
+        ionet_service.base_url = server.base_url
+        ionet_service.response_cache = None
+        ionet_service.stream = args.stream
+        ionet_service.hedge_policy = hedge_policy
+        ionet_service.retry_policy = retry_policy
+    
+    get_rate_limiter().configure(requests_per_minute=args.rpm, tokens_per_minute=0, max_concurrency=args.max_concurrency)
+    return service
+
+
+async def run_size(server: StubServer, sections: int, slides: int, work_dir: Path, args) -> dict:
+    server.reset_stats()
+    get_json_extractor().reset_stats()
+    service = build_service(server, work_dir, args)
+    deck_semaphore = asyncio.Semaphore(args.concurrency)
+    deck_times = []
+    render_times = []
+    failures = 0
+    
+    async def one_deck(index: int) -> None:
+        nonlocal failures
+        async with deck_semaphore:
+            start = time.perf_counter()
+            try:
+                presentation = await service.generate_presentation(
+                    title=f"Benchmark deck {index + 1}",
+                    max_sections=sections,
+                    max_slides=slides,
+                    language=service.loc.t('language_english'),
+                    enable_web_search=False
+                )
+            except Exception:
+                failures += 1
+                return
+            deck_times.append(time.perf_counter() - start)
+            
+            if not args.no_render:
+                render_start = time.perf_counter()
+                await asyncio.to_thread(service.pptx_generator.generate_pptx, presentation, f"bench_{sections}x{slides}_{index}.pptx")
+                render_times.append(time.perf_counter() - render_start)
+    
+    await service.start()
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(one_deck(index) for index in range(args.decks)))
+    finally:
+        await service.close()
+    elapsed = time.perf_counter() - start
+    
+    server_stats = server.get_stats()
+    hedge_stats = service.ai_service.ionet_service.hedge_policy.get_stats()
+    json_stats = get_json_extractor().get_stats()
+    return {
+        'size': f"{sections}x{slides}",
+        'decks': len(deck_times),
+        'failed': failures,
+        'elapsed_seconds': round(elapsed, 3),
+        'decks_per_minute': round(len(deck_times) / elapsed * 60, 2) if elapsed else 0.0,
+        'deck_p50_seconds': round(percentile(deck_times, 50), 3),
+        'deck_p95_seconds': round(percentile(deck_times, 95), 3),
+        'render_p50_ms': round(percentile(render_times, 50) * 1000, 1),
+        'render_p95_ms': round(percentile(render_times, 95) * 1000, 1),
+        'requests': server_stats['requests'],
+        'requests_per_deck': round(server_stats['requests'] / max(1, args.decks), 1),
+        'requests_by_type': server_stats['requests_by_type'],
+        'max_in_flight': server_stats['max_in_flight'],
+        'errors_injected': server_stats['errors_injected'],
+        'rate_limited': server_stats['rate_limited'],
+        'malformed': server_stats['malformed'],
+        'json_repaired': json_stats['repaired'],
+        'json_failed': json_stats['failed'] + json_stats['rejected'],
+        'hedged': hedge_stats['hedged'],
+        'request_latency': {
+            prompt_type: {
+                'p50_ms': round((stats['p50'] or 0) * 1000, 1),
+                'p95_ms': round((stats['p95'] or 0) * 1000, 1)
+            }
+            for prompt_type, stats in hedge_stats['latency'].items()
+        },
+        'peak_rss_mb': round(peak_rss_mb(), 1)
+    }
+
+
+def report(results: list) -> None:
+    print(f"{'size':<8}{'decks':>6}{'fail':>6}{'decks/min':>11}{'p50 s':>9}{'p95 s':>9}{'render p95':>12}{'req/deck':>10}{'429':>6}{'5xx':>6}{'hedged':>8}{'RSS MB':>9}")
+    for result in results:
+        print(
+            f"{result['size']:<8}{result['decks']:>6}{result['failed']:>6}{result['decks_per_minute']:>11.2f}"
+            f"{result['deck_p50_seconds']:>9.2f}{result['deck_p95_seconds']:>9.2f}{result['render_p95_ms']:>10.1f}ms"
+            f"{result['requests_per_deck']:>10.1f}{result['rate_limited']:>6}{result['errors_injected']:>6}{result['hedged']:>8}{result['peak_rss_mb']:>9.1f}"
+        )
+    print()
+    for result in results:
+        latency = ", ".join(
+            f"{prompt_type} {stats['p50_ms']:.0f}/{stats['p95_ms']:.0f}"
+            for prompt_type, stats in sorted(result['request_latency'].items())
+        )
+        print(f"{result['size']:<8}request p50/p95 ms: {latency}")
+        if result['malformed'] or result['json_repaired'] or result['json_failed']:
+            print(f"{result['size']:<8}JSON replies: {result['malformed']} malformed, {result['json_repaired']} repaired locally, {result['json_failed']} unusable")
+
+
+def check_regressions(results: list, baseline_path: Path, tolerance: float) -> list:
+    baseline = {result['size']: result for result in json.loads(baseline_path.read_text(encoding="utf-8"))['results']}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result['size'])
+        if not previous:
+            continue
+        if result['decks_per_minute'] < previous['decks_per_minute'] * (1 - tolerance):
+            regressions.append(f"{result['size']}: decks/min {previous['decks_per_minute']} -> {result['decks_per_minute']}")
+        if result['deck_p95_seconds'] > previous['deck_p95_seconds'] * (1 + tolerance):
+            regressions.append(f"{result['size']}: deck p95 {previous['deck_p95_seconds']}s -> {result['deck_p95_seconds']}s")
+        if result['requests_per_deck'] > previous['requests_per_deck'] * (1 + tolerance):
+            regressions.append(f"{result['size']}: requests/deck {previous['requests_per_deck']} -> {result['requests_per_deck']}")
+    return regressions
+
+
+async def main(args) -> int:
+    results = []
+    json_path = Path(args.json).resolve() if args.json else None
+    baseline_path = Path(args.baseline).resolve() if args.baseline else None
+    original_cwd = os.getcwd()
+    async with StubServer(
+        latency=args.latency,
+        latency_distribution=args.distribution,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        token_interval=args.token_interval,
+        malformed_rate=args.malformed_rate,
+        seed=args.seed
+    ) as server:
+        with tempfile.TemporaryDirectory(prefix="deck_benchmark_") as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                for sections, slides in parse_sizes(args.sizes):
+                    results.append(await run_size(server, sections, slides, Path(temp_dir), args))
+            finally:
+                os.chdir(original_cwd)
+    
+    report(results)
+    
+    if json_path:
+        json_path.write_text(json.dumps({'args': vars(args), 'results': results}, ensure_ascii=False, indent=2), encoding="utf-8")
+    
+    if baseline_path:
+        regressions = check_regressions(results, baseline_path, args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions against baseline")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate and render decks against a local io.net stub and report throughput")
+    parser.add_argument("--sizes", default="3x4,5x6", help="comma separated SECTIONSxSLIDES deck sizes")
+    parser.add_argument("--decks", type=int, default=5, help="decks per size")
+    parser.add_argument("--concurrency", type=int, default=1, help="decks generated at the same time")
+    parser.add_argument("--requests", type=int, default=4, help="concurrent API requests per deck")
+    parser.add_argument("--serial", action="store_true", help="disable concurrent slide generation")
+    parser.add_argument("--section-batch", action="store_true", help="generate each section in one request")
+    parser.add_argument("--stream", action="store_true", help="use streaming chat completions")
+    parser.add_argument("--no-hedge", action="store_true", help="disable hedged requests")
+    parser.add_argument("--no-render", action="store_true", help="skip PPTX rendering")
+    parser.add_argument("--latency", type=float, default=0.2, help="mean stub latency in seconds")
+    parser.add_argument("--distribution", default="lognormal", choices=["fixed", "uniform", "exponential", "lognormal"])
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered with HTTP 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429 responses")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="share of JSON replies wrapped in a code fence with a trailing comma")
+    parser.add_argument("--token-interval", type=float, default=0.0, help="delay between streamed chunks in seconds")
+    parser.add_argument("--attempt-timeout", type=float, default=30.0, help="per-attempt API timeout in seconds")
+    parser.add_argument("--rpm", type=float, default=0, help="client requests per minute limit, 0 disables it")
+    parser.add_argument("--max-concurrency", type=int, default=16, help="client-wide concurrent request ceiling")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against a previous --json result and fail on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed relative regression against the baseline")
+    sys.exit(asyncio.run(main(parser.parse_args())))
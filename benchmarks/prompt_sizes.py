@@ -0,0 +1,104 @@
+import sys
+import json
+import string
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presentation_generator.localization.prompts import PROMPTS, SYSTEM_PROMPTS
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+SAMPLE_VALUES = {
+    'title': "Renewable energy in modern cities",
+    'presentation_title': "Renewable energy in modern cities",
+    'section_title': "Solar power adoption",
+    'slide_title': "Rooftop installations and their payback period",
+    'topic': "Renewable energy in modern cities",
+    'count': 4,
+    'language': "English",
+    'current_date': "01.01.2025",
+    'base_content': "",
+    'web_summary': " ".join(["Municipal programs subsidise rooftop panels and report payback periods of six to nine years."] * 6)
+}
+
+
+def count_tokens(text: str, encoding) -> int:
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return len(text.encode("utf-8")) // 4
+
+
+def render(template: str) -> str:
+    fields = {name for _, name, _, _ in string.Formatter().parse(template) if name}
+    return template.format(**{name: SAMPLE_VALUES.get(name, "sample") for name in fields})
+
+
+def measure(encoding) -> list:
+    rows = []
+    for language, prompts in PROMPTS.items():
+        for prompt_type, template in prompts.items():
+            system_template = SYSTEM_PROMPTS.get(language, {}).get(prompt_type)
+            system_tokens = count_tokens(system_template.format().strip(), encoding) if system_template else 0
+            user_tokens = count_tokens(render(template), encoding)
+            rows.append({
+                'language': language,
+                'prompt_type': prompt_type,
+                'system_tokens': system_tokens,
+                'user_tokens': user_tokens,
+                'total_tokens': system_tokens + user_tokens,
+                'template_chars': len(template) + (len(system_template) if system_template else 0)
+            })
+    return rows
+
+
+def deck_estimate(rows: list, language: str, sections: int, slides: int) -> dict:
+    calls = {
+        'presentation_summary': 1,
+        'title_slide_header': 1,
+        'section_titles': 1,
+        'slide_titles': sections,
+        'slide_content': sections * slides
+    }
+    by_type = {row['prompt_type']: row for row in rows if row['language'] == language}
+    total = sum(by_type[prompt_type]['total_tokens'] * count for prompt_type, count in calls.items() if prompt_type in by_type)
+    uncached = sum(
+        (by_type[prompt_type]['user_tokens'] if by_type[prompt_type]['system_tokens'] else by_type[prompt_type]['total_tokens']) * count
+        for prompt_type, count in calls.items() if prompt_type in by_type
+    )
+    return {'language': language, 'size': f"{sections}x{slides}", 'prompt_tokens': total, 'prompt_tokens_uncached': uncached}
+
+
+def main(args) -> int:
+    encoding = tiktoken.get_encoding(args.encoding) if tiktoken is not None else None
+    rows = measure(encoding)
+    sections, slides = (int(value) for value in args.deck.lower().split("x"))
+    estimates = [deck_estimate(rows, language, sections, slides) for language in PROMPTS]
+    
+    if args.json:
+        print(json.dumps({'tokenizer': args.encoding if encoding else "utf8_bytes/4", 'prompts': rows, 'decks': estimates}, ensure_ascii=False, indent=2))
+        return 0
+    
+    print(f"tokenizer: {args.encoding if encoding else 'utf-8 bytes / 4 (install tiktoken for exact counts)'}")
+    print(f"{'language':<10}{'prompt type':<24}{'system':>8}{'user':>8}{'total':>8}")
+    for row in sorted(rows, key=lambda row: (row['language'], -row['total_tokens'])):
+        print(f"{row['language']:<10}{row['prompt_type']:<24}{row['system_tokens']:>8}{row['user_tokens']:>8}{row['total_tokens']:>8}")
+    print()
+    for estimate in estimates:
+        print(
+            f"{estimate['language']:<10}deck {estimate['size']}: {estimate['prompt_tokens']} prompt tokens, "
+            f"{estimate['prompt_tokens_uncached']} outside the shared system prefix"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report prompt template sizes in tokens per prompt type and language")
+    parser.add_argument("--deck", default="3x4", help="SECTIONSxSLIDES deck used for the per-deck estimate")
+    parser.add_argument("--encoding", default="cl100k_base", help="tiktoken encoding used when tiktoken is installed")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,60 @@
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+import aiohttp
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presentation_generator.services.ionet_service import IoNetService
+from benchmarks.stub_server import StubServer
+
+
+async def per_request_sessions(base_url: str, requests_count: int) -> list:
+    timings = []
+    data = {"model": "stub", "messages": [{"role": "user", "content": "ping"}], "stream": False}
+    for _ in range(requests_count):
+        start = time.perf_counter()
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base_url}/chat/completions", json=data, timeout=30) as response:
+                await response.json()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def pooled_session(base_url: str, requests_count: int) -> list:
+    timings = []
+    async with IoNetService("stub-key", model="stub", base_url=base_url) as service:
+        for _ in range(requests_count):
+            start = time.perf_counter()
+            await service.generate_response("ping")
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: list) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{name:<22} mean {statistics.mean(timings) * 1000:7.2f} ms   p50 {statistics.median(timings) * 1000:7.2f} ms   p95 {p95 * 1000:7.2f} ms")
+
+
+async def main(requests_count: int, latency: float) -> None:
+    async with StubServer(latency=latency) as server:
+        await pooled_session(server.base_url, 5)
+        baseline = await per_request_sessions(server.base_url, requests_count)
+        pooled = await pooled_session(server.base_url, requests_count)
+    
+    report("session per request", baseline)
+    report("pooled session", pooled)
+    saved = statistics.mean(baseline) - statistics.mean(pooled)
+    print(f"per-request saving     {saved * 1000:7.2f} ms ({saved / statistics.mean(baseline) * 100:.1f}%)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-request aiohttp sessions with the pooled IoNetService session")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="artificial server latency in seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.latency))
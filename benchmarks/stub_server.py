@@ -0,0 +1,244 @@
+import re
+import json
+import math
+import random
+import asyncio
+from typing import Dict, Optional
+from aiohttp import web
+
+
+PROMPT_TYPES = [
+    ("section_titles", re.compile(r"заголовков секций|section titles")),
+    ("slide_titles", re.compile(r"заголовков слайдов|slide titles")),
+    ("section_content", re.compile(r"слайдов для секции|slides for section")),
+    ("slide_content", re.compile(r"контент для слайда|content for a presentation slide")),
+    ("presentation_summary", re.compile(r"краткое описание презентации|brief description of the presentation")),
+    ("title_slide_header", re.compile(r"для титульного слайда презентации|for the presentation title slide")),
+    ("conclusion_slide", re.compile(r"заключительный слайд|conclusion slide")),
+    ("web_enhanced_content", re.compile(r"Объедини базовый контент|Combine base slide content")),
+    ("generate_filename", re.compile(r"имя файла|short filename")),
+    ("web_summary", re.compile(r"резюме для слайда|summary for a presentation slide"))
+]
+
+TOPICS = [
+    "Historical background", "Core principles", "Key technologies", "Market landscape",
+    "Practical applications", "Common challenges", "Economic impact", "Regulatory framework",
+    "Case studies", "Emerging trends", "Risks and limitations", "Best practices",
+    "Future outlook", "Research directions", "Social implications", "Implementation roadmap"
+]
+
+SENTENCES = [
+    "Adoption has grown steadily over the last decade as costs fell and tooling matured.",
+    "Early pilots showed measurable gains in throughput, quality and customer satisfaction.",
+    "Teams that invest in training see faster returns than those relying on tools alone.",
+    "Independent studies estimate annual savings between twelve and eighteen percent.",
+    "Interoperability standards remain the main obstacle for large scale deployments.",
+    "Regional differences in regulation shape how quickly new approaches are accepted."
+]
+
+
+class StubServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        reply: Optional[dict] = None,
+        latency_distribution: str = "fixed",
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        token_interval: float = 0.0,
+        malformed_rate: float = 0.0,
+        replies: Optional[Dict[str, dict]] = None,
+        seed: Optional[int] = None
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.reply = reply
+        self.latency_distribution = latency_distribution
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.token_interval = token_interval
+        self.malformed_rate = malformed_rate
+        self.replies = replies or {}
+        self.random = random.Random(seed)
+        self.request_count = 0
+        self.requests_by_type: Dict[str, int] = {}
+        self.errors_injected = 0
+        self.rate_limited = 0
+        self.malformed = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._runner: Optional[web.AppRunner] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/api/v1"
+    
+    def sample_latency(self) -> float:
+        if self.latency <= 0:
+            return 0.0
+        if self.latency_distribution == "uniform":
+            return self.random.uniform(0, 2 * self.latency)
+        if self.latency_distribution == "exponential":
+            return self.random.expovariate(1 / self.latency)
+        if self.latency_distribution == "lognormal":
+            mu = math.log(self.latency) - self.latency_sigma ** 2 / 2
+            return self.random.lognormvariate(mu, self.latency_sigma)
+        return self.latency
+    
+    def classify(self, prompt: str) -> str:
+        first_line = next((line for line in prompt.splitlines() if line.strip()), "")
+        for prompt_type, pattern in PROMPT_TYPES:
+            if pattern.search(first_line):
+                return prompt_type
+        return "unknown"
+    
+    def _count(self, prompt: str, default: int = 3) -> int:
+        match = re.search(r"(?:Создай|Create) (\d+)", prompt)
+        return int(match.group(1)) if match else default
+    
+    def _titles(self, count: int) -> list:
+        topics = self.random.sample(TOPICS, min(count, len(TOPICS)))
+        return topics + [f"{self.random.choice(TOPICS)} revisited {chr(65 + i)}" for i in range(count - len(topics))]
+    
+    def _content(self) -> str:
+        if self.random.random() < 0.2:
+            return "TABLE|Approach|Strength|Typical use\nCentralized rollout|Consistent quality and control|Large enterprises\nIncremental pilots|Low risk and fast feedback|Growing teams"
+        sentences = self.random.sample(SENTENCES, 4)
+        if self.random.random() < 0.5:
+            return f"{sentences[0]} Key points:\n\n" + "\n".join(f"• {sentence}" for sentence in sentences[1:])
+        return f"{sentences[0]} {sentences[1]}\n\n{sentences[2]} {sentences[3]}"
+    
+    def build_reply(self, prompt_type: str, prompt: str):
+        if self.reply is not None:
+            return self.reply
+        if prompt_type in self.replies:
+            return self.replies[prompt_type]
+        
+        if prompt_type in ("section_titles", "slide_titles"):
+            return {"titles": self._titles(self._count(prompt))}
+        if prompt_type == "section_content":
+            return {"slides": [{"title": title, "content": self._content()} for title in self._titles(self._count(prompt))]}
+        if prompt_type in ("slide_content", "web_enhanced_content"):
+            return {"content": self._content()}
+        if prompt_type == "presentation_summary":
+            return {"summary": " ".join(self.random.sample(SENTENCES, 2))}
+        if prompt_type == "title_slide_header":
+            return {"title": "A practical overview", "description": self.random.choice(SENTENCES)}
+        if prompt_type == "conclusion_slide":
+            return {"title": "Key takeaways", "content": "\n".join(f"• {sentence}" for sentence in self.random.sample(SENTENCES, 3))}
+        if prompt_type == "generate_filename":
+            return {"filename": "Stub_Presentation"}
+        if prompt_type == "web_summary":
+            return " ".join(self.random.sample(SENTENCES, 3))
+        return {"content": "Stub content"}
+    
+    def malform(self, content: str) -> str:
+        return f"Here is the result:\n```json\n{content[:-1]},}}\n```"
+    
+    async def _handle_chat_completions(self, request: web.Request) -> web.StreamResponse:
+        self.request_count += 1
+        data = await request.json()
+        prompt = "\n".join(str(message.get("content", "")) for message in data.get("messages", []))
+        prompt_type = self.classify(prompt)
+        self.requests_by_type[prompt_type] = self.requests_by_type.get(prompt_type, 0) + 1
+        
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            latency = self.sample_latency()
+            if latency:
+                await asyncio.sleep(latency)
+            
+            roll = self.random.random()
+            if roll < self.rate_limit_rate:
+                self.rate_limited += 1
+                return web.json_response(
+                    {"error": "rate limit exceeded"},
+                    status=429,
+                    headers={"Retry-After": str(self.retry_after)}
+                )
+            if roll < self.rate_limit_rate + self.error_rate:
+                self.errors_injected += 1
+                return web.json_response({"error": "injected failure"}, status=500)
+            
+            reply = self.build_reply(prompt_type, prompt)
+            content = reply if isinstance(reply, str) else json.dumps(reply, ensure_ascii=False)
+            if not isinstance(reply, str) and self.random.random() < self.malformed_rate:
+                self.malformed += 1
+                content = self.malform(content)
+            usage = {
+                "prompt_tokens": len(prompt) // 4,
+                "completion_tokens": len(content) // 4,
+                "total_tokens": (len(prompt) + len(content)) // 4
+            }
+            
+            if data.get("stream"):
+                return await self._stream(request, content, usage)
+            return web.json_response({
+                "choices": [{"message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage
+            })
+        finally:
+            self._in_flight -= 1
+    
+    async def _stream(self, request: web.Request, content: str, usage: dict) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        try:
+            for start in range(0, len(content), 4):
+                chunk = {"choices": [{"delta": {"content": content[start:start + 4]}}]}
+                await response.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                if self.token_interval:
+                    await asyncio.sleep(self.token_interval)
+            await response.write(f"data: {json.dumps({'choices': [{'delta': {}, 'finish_reason': 'stop'}], 'usage': usage})}\n\n".encode("utf-8"))
+            await response.write(b"data: [DONE]\n\n")
+            await response.write_eof()
+        except ConnectionResetError:
+            pass
+        return response
+    
+    def get_stats(self) -> dict:
+        return {
+            'requests': self.request_count,
+            'requests_by_type': dict(self.requests_by_type),
+            'errors_injected': self.errors_injected,
+            'rate_limited': self.rate_limited,
+            'malformed': self.malformed,
+            'max_in_flight': self.max_in_flight
+        }
+    
+    def reset_stats(self) -> None:
+        self.request_count = 0
+        self.requests_by_type = {}
+        self.errors_injected = 0
+        self.rate_limited = 0
+        self.malformed = 0
+        self.max_in_flight = 0
+    
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/api/v1/chat/completions", self._handle_chat_completions)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+    
+    async def close(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def __aenter__(self) -> "StubServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
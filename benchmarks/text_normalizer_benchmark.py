@@ -0,0 +1,157 @@
+import re
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from presentation_generator.utils.text_normalizer import TextNormalizer
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus" / "slide_content.json"
+
+
+def legacy_clean_markdown(content: str) -> str:
+    content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)
+    content = re.sub(r'\*(.*?)\*', r'\1', content)
+    content = re.sub(r'__(.*?)__', r'\1', content)
+    content = re.sub(r'_(.*?)_', r'\1', content)
+    content = re.sub(r'~~(.*?)~~', r'\1', content)
+    content = re.sub(r'`(.*?)`', r'\1', content)
+    content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
+    content = re.sub(r'```.*', '', content, flags=re.DOTALL)
+    content = re.sub(r'#{1,6}\s*', '', content)
+    content = re.sub(r'^\s*[-*+]\s*', '', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*\d+\.\s*', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)
+    content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)
+    content = re.sub(r'^---+$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*>\s*', '', content, flags=re.MULTILINE)
+    content = re.sub(r'^\s*\|.*\|.*$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
+    return content.strip()
+
+
+def legacy_add_line_breaks(content: str) -> str:
+    lines = []
+    if ':' in content and any(word in content.lower() for word in ['основные', 'ключевые', 'главные', 'важные', 'преимущества', 'недостатки', 'этапы', 'шаги', 'причины', 'результаты', 'направления', 'включают', 'будет', 'рост', 'повышение', 'новые', 'этапы роста', 'олицетворяли', 'символизировал', 'подчеркивает', 'выражает', 'оборачивался']):
+        parts = content.split(':', 1)
+        lines.append(parts[0].strip() + ':')
+        items_text = parts[1].strip()
+        if '•' in items_text:
+            items = [item.strip() for item in items_text.split('•') if item.strip()]
+        else:
+            items = [item.strip() for item in items_text.replace('.', '').split(',') if item.strip()]
+        lines.extend('• ' + item for item in items)
+    else:
+        for sentence in re.split(r'[.!?]\s+', content):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if not sentence.endswith(('.', '!', '?')):
+                sentence += '.'
+            if '•' in sentence:
+                parts = sentence.split('•')
+                lines.append(parts[0].strip())
+                lines.extend('• ' + part.strip() for part in parts[1:] if part.strip())
+            elif any(word in sentence.lower() for word in ['позволяющее', 'зависит', 'такие как', 'в то время как', 'отличаются', 'потерей', 'беспомощность', 'утрату', 'каждый', 'уравнение', 'технологический', 'разрушение', 'сломанный']) and ',' in sentence:
+                parts = sentence.split(',', 1)
+                lines.append(parts[0].strip())
+                lines.extend('• ' + item.strip() for item in parts[1].replace('.', '').split(',') if item.strip())
+            else:
+                lines.append(sentence)
+    
+    result_lines = []
+    for line in lines:
+        if len(line) <= 45:
+            result_lines.append(line)
+            continue
+        words = line.split()
+        current_line = ""
+        for i, word in enumerate(words):
+            if len(current_line + " " + word) <= 45:
+                current_line = current_line + " " + word if current_line else word
+            elif current_line:
+                last_word = current_line.split()[-1] if current_line.split() else ""
+                if len(last_word) < 3 and i < len(words) - 1 and len(current_line + " " + word) <= 50:
+                    current_line += " " + word
+                else:
+                    result_lines.append(current_line)
+                    current_line = word
+            else:
+                current_line = word
+        if current_line:
+            result_lines.append(current_line)
+    
+    result = '\n'.join(result_lines)
+    if len(result) < len(content) * 0.7:
+        return content
+    return result
+
+
+def legacy_normalize(content: str) -> str:
+    if not content or len(content.strip()) < 10 or content.strip().startswith('TABLE|'):
+        return content
+    return legacy_add_line_breaks(legacy_clean_markdown(content))
+
+
+def load_corpus(path: Path) -> list:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".jsonl":
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        records = json.loads(text)
+    return [record if isinstance(record, str) else record.get("content", "") for record in records]
+
+
+def measure(function, corpus: list, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for sample in corpus:
+            function(sample)
+    return (time.perf_counter() - started) / (rounds * len(corpus))
+
+
+def main(args) -> int:
+    corpus = load_corpus(Path(args.corpus))
+    normalizer = TextNormalizer()
+    
+    legacy_outputs = [legacy_normalize(sample) for sample in corpus]
+    new_outputs = [normalizer.normalize(sample) for sample in corpus]
+    differing = [index for index, (old, new) in enumerate(zip(legacy_outputs, new_outputs)) if old != new]
+    
+    legacy_seconds = measure(legacy_normalize, corpus, args.rounds)
+    new_seconds = measure(normalizer.normalize, corpus, args.rounds)
+    report = {
+        'samples': len(corpus),
+        'rounds': args.rounds,
+        'legacy_us_per_call': round(legacy_seconds * 1000000, 2),
+        'normalizer_us_per_call': round(new_seconds * 1000000, 2),
+        'speedup': round(legacy_seconds / new_seconds, 2) if new_seconds else None,
+        'identical': len(corpus) - len(differing),
+        'differing': differing
+    }
+    
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    
+    print(f"corpus: {args.corpus} ({report['samples']} samples x {report['rounds']} rounds)")
+    print(f"legacy:     {report['legacy_us_per_call']:>10.2f} us/call")
+    print(f"normalizer: {report['normalizer_us_per_call']:>10.2f} us/call")
+    print(f"speedup:    {report['speedup']:>10.2f}x")
+    print(f"identical output: {report['identical']}/{report['samples']}")
+    if args.show_diff:
+        for index in differing:
+            print(f"\n--- sample {index} (legacy)\n{legacy_outputs[index]}\n+++ sample {index} (normalizer)\n{new_outputs[index]}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the legacy regex cascade with TextNormalizer on a corpus of LLM slide content")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="JSON list of strings or JSONL with a 'content' field")
+    parser.add_argument("--rounds", type=int, default=2000, help="passes over the corpus per implementation")
+    parser.add_argument("--show-diff", action="store_true", help="print both outputs for samples that differ")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    sys.exit(main(parser.parse_args()))
@@ -42,6 +42,9 @@ class ApiKeyManager:
             
         return self._request_new_key()
     
+    def get_saved_api_key(self) -> str:
+        return self._load_saved_key()
+    
     def _load_saved_key(self) -> str:
         try:
             if self.config_file.exists():
@@ -63,8 +66,16 @@ class ApiKeyManager:
         try:
             import asyncio
             from ..services.ionet_service import IoNetService
-            service = IoNetService(api_key)
-            result = asyncio.run(service.test_api_key())
+            
+            async def check_key() -> bool:
+                service = IoNetService(api_key)
+                await service.start()
+                try:
+                    return await service.test_api_key()
+                finally:
+                    await service.close()
+            
+            result = asyncio.run(check_key())
             return result
         except Exception as e:
             print(f"{self.loc.t('api_key_check_error')}: {e}")
@@ -3,12 +3,18 @@ import json
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from ..models.presentation import Presentation, Section, Slide
+from ..services.tracing import get_tracer
 
 class DatabaseManager:
-    def __init__(self):
-        self.config_dir = Path(__file__).parent.parent / "config"
-        self.config_dir.mkdir(exist_ok=True)
-        self.db_path = self.config_dir / "presentations.db"
+    def __init__(self, db_path: Optional[Path] = None):
+        if db_path is None:
+            self.config_dir = Path(__file__).parent.parent / "config"
+            self.config_dir.mkdir(exist_ok=True)
+            db_path = self.config_dir / "presentations.db"
+        else:
+            self.config_dir = Path(db_path).parent
+        self.db_path = Path(db_path)
+        self.tracer = get_tracer()
         self._init_database()
     
     def _init_database(self):
@@ -20,11 +26,32 @@ class DatabaseManager:
                     title TEXT NOT NULL,
                     summary TEXT,
                     language TEXT DEFAULT 'русский',
+                    title_slide_header TEXT,
+                    max_sections INTEGER,
+                    max_slides INTEGER,
+                    enable_web_search INTEGER DEFAULT 0,
+                    status TEXT DEFAULT 'completed',
+                    token_usage TEXT,
+                    filename TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             
+            cursor.execute('PRAGMA table_info(presentations)')
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            for column, definition in [
+                ('title_slide_header', 'TEXT'),
+                ('max_sections', 'INTEGER'),
+                ('max_slides', 'INTEGER'),
+                ('enable_web_search', 'INTEGER DEFAULT 0'),
+                ('status', "TEXT DEFAULT 'completed'"),
+                ('token_usage', 'TEXT'),
+                ('filename', 'TEXT')
+            ]:
+                if column not in existing_columns:
+                    cursor.execute(f'ALTER TABLE presentations ADD COLUMN {column} {definition}')
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS sections (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -49,13 +76,13 @@ class DatabaseManager:
             conn.commit()
     
     def save_presentation(self, presentation: Presentation) -> int:
-        with sqlite3.connect(self.db_path) as conn:
+        with self.tracer.span("db.save_presentation", "db"), sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
-                INSERT INTO presentations (title, summary, language)
-                VALUES (?, ?, ?)
-            ''', (presentation.title, presentation.summary, presentation.language))
+                INSERT INTO presentations (title, summary, language, token_usage, filename)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (presentation.title, presentation.summary, presentation.language, json.dumps(presentation.token_usage), presentation.filename))
             
             presentation_id = cursor.lastrowid
             
@@ -81,14 +108,15 @@ class DatabaseManager:
             cursor = conn.cursor()
             
             cursor.execute('''
-                SELECT title, summary, language FROM presentations WHERE id = ?
+                SELECT title, summary, language, title_slide_header, max_sections, max_slides, token_usage, filename
+                FROM presentations WHERE id = ?
             ''', (presentation_id,))
             
             presentation_row = cursor.fetchone()
             if not presentation_row:
                 return None
             
-            title, summary, language = presentation_row
+            title, summary, language, title_slide_header, max_sections, max_slides, token_usage, filename = presentation_row
             
             cursor.execute('''
                 SELECT id, title, order_index FROM sections 
@@ -113,21 +141,163 @@ class DatabaseManager:
                 sections.append(Section(title=section_title, slides=slides))
             
             return Presentation(
+                id=presentation_id,
                 title=title,
                 summary=summary,
+                title_slide_header=title_slide_header,
                 language=language,
-                sections=sections
+                sections=sections,
+                max_sections=max_sections or len(sections),
+                max_slides=max_slides or max((len(section.slides) for section in sections), default=0),
+                token_usage=json.loads(token_usage) if token_usage else {},
+                filename=filename
             )
     
-    def update_presentation(self, presentation_id: int, presentation: Presentation):
+    def create_checkpoint(self, presentation: Presentation, enable_web_search: bool) -> int:
+        with self.tracer.span("db.create_checkpoint", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO presentations (title, summary, language, title_slide_header, max_sections, max_slides, enable_web_search, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'in_progress')
+            ''', (
+                presentation.title,
+                presentation.summary,
+                presentation.language,
+                presentation.title_slide_header,
+                presentation.max_sections,
+                presentation.max_slides,
+                int(enable_web_search)
+            ))
+            
+            conn.commit()
+            return cursor.lastrowid
+    
+    def checkpoint_summary(self, presentation_id: int, summary: Optional[str], title_slide_header: Optional[str]):
+        with self.tracer.span("db.checkpoint_summary", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE presentations
+                SET summary = ?, title_slide_header = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (summary, title_slide_header, presentation_id))
+            conn.commit()
+    
+    def checkpoint_sections(self, presentation_id: int, section_titles: List[str]):
+        with self.tracer.span("db.checkpoint_sections", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany('''
+                INSERT INTO sections (presentation_id, title, order_index)
+                VALUES (?, ?, ?)
+            ''', [(presentation_id, section_title, section_index) for section_index, section_title in enumerate(section_titles)])
+            cursor.execute('UPDATE presentations SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (presentation_id,))
+            conn.commit()
+    
+    def checkpoint_slide_titles(self, presentation_id: int, section_index: int, slide_titles: List[str]):
+        with self.tracer.span("db.checkpoint_slide_titles", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id FROM sections WHERE presentation_id = ? AND order_index = ?
+            ''', (presentation_id, section_index))
+            
+            section_row = cursor.fetchone()
+            if not section_row:
+                return
+            
+            cursor.executemany('''
+                INSERT INTO slides (section_id, title, content, order_index)
+                VALUES (?, ?, NULL, ?)
+            ''', [(section_row[0], slide_title, slide_index) for slide_index, slide_title in enumerate(slide_titles)])
+            cursor.execute('UPDATE presentations SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (presentation_id,))
+            conn.commit()
+    
+    def checkpoint_slide(self, presentation_id: int, section_index: int, slide_index: int, content: str):
+        with self.tracer.span("db.checkpoint_slide", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE slides SET content = ?
+                WHERE order_index = ? AND section_id = (
+                    SELECT id FROM sections WHERE presentation_id = ? AND order_index = ?
+                )
+            ''', (content, slide_index, presentation_id, section_index))
+            cursor.execute('UPDATE presentations SET updated_at = CURRENT_TIMESTAMP WHERE id = ?', (presentation_id,))
+            conn.commit()
+    
+    def checkpoint_token_usage(self, presentation_id: int, token_usage: Dict[str, dict]):
+        with self.tracer.span("db.checkpoint_token_usage", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE presentations SET token_usage = ? WHERE id = ?
+            ''', (json.dumps(token_usage), presentation_id))
+            conn.commit()
+    
+    def checkpoint_filename(self, presentation_id: int, filename: Optional[str]):
+        with self.tracer.span("db.checkpoint_filename", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE presentations SET filename = ? WHERE id = ?
+            ''', (filename, presentation_id))
+            conn.commit()
+    
+    def complete_checkpoint(self, presentation_id: int, token_usage: Optional[Dict[str, dict]] = None):
+        with self.tracer.span("db.complete_checkpoint", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                UPDATE presentations SET status = 'completed', token_usage = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?
+            ''', (json.dumps(token_usage or {}), presentation_id))
+            conn.commit()
+    
+    def get_checkpoint(self, presentation_id: int) -> Optional[Dict[str, Any]]:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT status, enable_web_search FROM presentations WHERE id = ?', (presentation_id,))
+            checkpoint_row = cursor.fetchone()
+        
+        if not checkpoint_row:
+            return None
+        
+        return {
+            'presentation': self.get_presentation(presentation_id),
+            'status': checkpoint_row[0],
+            'enable_web_search': bool(checkpoint_row[1])
+        }
+    
+    def list_in_progress(self) -> List[Dict[str, Any]]:
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
+            cursor.execute('''
+                SELECT p.id, p.title, p.language, p.max_sections, p.max_slides, p.updated_at,
+                       (SELECT COUNT(*) FROM slides s JOIN sections sec ON s.section_id = sec.id
+                        WHERE sec.presentation_id = p.id AND s.content IS NOT NULL)
+                FROM presentations p
+                WHERE p.status = 'in_progress'
+                ORDER BY p.updated_at DESC
+            ''')
+            
+            presentations = []
+            for row in cursor.fetchall():
+                presentations.append({
+                    'id': row[0],
+                    'title': row[1],
+                    'language': row[2],
+                    'total_slides': (row[3] or 0) * (row[4] or 0),
+                    'completed_slides': row[6],
+                    'updated_at': row[5]
+                })
+            
+            return presentations
+    
+    def update_presentation(self, presentation_id: int, presentation: Presentation):
+        with self.tracer.span("db.update_presentation", "db"), sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 UPDATE presentations 
-                SET title = ?, summary = ?, language = ?, updated_at = CURRENT_TIMESTAMP
+                SET title = ?, summary = ?, language = ?, token_usage = ?, filename = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (presentation.title, presentation.summary, presentation.language, presentation_id))
+            ''', (presentation.title, presentation.summary, presentation.language, json.dumps(presentation.token_usage), presentation.filename, presentation_id))
             
             cursor.execute('DELETE FROM sections WHERE presentation_id = ?', (presentation_id,))
             
@@ -170,7 +340,7 @@ class DatabaseManager:
             return presentations
     
     def delete_presentation(self, presentation_id: int) -> bool:
-        with sqlite3.connect(self.db_path) as conn:
+        with self.tracer.span("db.delete_presentation", "db"), sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             
             cursor.execute('SELECT id FROM presentations WHERE id = ?', (presentation_id,))
@@ -181,8 +351,11 @@ class DatabaseManager:
             conn.commit()
             return True
     
-    def clear_all(self):
-        with sqlite3.connect(self.db_path) as conn:
+    def clear_all(self, keep_in_progress: bool = False):
+        with self.tracer.span("db.clear_all", "db"), sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute('DELETE FROM presentations')
+            if keep_in_progress:
+                cursor.execute("DELETE FROM presentations WHERE status IS NULL OR status != 'in_progress'")
+            else:
+                cursor.execute('DELETE FROM presentations')
             conn.commit()
\ No newline at end of file
@@ -34,8 +34,44 @@ class SettingsManager:
             "search_engine": "DuckDuckGo",
             "search_results_count": 5,
             "search_region": "ru-ru",
+            "search_deadline_seconds": 8,
+            "max_concurrent_searches": 3,
+            "search_cache_enabled": True,
+            "search_cache_results_ttl_hours": 6,
+            "search_cache_pages_ttl_hours": 24,
+            "search_cache_max_mb": 50,
             "auto_open_presentation": True,
-            "developer_mode": False
+            "developer_mode": False,
+            "tracing_enabled": False,
+            "tracing_format": "chrome",
+            "token_price_prompt_per_million": 0.0,
+            "token_price_completion_per_million": 0.0,
+            "deck_deadline_seconds": 0,
+            "deck_token_budget": 0,
+            "pptx_template_path": "",
+            "concurrent_generation": True,
+            "max_concurrent_requests": 4,
+            "stream_responses": True,
+            "section_batch_generation": False,
+            "batch_max_concurrent_decks": 4,
+            "export_workers": 0,
+            "export_decks_per_worker": 25,
+            "export_memory_limit_mb": 1024,
+            "keep_completed_presentations": True,
+            "api_requests_per_minute": 120,
+            "api_tokens_per_minute": 0,
+            "api_max_concurrency": 16,
+            "hedge_requests": True,
+            "hedge_percentile": 95,
+            "hedge_budget_percent": 10,
+            "api_max_attempts": 3,
+            "api_attempt_timeout": 60,
+            "api_deadline": 180,
+            "circuit_failure_threshold": 5,
+            "circuit_reset_seconds": 30,
+            "response_cache_enabled": False,
+            "response_cache_ttl_hours": 24,
+            "response_cache_max_mb": 50
         }
         
         for key, value in defaults.items():
@@ -0,0 +1,174 @@
+import os
+import sys
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, Optional, Tuple
+from ..models.presentation import Presentation
+from ..localization.manager import get_localization_manager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+_worker_generator = None
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _init_worker(output_dir: str, template_path: Optional[str], memory_limit_mb: int) -> None:
+    global _worker_generator
+    if resource is not None and memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard == resource.RLIM_INFINITY or limit < hard:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    
+    from .pptx_generator import PPTXGenerator
+    _worker_generator = PPTXGenerator(output_dir, template_path=template_path)
+
+
+def _render_in_worker(presentation: Presentation, filename: str) -> dict:
+    start_time = time.perf_counter()
+    file_path = _worker_generator.generate_pptx(presentation, filename)
+    return {
+        'file': file_path,
+        'render_seconds': round(time.perf_counter() - start_time, 3),
+        'worker': os.getpid(),
+        'peak_rss_mb': _peak_rss_mb()
+    }
+
+
+class BatchRenderer:
+    def __init__(
+        self,
+        output_dir: str = "output",
+        template_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        decks_per_worker: int = 25,
+        memory_limit_mb: int = 1024,
+        max_attempts: int = 3
+    ):
+        self.output_dir = str(output_dir)
+        self.template_path = template_path
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.decks_per_worker = max(0, int(decks_per_worker or 0))
+        self.memory_limit_mb = max(0, int(memory_limit_mb or 0))
+        self.max_attempts = max(1, max_attempts)
+        self.loc = get_localization_manager()
+        self.stats = {
+            'rendered': 0,
+            'failed': 0,
+            'pool_restarts': 0,
+            'peak_rss_mb': 0.0
+        }
+    
+    def _create_executor(self) -> ProcessPoolExecutor:
+        options = {
+            'max_workers': self.max_workers,
+            'mp_context': multiprocessing.get_context("spawn"),
+            'initializer': _init_worker,
+            'initargs': (self.output_dir, self.template_path, self.memory_limit_mb)
+        }
+        if self.decks_per_worker and sys.version_info >= (3, 11):
+            options['max_tasks_per_child'] = self.decks_per_worker
+        return ProcessPoolExecutor(**options)
+    
+    def _generation_size(self) -> Optional[int]:
+        if not self.decks_per_worker or sys.version_info >= (3, 11):
+            return None
+        return self.decks_per_worker * self.max_workers
+    
+    def render(self, jobs: Iterable[Tuple[object, Optional[Presentation], str]]) -> Iterator[dict]:
+        pending = iter(jobs)
+        retry = deque()
+        in_flight = {}
+        attempts = {}
+        generation_size = self._generation_size()
+        submitted = 0
+        exhausted = False
+        executor = self._create_executor()
+        
+        try:
+            while True:
+                while len(in_flight) < self.max_workers * 2 and (generation_size is None or submitted < generation_size):
+                    if retry:
+                        job = retry.popleft()
+                    else:
+                        job = next(pending, None)
+                        if job is None:
+                            exhausted = True
+                            break
+                    
+                    if job[1] is None:
+                        yield self._result(job, error=self.loc.t('export_not_found'))
+                        continue
+                    in_flight[executor.submit(_render_in_worker, job[1], job[2])] = job
+                    submitted += 1
+                
+                if not in_flight:
+                    if exhausted and not retry:
+                        break
+                    executor.shutdown(wait=True)
+                    executor = self._create_executor()
+                    submitted = 0
+                    continue
+                
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                crashed = []
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        yield self._result(job, rendered=future.result())
+                    except BrokenProcessPool:
+                        crashed.append(job)
+                    except Exception as e:
+                        yield self._result(job, error=f"{type(e).__name__}: {e}")
+                
+                if crashed:
+                    crashed.extend(in_flight.values())
+                    in_flight.clear()
+                    for job in crashed:
+                        attempts[id(job)] = attempts.get(id(job), 0) + 1
+                        if attempts[id(job)] >= self.max_attempts:
+                            yield self._result(job, error=self.loc.t('export_worker_crashed'))
+                        else:
+                            retry.append(job)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = self._create_executor()
+                    submitted = 0
+                    self.stats['pool_restarts'] += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _result(self, job: tuple, rendered: Optional[dict] = None, error: Optional[str] = None) -> dict:
+        key, presentation, filename = job
+        result = {
+            'key': key,
+            'title': presentation.title if presentation else None,
+            'status': 'ok' if rendered else 'failed',
+            'file': None,
+            'render_seconds': 0.0,
+            'worker': None,
+            'peak_rss_mb': None,
+            'error': error
+        }
+        if rendered:
+            result.update(rendered)
+            self.stats['rendered'] += 1
+            if rendered['peak_rss_mb']:
+                self.stats['peak_rss_mb'] = max(self.stats['peak_rss_mb'], rendered['peak_rss_mb'])
+        else:
+            self.stats['failed'] += 1
+        return result
+    
+    def get_stats(self) -> dict:
+        return dict(self.stats)
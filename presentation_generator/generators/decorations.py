@@ -15,6 +15,98 @@ def get_resource_path(relative_path):
         return Path(__file__).parent.parent.parent / relative_path
 
 
+class SlideOccupancy:
+    def __init__(self, text_areas, cell_size=0.1, text_buffer=0.4, slide_width=10, slide_height=7.5):
+        self.text_areas = text_areas
+        self.cell_size = cell_size
+        self.columns = round(slide_width / cell_size)
+        self.rows = round(slide_height / cell_size)
+        self.full_row = (1 << self.columns) - 1
+        self.text_cells = [0] * self.rows
+        self.decoration_cells = [0] * self.rows
+        self.safe_zones = {}
+        
+        for area in text_areas:
+            self._mark(
+                self.text_cells,
+                area['left'] - text_buffer,
+                area['top'] - text_buffer,
+                area['right'] + text_buffer,
+                area['bottom'] + text_buffer
+            )
+    
+    def _cell_floor(self, value):
+        return math.floor(value / self.cell_size + 1e-9)
+    
+    def _cell_ceil(self, value):
+        return math.ceil(value / self.cell_size - 1e-9)
+    
+    def _mark(self, cells, left, top, right, bottom):
+        first_column = max(0, self._cell_floor(left))
+        last_column = min(self.columns, self._cell_ceil(right))
+        first_row = max(0, self._cell_floor(top))
+        last_row = min(self.rows, self._cell_ceil(bottom))
+        if first_column >= last_column or first_row >= last_row:
+            return
+        
+        mask = ((1 << (last_column - first_column)) - 1) << first_column
+        for row in range(first_row, last_row):
+            cells[row] |= mask
+    
+    def add(self, x, y, width, height):
+        self._mark(self.decoration_cells, x, y, x + width, y + height)
+    
+    def find_position(self, width, height, zone, avoid_decorations=True):
+        width_cells = max(1, self._cell_ceil(width))
+        height_cells = max(1, self._cell_ceil(height))
+        first_column = max(0, self._cell_ceil(zone['x_min']))
+        last_column = min(self.columns - width_cells, self._cell_floor(zone['x_max'] - width))
+        first_row = max(0, self._cell_ceil(zone['y_min']))
+        last_row = min(self.rows - height_cells, self._cell_floor(zone['y_max'] - height))
+        if first_column > last_column or first_row > last_row:
+            return None
+        
+        starts = []
+        column_mask = ((1 << (last_column - first_column + 1)) - 1) << first_column
+        for row in range(first_row, last_row + height_cells):
+            occupied = self.text_cells[row] | (self.decoration_cells[row] if avoid_decorations else 0)
+            free = ~occupied & self.full_row
+            span = 1
+            while span < width_cells and free:
+                shift = min(span, width_cells - span)
+                free &= free >> shift
+                span += shift
+            starts.append(free)
+        
+        candidates = []
+        total = 0
+        for offset in range(last_row - first_row + 1):
+            mask = column_mask
+            for free in starts[offset:offset + height_cells]:
+                mask &= free
+                if not mask:
+                    break
+            if mask:
+                count = bin(mask).count("1")
+                candidates.append((first_row + offset, mask, count))
+                total += count
+        
+        if not total:
+            return None
+        
+        choice = random.randrange(total)
+        for row, mask, count in candidates:
+            if choice >= count:
+                choice -= count
+                continue
+            while True:
+                column = (mask & -mask).bit_length() - 1
+                if not choice:
+                    return column * self.cell_size, row * self.cell_size
+                mask &= mask - 1
+                choice -= 1
+
+
 class SlideDecorator:
     def __init__(self):
         from ..localization.manager import get_localization_manager
@@ -191,23 +283,22 @@ class SlideDecorator:
         self.current_scheme = None
         self.slide_counter = 0
     
-    def _get_safe_position(self, slide, min_width, max_width, min_height, max_height, decoration_type="normal"):
-        text_areas = self._get_text_areas(slide)
-        max_attempts = 100
-        
-        safe_zones = self._get_safe_zones(text_areas, decoration_type)
+    def _get_safe_position(self, occupancy, min_width, max_width, min_height, max_height, decoration_type="normal"):
+        safe_zones = self._get_cached_safe_zones(occupancy, decoration_type)
+        sizes = [
+            (random.uniform(min_width, max_width), random.uniform(min_height, max_height)),
+            (min_width, min_height)
+        ]
+        zones = random.sample(safe_zones, len(safe_zones))
         
-        for attempt in range(max_attempts):
-            width = Inches(random.uniform(min_width, max_width))
-            height = Inches(random.uniform(min_height, max_height))
-            
-            zone = random.choice(safe_zones)
-            x = Inches(random.uniform(zone['x_min'], zone['x_max'] - width.inches))
-            y = Inches(random.uniform(zone['y_min'], zone['y_max'] - height.inches))
-            
-            if x.inches >= 0 and y.inches >= 0 and (x.inches + width.inches) <= 10 and (y.inches + height.inches) <= 7.5:
-                if not self._overlaps_with_text(x, y, width, height, text_areas):
-                    return x, y, width, height
+        for avoid_decorations in (True, False):
+            for width, height in sizes:
+                for zone in zones:
+                    position = occupancy.find_position(width, height, zone, avoid_decorations)
+                    if position:
+                        x, y = position
+                        occupancy.add(x, y, width, height)
+                        return Inches(x), Inches(y), Inches(width), Inches(height)
         
         fallback_zone = safe_zones[0]
         fallback_width = Inches(random.uniform(min_width, max_width))
@@ -218,14 +309,21 @@ class SlideDecorator:
         text_areas = []
         for shape in slide.shapes:
             if hasattr(shape, 'text_frame') and shape.text_frame.text.strip():
+                left = shape.left.inches
+                top = shape.top.inches
                 text_areas.append({
-                    'left': shape.left.inches,
-                    'top': shape.top.inches,
-                    'right': shape.left.inches + shape.width.inches,
-                    'bottom': shape.top.inches + shape.height.inches
+                    'left': left,
+                    'top': top,
+                    'right': left + shape.width.inches,
+                    'bottom': top + shape.height.inches
                 })
         return text_areas
     
+    def _get_cached_safe_zones(self, occupancy, decoration_type):
+        if decoration_type not in occupancy.safe_zones:
+            occupancy.safe_zones[decoration_type] = self._get_safe_zones(occupancy.text_areas, decoration_type)
+        return occupancy.safe_zones[decoration_type]
+    
     def _get_safe_zones(self, text_areas, decoration_type):
         slide_width = 10
         slide_height = 7.5
@@ -259,21 +357,6 @@ class SlideDecorator:
         
         return safe_zones
     
-    def _overlaps_with_text(self, x, y, width, height, text_areas):
-        buffer = Inches(0.4)
-        decoration_left = x - buffer
-        decoration_right = x + width + buffer
-        decoration_top = y - buffer
-        decoration_bottom = y + height + buffer
-        
-        for area in text_areas:
-            if not (decoration_right < area['left'] or 
-                   decoration_left > area['right'] or 
-                   decoration_bottom < area['top'] or 
-                   decoration_top > area['bottom']):
-                return True
-        return False
-    
     def choose_color_scheme(self, presentation_title: str) -> dict:
         title_lower = presentation_title.lower()
         
@@ -325,21 +408,22 @@ class SlideDecorator:
         
         self.slide_counter += 1
         decoration_style = self._choose_decoration_style(slide_index, total_slides, slide_type)
+        occupancy = SlideOccupancy(self._get_text_areas(slide))
         
         if decoration_style == "geometric_modern":
-            self._add_geometric_modern(slide)
+            self._add_geometric_modern(slide, occupancy)
         elif decoration_style == "organic_flow":
-            self._add_organic_flow(slide)
+            self._add_organic_flow(slide, occupancy)
         elif decoration_style == "minimal_lines":
-            self._add_minimal_lines(slide)
+            self._add_minimal_lines(slide, occupancy)
         elif decoration_style == "dynamic_shapes":
-            self._add_dynamic_shapes(slide)
+            self._add_dynamic_shapes(slide, occupancy)
         elif decoration_style == "abstract_art":
-            self._add_abstract_art(slide)
+            self._add_abstract_art(slide, occupancy)
         elif decoration_style == "tech_grid":
             self._add_tech_grid(slide)
         elif decoration_style == "nature_inspired":
-            self._add_nature_inspired(slide)
+            self._add_nature_inspired(slide, occupancy)
     
     def _choose_decoration_style(self, slide_index: int, total_slides: int, slide_type: str) -> str:
         if slide_index == 0:
@@ -362,12 +446,12 @@ class SlideDecorator:
             
             return chosen_style
     
-    def _add_geometric_modern(self, slide):
+    def _add_geometric_modern(self, slide, occupancy):
         shapes_count = random.randint(2, 4)
         for i in range(shapes_count):
             shape_type = random.choice([MSO_SHAPE.RECTANGLE, MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.HEXAGON])
             
-            x, y, width, height = self._get_safe_position(slide, 0.6, 1.5, 0.6, 1.5, "small")
+            x, y, width, height = self._get_safe_position(occupancy, 0.6, 1.5, 0.6, 1.5, "small")
             
             shape = slide.shapes.add_shape(shape_type, x, y, width, height)
             
@@ -384,9 +468,9 @@ class SlideDecorator:
             
             shape.rotation = random.randint(-20, 20)
     
-    def _add_organic_flow(self, slide):
+    def _add_organic_flow(self, slide, occupancy):
         for i in range(random.randint(2, 3)):
-            x, y, width, height = self._get_safe_position(slide, 0.8, 2.0, 0.4, 1.5, "medium")
+            x, y, width, height = self._get_safe_position(occupancy, 0.8, 2.0, 0.4, 1.5, "medium")
             
             shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, x, y, width, height)
             
@@ -402,10 +486,10 @@ class SlideDecorator:
             shape.line.fill.background()
             shape.rotation = random.randint(-30, 30)
     
-    def _add_minimal_lines(self, slide):
+    def _add_minimal_lines(self, slide, occupancy):
         line_count = random.randint(3, 5)
+        safe_zones = self._get_cached_safe_zones(occupancy, "line")
         for i in range(line_count):
-            safe_zones = self._get_safe_zones(self._get_text_areas(slide), "line")
             if safe_zones:
                 zone = random.choice(safe_zones)
                 
@@ -429,11 +513,11 @@ class SlideDecorator:
                 line.line.color.rgb = self.current_scheme['primary']
                 line.line.width = Pt(random.randint(1, 3))
     
-    def _add_dynamic_shapes(self, slide):
+    def _add_dynamic_shapes(self, slide, occupancy):
         shapes = [MSO_SHAPE.DIAMOND, MSO_SHAPE.PENTAGON, MSO_SHAPE.HEXAGON, MSO_SHAPE.ROUNDED_RECTANGLE]
         
         for i in range(random.randint(2, 4)):
-            x, y, width, height = self._get_safe_position(slide, 0.5, 1.2, 0.5, 1.2, "small")
+            x, y, width, height = self._get_safe_position(occupancy, 0.5, 1.2, 0.5, 1.2, "small")
             
             shape = slide.shapes.add_shape(random.choice(shapes), x, y, width, height)
             
@@ -478,11 +562,11 @@ class SlideDecorator:
         line.color.rgb = self.current_scheme['secondary']
         line.width = Pt(2)
     
-    def _add_abstract_art(self, slide):
+    def _add_abstract_art(self, slide, occupancy):
         for i in range(random.randint(3, 5)):
             shape_type = random.choice([MSO_SHAPE.OVAL, MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.DIAMOND])
             
-            x, y, width, height = self._get_safe_position(slide, 0.4, 1.0, 0.4, 1.0, "small")
+            x, y, width, height = self._get_safe_position(occupancy, 0.4, 1.0, 0.4, 1.0, "small")
             
             shape = slide.shapes.add_shape(shape_type, x, y, width, height)
             
@@ -513,11 +597,11 @@ class SlideDecorator:
                     fill.fore_color.rgb = self.current_scheme['secondary']
                     dot.line.fill.background()
     
-    def _add_nature_inspired(self, slide):
+    def _add_nature_inspired(self, slide, occupancy):
         leaf_shapes = [MSO_SHAPE.OVAL, MSO_SHAPE.ROUNDED_RECTANGLE, MSO_SHAPE.TEAR]
         
         for i in range(random.randint(2, 4)):
-            x, y, width, height = self._get_safe_position(slide, 0.5, 1.0, 0.6, 1.5, "medium")
+            x, y, width, height = self._get_safe_position(occupancy, 0.5, 1.0, 0.6, 1.5, "medium")
             
             shape = slide.shapes.add_shape(random.choice(leaf_shapes), x, y, width, height)
             
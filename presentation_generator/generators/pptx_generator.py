@@ -3,7 +3,6 @@ import sys
 import re
 from pathlib import Path
 from typing import Optional, List
-from pptx import Presentation as PPTXPresentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
 from pptx.dml.color import RGBColor
@@ -12,6 +11,8 @@ from pptx.enum.dml import MSO_THEME_COLOR
 from ..models.presentation import Presentation
 from ..localization.manager import get_localization_manager
 from .decorations import SlideDecorator
+from .template_cache import TemplateDeck, get_template_cache
+from ..services.tracing import get_tracer
 
 
 def get_resource_path(relative_path):
@@ -22,16 +23,18 @@ def get_resource_path(relative_path):
 
 
 class PPTXGenerator:
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", template_path: Optional[str] = None):
         self.output_dir = Path(output_dir)
+        self.template_path = template_path
+        self.template_cache = get_template_cache()
         self.output_dir.mkdir(exist_ok=True)
         self.decorator = SlideDecorator()
         self.loc = get_localization_manager()
+        self.tracer = get_tracer()
         
-    def _create_title_slide(self, pptx: PPTXPresentation, presentation: Presentation, 
+    def _create_title_slide(self, deck: TemplateDeck, presentation: Presentation, 
                            slide_index: int = 0, total_slides: int = 1) -> None:
-        title_slide_layout = pptx.slide_layouts[0]
-        slide = pptx.slides.add_slide(title_slide_layout)
+        slide = deck.add_slide("title")
         
         self.decorator.add_slide_background(slide, "title")
         
@@ -52,10 +55,9 @@ class PPTXGenerator:
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "title", presentation.title)
         self.decorator.apply_advanced_text_formatting(title.text_frame, "title")
     
-    def _create_section_title_slide(self, pptx: PPTXPresentation, section_title: str, 
+    def _create_section_title_slide(self, deck: TemplateDeck, section_title: str, 
                                    slide_index: int, total_slides: int, presentation_title: str = "") -> None:
-        section_header_layout = pptx.slide_layouts[2]
-        slide = pptx.slides.add_slide(section_header_layout)
+        slide = deck.add_slide("section")
         
         title = slide.shapes.title
         title.text = section_title
@@ -64,7 +66,7 @@ class PPTXGenerator:
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "section", presentation_title)
         self.decorator.apply_advanced_text_formatting(title.text_frame, "section")
     
-    def _create_content_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_content_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                              slide_index: int, total_slides: int, presentation_title: str = "") -> None:
         if not self._validate_slide_content(slide_content):
             slide_content = f"{self.loc.t('slide_content_default')} '{slide_title}'"
@@ -72,8 +74,7 @@ class PPTXGenerator:
         if self._is_table_content(slide_content):
             table_data = self._parse_table_data(slide_content)
             if table_data and len(table_data) >= 2:
-                slide_layout = pptx.slide_layouts[5]
-                pptx_slide = pptx.slides.add_slide(slide_layout)
+                pptx_slide = deck.add_slide("title_only")
                 self._create_table_slide(pptx_slide, slide_title, table_data)
                 return
             else:
@@ -82,15 +83,15 @@ class PPTXGenerator:
         slide_type = self._determine_slide_type(slide_content)
         
         if slide_type == "list":
-            self._create_enhanced_list_slide(pptx, slide_title, slide_content, slide_index, total_slides, presentation_title)
+            self._create_enhanced_list_slide(deck, slide_title, slide_content, slide_index, total_slides, presentation_title)
         elif slide_type == "comparison":
-            self._create_comparison_slide(pptx, slide_title, slide_content, slide_index, total_slides, presentation_title)
+            self._create_comparison_slide(deck, slide_title, slide_content, slide_index, total_slides, presentation_title)
         elif slide_type == "highlight":
-            self._create_highlight_slide(pptx, slide_title, slide_content, slide_index, total_slides, presentation_title)
+            self._create_highlight_slide(deck, slide_title, slide_content, slide_index, total_slides, presentation_title)
         elif slide_type == "process":
-            self._create_process_slide(pptx, slide_title, slide_content, slide_index, total_slides, presentation_title)
+            self._create_process_slide(deck, slide_title, slide_content, slide_index, total_slides, presentation_title)
         else:
-            self._create_modern_content_slide(pptx, slide_title, slide_content, slide_index, total_slides, presentation_title)
+            self._create_modern_content_slide(deck, slide_title, slide_content, slide_index, total_slides, presentation_title)
     
     def _determine_slide_type(self, content: str) -> str:
         return "content"
@@ -120,10 +121,9 @@ class PPTXGenerator:
         
         return content_frame
     
-    def _create_enhanced_list_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_enhanced_list_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                                    slide_index: int, total_slides: int, presentation_title: str) -> None:
-        blank_layout = pptx.slide_layouts[6]
-        slide = pptx.slides.add_slide(blank_layout)
+        slide = deck.add_slide("blank")
         
         self.decorator.add_slide_background(slide, "content")
         content_frame = self._create_content_shape(slide)
@@ -134,10 +134,9 @@ class PPTXGenerator:
         
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "list", presentation_title)
     
-    def _create_comparison_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_comparison_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                                 slide_index: int, total_slides: int, presentation_title: str) -> None:
-        blank_layout = pptx.slide_layouts[6]
-        slide = pptx.slides.add_slide(blank_layout)
+        slide = deck.add_slide("blank")
         
         self.decorator.add_slide_background(slide, "content")
         content_frame = self._create_content_shape(slide)
@@ -148,10 +147,9 @@ class PPTXGenerator:
         
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "comparison", presentation_title)
     
-    def _create_highlight_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_highlight_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                                slide_index: int, total_slides: int, presentation_title: str) -> None:
-        blank_layout = pptx.slide_layouts[6]
-        slide = pptx.slides.add_slide(blank_layout)
+        slide = deck.add_slide("blank")
         
         content_frame = self._create_content_shape(slide)
         
@@ -161,10 +159,9 @@ class PPTXGenerator:
         
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "content", presentation_title)
     
-    def _create_process_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_process_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                              slide_index: int, total_slides: int, presentation_title: str) -> None:
-        blank_layout = pptx.slide_layouts[6]
-        slide = pptx.slides.add_slide(blank_layout)
+        slide = deck.add_slide("blank")
         
         self.decorator.add_slide_background(slide, "content")
         content_frame = self._create_content_shape(slide)
@@ -175,10 +172,9 @@ class PPTXGenerator:
         
         self.decorator.add_slide_decoration(slide, slide_index, total_slides, "process", presentation_title)
     
-    def _create_modern_content_slide(self, pptx: PPTXPresentation, slide_title: str, slide_content: str, 
+    def _create_modern_content_slide(self, deck: TemplateDeck, slide_title: str, slide_content: str, 
                                     slide_index: int, total_slides: int, presentation_title: str) -> None:
-        blank_layout = pptx.slide_layouts[6]
-        slide = pptx.slides.add_slide(blank_layout)
+        slide = deck.add_slide("blank")
         
         self.decorator.add_slide_background(slide, "content")
         content_frame = self._create_content_shape(slide)
@@ -585,34 +581,25 @@ class PPTXGenerator:
         filename = re.sub(r'_+', '_', filename)
         return filename.strip('_') or "Presentation"
     
-    def _generate_smart_filename(self, presentation: Presentation) -> Optional[str]:
-        try:
-            api_key = self._get_api_key()
-            if not api_key:
-                return None
-            
-            ai_service = AIService(api_key)
-            import asyncio
-            filename = asyncio.run(ai_service.generate_filename(
-                presentation.title, 
-                presentation.language
-            ))
-            
-            if filename and filename != "Presentation":
-                return f"{filename}.pptx"
-            return None
-        except Exception:
-            return None
+    def _fallback_filename(self, presentation: Presentation) -> str:
+        safe_title = self._sanitize_filename(presentation.title)
+        if len(safe_title) > 30:
+            words = safe_title.split('_')[:3]
+            safe_title = '_'.join(words)
+        return f"{safe_title}.pptx"
+    
+    def _new_deck(self) -> TemplateDeck:
+        if self.template_path:
+            try:
+                return self.template_cache.new_deck(self.template_path)
+            except Exception as e:
+                print(f"{self.loc.t('pptx_template_load_error')} ({self.template_path}): {e}")
+                self.template_path = None
+        return self.template_cache.new_deck()
     
     def generate_pptx(self, presentation: Presentation, filename: Optional[str] = None) -> str:
         if not filename:
-            filename = self._generate_smart_filename(presentation)
-            if not filename:
-                safe_title = self._sanitize_filename(presentation.title)
-                if len(safe_title) > 30:
-                    words = safe_title.split('_')[:3]
-                    safe_title = '_'.join(words)
-                filename = f"{safe_title}.pptx"
+            filename = presentation.filename or self._fallback_filename(presentation)
         
         if not filename.endswith('.pptx'):
             filename += '.pptx'
@@ -621,31 +608,39 @@ class PPTXGenerator:
             filename = "Presentation.pptx"
             
         output_path = self.output_dir / filename
-        pptx = PPTXPresentation()
-        
-        total_slides = 1
-        if presentation.sections:
-            total_slides += len(presentation.sections)
-            for section in presentation.sections:
-                if section.slides:
-                    total_slides += len(section.slides)
-        
-        slide_index = 0
-        
-        self._create_title_slide(pptx, presentation, slide_index, total_slides)
-        slide_index += 1
-        
-        if presentation.sections:
-            for section in presentation.sections:
-                if section.slides and len(section.slides) > 0:
-                    self._create_section_title_slide(pptx, section.title, slide_index, total_slides, presentation.title)
-                    slide_index += 1
-                    
-                    for slide in section.slides:
-                        self._create_content_slide(pptx, slide.title, slide.content, slide_index, total_slides, presentation.title)
-                        slide_index += 1
         
-        pptx.save(str(output_path))
+        with self.tracer.span("render.deck", "render", filename=filename) as deck_span:
+            deck = self._new_deck()
+            
+            total_slides = 1
+            if presentation.sections:
+                total_slides += len(presentation.sections)
+                for section in presentation.sections:
+                    if section.slides:
+                        total_slides += len(section.slides)
+            deck_span.set(slides=total_slides)
+            
+            slide_index = 0
+            
+            with self.tracer.span("render.slide", "render", index=slide_index, kind="title"):
+                self._create_title_slide(deck, presentation, slide_index, total_slides)
+            slide_index += 1
+            
+            if presentation.sections:
+                for section in presentation.sections:
+                    if section.slides and len(section.slides) > 0:
+                        with self.tracer.span("render.slide", "render", index=slide_index, kind="section"):
+                            self._create_section_title_slide(deck, section.title, slide_index, total_slides, presentation.title)
+                        slide_index += 1
+                        
+                        for slide in section.slides:
+                            with self.tracer.span("render.slide", "render", index=slide_index, kind="content", content_bytes=len((slide.content or "").encode('utf-8'))):
+                                self._create_content_slide(deck, slide.title, slide.content, slide_index, total_slides, presentation.title)
+                            slide_index += 1
+            
+            with self.tracer.span("render.save", "render") as save_span:
+                deck.save(str(output_path))
+                save_span.set(file_bytes=output_path.stat().st_size)
         return str(output_path.absolute())
     
     def list_presentations(self) -> list:
@@ -0,0 +1,131 @@
+import io
+import zipfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from pptx import Presentation as PPTXPresentation
+from pptx.enum.shapes import PP_PLACEHOLDER
+from ..localization.manager import get_localization_manager
+
+TEMPLATE_CONTENT_TYPE = b"application/vnd.openxmlformats-officedocument.presentationml.template.main+xml"
+PRESENTATION_CONTENT_TYPE = b"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+
+LAYOUT_ROLES = {
+    "title": ("title slide", 0),
+    "section": ("section header", 2),
+    "title_only": ("title only", 5),
+    "blank": ("blank", 6)
+}
+TITLED_ROLES = ("title", "section")
+TITLE_PLACEHOLDERS = (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE)
+
+
+class TemplateDeck:
+    def __init__(self, pptx: PPTXPresentation, layout_indices: Dict[str, int]):
+        self.pptx = pptx
+        layouts = pptx.slide_layouts
+        self.layouts = {role: layouts[index] for role, index in layout_indices.items()}
+    
+    def add_slide(self, role: str):
+        return self.pptx.slides.add_slide(self.layouts[role])
+    
+    def save(self, path: str) -> None:
+        self.pptx.save(path)
+
+
+class TemplateCache:
+    def __init__(self):
+        self._templates: Dict[str, Tuple[bytes, Dict[str, int]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            'loads': 0,
+            'decks': 0
+        }
+    
+    def new_deck(self, template_path: Optional[str] = None) -> TemplateDeck:
+        template_bytes, layout_indices = self._get(template_path)
+        self.stats['decks'] += 1
+        return TemplateDeck(PPTXPresentation(io.BytesIO(template_bytes)), layout_indices)
+    
+    def _get(self, template_path: Optional[str]) -> Tuple[bytes, Dict[str, int]]:
+        key = str(Path(template_path).resolve()) if template_path else ""
+        cached = self._templates.get(key)
+        if cached is not None:
+            return cached
+        
+        with self._lock:
+            cached = self._templates.get(key)
+            if cached is None:
+                cached = self._load(template_path)
+                self._templates[key] = cached
+                self.stats['loads'] += 1
+        return cached
+    
+    def _load(self, template_path: Optional[str]) -> Tuple[bytes, Dict[str, int]]:
+        if template_path:
+            pptx = PPTXPresentation(io.BytesIO(self._as_presentation_package(Path(template_path).read_bytes())))
+            slide_ids = pptx.slides._sldIdLst
+            for slide_id in list(slide_ids):
+                pptx.part.drop_rel(slide_id.rId)
+                slide_ids.remove(slide_id)
+        else:
+            pptx = PPTXPresentation()
+        
+        buffer = io.BytesIO()
+        pptx.save(buffer)
+        return buffer.getvalue(), self._resolve_layouts(pptx)
+    
+    def _as_presentation_package(self, data: bytes) -> bytes:
+        with zipfile.ZipFile(io.BytesIO(data)) as source:
+            content_types = source.read("[Content_Types].xml")
+            if TEMPLATE_CONTENT_TYPE not in content_types:
+                return data
+            
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as target:
+                for item in source.infolist():
+                    payload = source.read(item.filename)
+                    if item.filename == "[Content_Types].xml":
+                        payload = content_types.replace(TEMPLATE_CONTENT_TYPE, PRESENTATION_CONTENT_TYPE)
+                    target.writestr(item, payload)
+            return buffer.getvalue()
+    
+    def _resolve_layouts(self, pptx: PPTXPresentation) -> Dict[str, int]:
+        layouts = list(pptx.slide_layouts)
+        names = {layout.name.strip().lower(): index for index, layout in enumerate(layouts)}
+        fewest_placeholders = min(range(len(layouts)), key=lambda index: len(layouts[index].placeholders))
+        titled = [index for index, layout in enumerate(layouts) if self._has_title(layout)]
+        
+        resolved = {}
+        for role, (name, default_index) in LAYOUT_ROLES.items():
+            candidates = []
+            if name in names:
+                candidates.append(names[name])
+            if role == "blank":
+                candidates.append(fewest_placeholders)
+            elif default_index < len(layouts):
+                candidates.append(default_index)
+            candidates.append(0)
+            
+            if role in TITLED_ROLES:
+                candidates = [index for index in candidates if index in titled] or titled
+                if not candidates:
+                    raise Exception(get_localization_manager().t("pptx_template_no_title_layout"))
+            resolved[role] = candidates[0]
+        return resolved
+    
+    def _has_title(self, layout) -> bool:
+        return any(placeholder.placeholder_format.type in TITLE_PLACEHOLDERS for placeholder in layout.placeholders)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+    
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+
+
+_template_cache = TemplateCache()
+
+def get_template_cache() -> TemplateCache:
+    return _template_cache
@@ -2,10 +2,11 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import Optional
 from .translations import TRANSLATIONS
 
 DEFAULT_LANGUAGE = "русский"
-from .prompts import PROMPTS, get_current_date
+from .prompts import PROMPTS, SYSTEM_PROMPTS, get_current_date
 
 def get_resource_path(relative_path):
     if getattr(sys, 'frozen', False):
@@ -37,10 +38,11 @@ class LocalizationManager:
         except Exception:
             pass
     
-    def set_language(self, language: str):
+    def set_language(self, language: str, persist: bool = True):
         if language in TRANSLATIONS:
             self.current_language = language
-            self._save_language(language)
+            if persist:
+                self._save_language(language)
             return True
         return False
     
@@ -61,15 +63,26 @@ class LocalizationManager:
         except Exception:
             return key
     
+    def _prompt_language(self, language: Optional[str]) -> str:
+        if language in PROMPTS:
+            return language
+        return self.current_language
+    
     def get_prompt(self, prompt_type: str, **kwargs) -> str:
         try:
-            prompt_template = PROMPTS[self.current_language][prompt_type]
+            prompt_template = PROMPTS[self._prompt_language(kwargs.get('language'))][prompt_type]
             if 'current_date' not in kwargs:
                 kwargs['current_date'] = get_current_date()
             return prompt_template.format(**kwargs)
         except Exception as e:
             print(f"ERROR in get_prompt: {e}")
             return ""
+    
+    def get_system_prompt(self, prompt_type: str, language: Optional[str] = None) -> Optional[str]:
+        prompt_template = SYSTEM_PROMPTS.get(self._prompt_language(language), {}).get(prompt_type)
+        if prompt_template is None:
+            return None
+        return prompt_template.format().strip()
 
 
 _localization_manager = LocalizationManager()
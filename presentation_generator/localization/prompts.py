@@ -61,87 +61,43 @@ PROMPTS = {
         """,
         
         "slide_content": """
-Создай информативный и полный контент для слайда презентации на языке {language}.
+Создай контент для слайда презентации на языке {language}.
 
 ТЕМА СЛАЙДА: "{slide_title}"
 РАЗДЕЛ ПРЕЗЕНТАЦИИ: "{section_title}"
 
-ВАЖНО - ЧТО ПИСАТЬ:
-✓ Пиши конкретные факты, примеры и информацию по теме слайда
-✓ Раскрой тему "{slide_title}" полностью и понятно
-✓ Используй понятный язык без сложных терминов
-✓ Добавь конкретные данные, цифры, примеры где уместно
-✓ НАЧИНАЙ СРАЗУ С СУТИ ТЕМЫ, НЕ С ОПИСАНИЯ ЧТО ТЫ ДЕЛАЕШЬ
-✓ ОБЪЕМ: 60-100 слов, достаточно для полного раскрытия темы
-✓ МАКСИМУМ 5-7 пунктов в списке
-✓ КАЖДЫЙ ПУНКТ: 8-15 слов для детального описания
-
-⛔ ЧТО ЗАПРЕЩЕНО:
-✗ НЕ дублируй заголовок слайда в начале текста
-✗ НЕ пиши "Горизонт 2050:" если заголовок уже "Горизонт 2050"
-✗ НЕ пиши "Содержимое для слайда" или подобные фразы
-✗ НЕ пиши мета-текст типа "Здесь будет информация о..."
-✗ НЕ используй заглушки
-✗ НЕ пиши "Содержимое для слайда 'название слайда'"
-✗ НАЧИНАЙ СРАЗУ с краткого описания или списка ключевых пунктов  
-
-📌 ВЫБОР ФОРМАТА (ВАЖНО - РАЗНООБРАЗИЕ):  
-- ЧЕРЕДУЙ типы слайдов: 40% обычный текст, 40% списки, 20% таблицы/сравнения
-- ОБЫЧНЫЙ ТЕКСТ: связные абзацы из 2-4 предложений, раскрывающие тему
-- СПИСКИ: используй только когда нужно перечислить конкретные пункты
-- ТАБЛИЦЫ: только для сравнений или статистики
-- НЕ ДЕЛАЙ все слайды в виде списков - это скучно!
-- Всегда пиши полные предложения, не обрывай их  
-
-📊 ТАБЛИЦЫ:  
-Формат записи:  
-TABLE|Заголовок1|Заголовок2|Заголовок3  
-Строка1Колонка1|Строка1Колонка2|Строка1Колонка3  
-Строка2Колонка1|Строка2Колонка2|Строка2Колонка3  
-
-Правила для таблиц:  
-- До 5 строк и 4 столбцов.  
-- В ячейке 5–15 слов, информативные формулировки.  
-- Минимум 2 строки и 2 столбца.  
-- Чёткие заголовки, конкретные данные.  
-
-📝 ОБЫЧНЫЙ КОНТЕНТ:  
-- Нельзя использовать markdown (никаких **, *, # и т.д.).  
-- Списки только с маркером "• " и переносом строки.  
-- Между блоками — пустая строка.  
-- Вводи списки и акценты через двоеточие.  
-
-✅ Пример таблицы:  
-TABLE|Технология|Применение|Эффективность  
-Машинное обучение|Прогнозирование|95%  
-Нейронные сети|Распознавание|92%  
-Обработка языка|Переводы|88%  
-
-✅ Пример СПИСКА для слайда "Горизонт 2050":  
-Технологический прорыв к середине века охватит все сферы жизни. Основные направления развития:
-
-• Искусственный интеллект достигнет уровня человеческого мышления
-• Автономные транспортные средства заменят традиционный транспорт  
-• Роботехника интегрируется в повседневную жизнь людей
-• Биотехнологии позволят значительно продлить человеческую жизнь
-• Квантовые компьютеры решат сложнейшие научные задачи
+Сегодняшняя дата: {current_date}
+        """,
+        
+        "section_content": """
+Создай {count} слайдов для секции "{section_title}" презентации "{presentation_title}" на языке {language}.
 
-✅ Пример ОБЫЧНОГО ТЕКСТА для слайда "Горизонт 2050":
-Технологический прорыв к середине века кардинально изменит человеческую цивилизацию. Искусственный интеллект станет неотъемлемой частью повседневной жизни, помогая решать сложные задачи и принимать важные решения.
+ВАЖНО - ЗАГОЛОВКИ:
+✓ Каждый заголовок раскрывает конкретный аспект секции
+✓ Заголовки разные, 2-7 слов, без одинаковых начал
 
-Автономные системы возьмут на себя рутинные операции, освободив людей для творческой деятельности. Биотехнологии откроют новые возможности для лечения болезней и продления активной жизни. Квантовые вычисления ускорят научные открытия в разы.
+ВАЖНО - КОНТЕНТ КАЖДОГО СЛАЙДА:
+✓ Конкретные факты, примеры, данные и цифры по теме слайда
+✓ НАЧИНАЙ СРАЗУ С СУТИ ТЕМЫ, НЕ дублируй заголовок слайда в начале текста
+✓ ОБЪЕМ: 60-100 слов, МАКСИМУМ 5-7 пунктов в списке
+✓ Слайды не повторяют друг друга и логично дополняют друг друга
 
-❌ НЕПРАВИЛЬНО:
-"Горизонт 2050: Искусственный интеллект..."
-"Содержимое для слайда 'Горизонт 2050'"
+⛔ ЧТО ЗАПРЕЩЕНО:
+✗ НЕ пиши "Содержимое для слайда" или мета-текст типа "Здесь будет информация о..."
+✗ НЕ используй заглушки
+✗ Нельзя использовать markdown (никаких **, *, # и т.д.)
 
-✅ ПРАВИЛЬНО (без дублирования заголовка):
-"Технологический прорыв к середине века охватит все сферы жизни. Основные направления развития: ..."
+📌 ФОРМАТ (ЧЕРЕДУЙ между слайдами):
+- ОБЫЧНЫЙ ТЕКСТ: связные абзацы из 2-4 предложений, между блоками — пустая строка
+- СПИСКИ: только с маркером "• " и переносом строки, вводи их через двоеточие
+- ТАБЛИЦЫ: только для сравнений или статистики, до 5 строк и 4 столбцов:
+TABLE|Заголовок1|Заголовок2|Заголовок3
+Строка1Колонка1|Строка1Колонка2|Строка1Колонка3
 
-Сегодняшняя дата: {current_date}  
+Сегодняшняя дата: {current_date}
 
-Ответ всегда давай только в JSON:  
-{{"content": "Готовый текст в нужном формате..."}}  
+Ответ всегда давай только в JSON, ровно {count} слайдов:
+{{"slides": [{{"title": "Конкретный заголовок", "content": "Готовый текст в нужном формате..."}}]}}
         """,
         
         "presentation_summary": """
@@ -335,87 +291,43 @@ Response format: JSON only: {{"titles": ["Specific title 1", "Specific title 2",
         """,
         
         "slide_content": """
-Create informative and complete content for a presentation slide in {language}.
+Create content for a presentation slide in {language}.
 
 SLIDE TOPIC: "{slide_title}"
 PRESENTATION SECTION: "{section_title}"
 
-IMPORTANT - WHAT TO WRITE:
-✓ Write specific facts, examples and information about the slide topic
-✓ Fully and clearly explain the topic "{slide_title}"
-✓ Use clear language without complex terms
-✓ Add specific data, numbers, examples where appropriate
-✓ START IMMEDIATELY WITH THE TOPIC SUBSTANCE, NOT WITH DESCRIBING WHAT YOU'RE DOING
-✓ LENGTH: 60-100 words for comprehensive topic coverage
-✓ MAXIMUM 5-7 bullet points in lists
-✓ EACH POINT: 8-15 words for detailed description
-
-⛔ WHAT IS FORBIDDEN:
-✗ DO NOT duplicate the slide title at the beginning of text
-✗ DO NOT write "Horizon 2050:" if the title is already "Horizon 2050"
-✗ DO NOT write "Content for slide" or similar phrases
-✗ DO NOT write meta-text like "Here will be information about..."
-✗ DO NOT use placeholders
-✗ DO NOT write "Content for slide 'slide name'"
-✗ START IMMEDIATELY with brief description or key points list  
-
-📌 FORMAT SELECTION (IMPORTANT - VARIETY):  
-- ALTERNATE slide types: 40% regular text, 40% lists, 20% tables/comparisons
-- REGULAR TEXT: coherent paragraphs of 2-4 sentences explaining the topic
-- LISTS: use only when you need to enumerate specific points
-- TABLES: only for comparisons or statistics
-- DON'T make all slides as lists - it's boring!
-- Always write complete sentences, never cut them off  
-
-📊 TABLES:  
-Format example:  
-TABLE|Header1|Header2|Header3  
-Row1Col1|Row1Col2|Row1Col3  
-Row2Col1|Row2Col2|Row2Col3  
-
-Rules for tables:  
-- Up to 5 rows and 4 columns.  
-- Each cell: 5–15 words, informative content.  
-- At least 2 rows and 2 columns.  
-- Clear headers and concrete data.  
-
-📝 REGULAR TEXT:  
-- Do not use markdown (no **, *, #, etc.).  
-- Lists only with "• " as the bullet marker, each on a new line.  
-- Leave an empty line between blocks.  
-- Use a colon when introducing lists or key points.  
-
-✅ Example table:  
-TABLE|Technology|Application|Efficiency  
-Machine Learning|Forecasting|95%  
-Neural Networks|Recognition|92%  
-Natural Language Processing|Translation|88%  
-
-✅ Example of LIST for slide "Horizon 2050":  
-Technological breakthrough by mid-century will transform all aspects of life. Key development areas:
-
-• Artificial intelligence will reach human-level thinking capabilities
-• Autonomous vehicles will replace traditional transportation systems
-• Robotics will integrate seamlessly into daily human activities  
-• Biotechnology will significantly extend human lifespan potential
-• Quantum computers will solve complex scientific challenges
+Today's date: {current_date}
+        """,
+        
+        "section_content": """
+Create {count} slides for section "{section_title}" of presentation "{presentation_title}" in {language}.
 
-✅ Example of REGULAR TEXT for slide "Horizon 2050":
-Technological breakthrough by mid-century will fundamentally reshape human civilization. Artificial intelligence will become an integral part of daily life, helping solve complex problems and make important decisions.
+IMPORTANT - TITLES:
+✓ Each title reveals a specific aspect of the section
+✓ Titles are different, 2-7 words, without identical beginnings
 
-Autonomous systems will handle routine operations, freeing humans for creative activities. Biotechnology will unlock new possibilities for treating diseases and extending active life. Quantum computing will accelerate scientific discoveries exponentially.
+IMPORTANT - CONTENT OF EACH SLIDE:
+✓ Specific facts, examples, data and numbers about the slide topic
+✓ START IMMEDIATELY WITH THE TOPIC SUBSTANCE, DO NOT duplicate the slide title at the beginning of text
+✓ LENGTH: 60-100 words, MAXIMUM 5-7 bullet points in lists
+✓ Slides do not repeat each other and logically complement each other
 
-❌ WRONG:
-"Horizon 2050: Artificial intelligence will..."
-"Content for slide 'Horizon 2050'"
+⛔ WHAT IS FORBIDDEN:
+✗ DO NOT write "Content for slide" or meta-text like "Here will be information about..."
+✗ DO NOT use placeholders
+✗ Do not use markdown (no **, *, #, etc.)
 
-✅ CORRECT (without title duplication):
-"Technological breakthrough by mid-century will transform all aspects of life. Key development areas: ..."
+📌 FORMAT (ALTERNATE between slides):
+- REGULAR TEXT: coherent paragraphs of 2-4 sentences, an empty line between blocks
+- LISTS: only with "• " as the bullet marker, each on a new line, introduced with a colon
+- TABLES: only for comparisons or statistics, up to 5 rows and 4 columns:
+TABLE|Header1|Header2|Header3
+Row1Col1|Row1Col2|Row1Col3
 
-Today's date: {current_date}  
+Today's date: {current_date}
 
-Always respond only in JSON:  
-{{"content": "Final text in the required format..."}}  
+Always respond only in JSON, exactly {count} slides:
+{{"slides": [{{"title": "Specific title", "content": "Final text in the required format..."}}]}}
         """,
         
         "presentation_summary": """
@@ -552,3 +464,164 @@ Response format: JSON only: {{"filename": "Short_Filename"}}
         """
     }
 }
+
+SYSTEM_PROMPTS = {
+    "русский": {
+        "slide_content": """
+Ты создаешь информативный и полный контент для слайда презентации. Тема, раздел и язык слайда указаны в запросе пользователя.
+
+ВАЖНО - ЧТО ПИСАТЬ:
+✓ Пиши конкретные факты, примеры и информацию по теме слайда
+✓ Раскрой тему слайда полностью и понятно
+✓ Используй понятный язык без сложных терминов
+✓ Добавь конкретные данные, цифры, примеры где уместно
+✓ НАЧИНАЙ СРАЗУ С СУТИ ТЕМЫ, НЕ С ОПИСАНИЯ ЧТО ТЫ ДЕЛАЕШЬ
+✓ ОБЪЕМ: 60-100 слов, достаточно для полного раскрытия темы
+✓ МАКСИМУМ 5-7 пунктов в списке
+✓ КАЖДЫЙ ПУНКТ: 8-15 слов для детального описания
+
+⛔ ЧТО ЗАПРЕЩЕНО:
+✗ НЕ дублируй заголовок слайда в начале текста
+✗ НЕ пиши "Горизонт 2050:" если заголовок уже "Горизонт 2050"
+✗ НЕ пиши "Содержимое для слайда" или подобные фразы
+✗ НЕ пиши мета-текст типа "Здесь будет информация о..."
+✗ НЕ используй заглушки
+✗ НАЧИНАЙ СРАЗУ с краткого описания или списка ключевых пунктов
+
+📌 ВЫБОР ФОРМАТА (ВАЖНО - РАЗНООБРАЗИЕ):
+- ЧЕРЕДУЙ типы слайдов: 40% обычный текст, 40% списки, 20% таблицы/сравнения
+- ОБЫЧНЫЙ ТЕКСТ: связные абзацы из 2-4 предложений, раскрывающие тему
+- СПИСКИ: используй только когда нужно перечислить конкретные пункты
+- ТАБЛИЦЫ: только для сравнений или статистики
+- НЕ ДЕЛАЙ все слайды в виде списков - это скучно!
+- Всегда пиши полные предложения, не обрывай их
+
+📊 ТАБЛИЦЫ:
+Формат записи:
+TABLE|Заголовок1|Заголовок2|Заголовок3
+Строка1Колонка1|Строка1Колонка2|Строка1Колонка3
+Строка2Колонка1|Строка2Колонка2|Строка2Колонка3
+
+Правила для таблиц:
+- До 5 строк и 4 столбцов.
+- В ячейке 5–15 слов, информативные формулировки.
+- Минимум 2 строки и 2 столбца.
+- Чёткие заголовки, конкретные данные.
+
+📝 ОБЫЧНЫЙ КОНТЕНТ:
+- Нельзя использовать markdown (никаких **, *, # и т.д.).
+- Списки только с маркером "• " и переносом строки.
+- Между блоками — пустая строка.
+- Вводи списки и акценты через двоеточие.
+
+✅ Пример таблицы:
+TABLE|Технология|Применение|Эффективность
+Машинное обучение|Прогнозирование|95%
+Нейронные сети|Распознавание|92%
+Обработка языка|Переводы|88%
+
+✅ Пример СПИСКА для слайда "Горизонт 2050":
+Технологический прорыв к середине века охватит все сферы жизни. Основные направления развития:
+
+• Искусственный интеллект достигнет уровня человеческого мышления
+• Автономные транспортные средства заменят традиционный транспорт
+• Роботехника интегрируется в повседневную жизнь людей
+• Биотехнологии позволят значительно продлить человеческую жизнь
+• Квантовые компьютеры решат сложнейшие научные задачи
+
+✅ Пример ОБЫЧНОГО ТЕКСТА для слайда "Горизонт 2050":
+Технологический прорыв к середине века кардинально изменит человеческую цивилизацию. Искусственный интеллект станет неотъемлемой частью повседневной жизни, помогая решать сложные задачи и принимать важные решения.
+
+Автономные системы возьмут на себя рутинные операции, освободив людей для творческой деятельности. Биотехнологии откроют новые возможности для лечения болезней и продления активной жизни. Квантовые вычисления ускорят научные открытия в разы.
+
+❌ НЕПРАВИЛЬНО:
+"Горизонт 2050: Искусственный интеллект..."
+"Содержимое для слайда 'Горизонт 2050'"
+
+✅ ПРАВИЛЬНО (без дублирования заголовка):
+"Технологический прорыв к середине века охватит все сферы жизни. Основные направления развития: ..."
+
+Ответ всегда давай только в JSON:
+{{"content": "Готовый текст в нужном формате..."}}
+        """
+    },
+    "english": {
+        "slide_content": """
+You create informative and complete content for a presentation slide. The slide topic, section and language are given in the user message.
+
+IMPORTANT - WHAT TO WRITE:
+✓ Write specific facts, examples and information about the slide topic
+✓ Fully and clearly explain the slide topic
+✓ Use clear language without complex terms
+✓ Add specific data, numbers, examples where appropriate
+✓ START IMMEDIATELY WITH THE TOPIC SUBSTANCE, NOT WITH DESCRIBING WHAT YOU'RE DOING
+✓ LENGTH: 60-100 words for comprehensive topic coverage
+✓ MAXIMUM 5-7 bullet points in lists
+✓ EACH POINT: 8-15 words for detailed description
+
+⛔ WHAT IS FORBIDDEN:
+✗ DO NOT duplicate the slide title at the beginning of text
+✗ DO NOT write "Horizon 2050:" if the title is already "Horizon 2050"
+✗ DO NOT write "Content for slide" or similar phrases
+✗ DO NOT write meta-text like "Here will be information about..."
+✗ DO NOT use placeholders
+✗ START IMMEDIATELY with brief description or key points list
+
+📌 FORMAT SELECTION (IMPORTANT - VARIETY):
+- ALTERNATE slide types: 40% regular text, 40% lists, 20% tables/comparisons
+- REGULAR TEXT: coherent paragraphs of 2-4 sentences explaining the topic
+- LISTS: use only when you need to enumerate specific points
+- TABLES: only for comparisons or statistics
+- DON'T make all slides as lists - it's boring!
+- Always write complete sentences, never cut them off
+
+📊 TABLES:
+Format example:
+TABLE|Header1|Header2|Header3
+Row1Col1|Row1Col2|Row1Col3
+Row2Col1|Row2Col2|Row2Col3
+
+Rules for tables:
+- Up to 5 rows and 4 columns.
+- Each cell: 5–15 words, informative content.
+- At least 2 rows and 2 columns.
+- Clear headers and concrete data.
+
+📝 REGULAR TEXT:
+- Do not use markdown (no **, *, #, etc.).
+- Lists only with "• " as the bullet marker, each on a new line.
+- Leave an empty line between blocks.
+- Use a colon when introducing lists or key points.
+
+✅ Example table:
+TABLE|Technology|Application|Efficiency
+Machine Learning|Forecasting|95%
+Neural Networks|Recognition|92%
+Natural Language Processing|Translation|88%
+
+✅ Example of LIST for slide "Horizon 2050":
+Technological breakthrough by mid-century will transform all aspects of life. Key development areas:
+
+• Artificial intelligence will reach human-level thinking capabilities
+• Autonomous vehicles will replace traditional transportation systems
+• Robotics will integrate seamlessly into daily human activities
+• Biotechnology will significantly extend human lifespan potential
+• Quantum computers will solve complex scientific challenges
+
+✅ Example of REGULAR TEXT for slide "Horizon 2050":
+Technological breakthrough by mid-century will fundamentally reshape human civilization. Artificial intelligence will become an integral part of daily life, helping solve complex problems and make important decisions.
+
+Autonomous systems will handle routine operations, freeing humans for creative activities. Biotechnology will unlock new possibilities for treating diseases and extending active life. Quantum computing will accelerate scientific discoveries exponentially.
+
+❌ WRONG:
+"Horizon 2050: Artificial intelligence will..."
+"Content for slide 'Horizon 2050'"
+
+✅ CORRECT (without title duplication):
+"Technological breakthrough by mid-century will transform all aspects of life. Key development areas: ..."
+
+Always respond only in JSON:
+{{"content": "Final text in the required format..."}}
+        """
+    }
+}
@@ -6,6 +6,13 @@ TRANSLATIONS = {
         "menu_manage": "≡ Управление презентациями",
         "menu_show": "≡ Показать сохраненные презентации",
         "menu_delete": "⌫ Удалить презентацию",
+        
+        "menu_resume": "↻ Продолжить незавершенную презентацию",
+        "unfinished_presentations": "Незавершенные презентации",
+        "no_unfinished": "∅ Нет незавершенных презентаций",
+        "unfinished_title": "■ Название",
+        "unfinished_progress": "Готово слайдов",
+        "enter_resume_number": "Введите номер презентации для продолжения",
         "menu_settings": "⚙ Общие настройки",
         "menu_exit": "× Выход",
         "back_to_main": "← Назад в главное меню",
@@ -145,9 +152,52 @@ TRANSLATIONS = {
         
         "developer_mode": "Включить режим разработчика?",
         "developer_mode_info": "Показывать детальную информацию о процессе генерации",
+        
+        "tracing_enabled": "Записывать трассировку генерации?",
+        "tracing_info": "Время каждого запроса к ИИ, поиска, загрузки страниц, рендеринга слайдов и записи в БД сохраняется в output/traces (формат Chrome trace: chrome://tracing или ui.perfetto.dev)",
+        "trace_saved": "Трассировка сохранена:",
         "dev_mode_enabled": "✓ Режим разработчика включен",
         "dev_mode_disabled": "✓ Режим разработчика отключен",
         
+        "concurrent_generation": "Параллельная генерация",
+        "concurrent_generation_info": "Генерировать секции и слайды одновременно, а не по очереди",
+        "max_concurrent_requests": "Максимум одновременных запросов к ИИ",
+        
+        "response_cache": "Кэш ответов ИИ",
+        "response_cache_info": "Повторно использовать ответы ИИ на одинаковые запросы (вступает в силу после перезапуска)",
+        "response_cache_stats": "попаданий: {hits}, промахов: {misses}, сэкономлено {saved} КБ",
+        
+        "hedged_requests": "Дублирующие запросы",
+        "hedged_requests_stats": "{hedged} из {requests}, быстрее исходного: {wins}",
+        
+        "token_usage": "Токены",
+        "token_usage_stats": "{total} (запрос {prompt}, ответ {completion}), запросов: {requests}",
+        "token_usage_by_type": "Больше всего токенов",
+        "token_cost": "Стоимость",
+        
+        "deck_budget": "Бюджет",
+        "deck_budget_stats": "{level}; {elapsed} сек, {tokens} токенов; без веб-поиска: {web}, пропущено запросов: {skipped}",
+        "budget_level_normal": "в пределах бюджета",
+        "budget_level_no_web": "веб-поиск отключен",
+        "budget_level_single_attempt": "без повторных запросов",
+        "budget_level_exhausted": "бюджет исчерпан, часть слайдов заполнена по умолчанию",
+        "deck_budget_info": "Ограничения на одну презентацию (0 — без ограничения). При 50% бюджета отключается веб-поиск, при 75% — повторные запросы, после исчерпания оставшиеся слайды заполняются текстом по умолчанию",
+        "deck_deadline_seconds": "Лимит времени на презентацию, сек",
+        "deck_token_budget": "Лимит токенов на презентацию",
+        
+        "pptx_template_info": "Фирменный шаблон (.potx или .pptx) загружается один раз и используется для всех презентаций. «-» — стандартный шаблон",
+        "pptx_template_path": "Путь к шаблону",
+        "pptx_template_not_found": "Файл шаблона не найден",
+        "pptx_template_load_error": "Не удалось загрузить шаблон, используется стандартный",
+        "pptx_template_no_title_layout": "В шаблоне нет макета с заголовком для титульного слайда и разделов",
+        
+        "stream_responses": "Потоковые ответы ИИ",
+        "stream_responses_info": "Ответ читается по мере генерации: видно число полученных токенов, а запрос завершается сразу после закрывающей скобки JSON",
+        
+        "section_batch_generation": "Генерация секции одним запросом",
+        "section_batch_generation_info": "Заголовки и контент всех слайдов секции запрашиваются сразу; при включенном веб-поиске слайды генерируются по отдельности",
+        "tokens_received": "токенов: {count}",
+        
         "debug_ai_request": "🤖 ИИ запрос:",
         "debug_ai_response": "🤖 ИИ ответ:",
         "debug_web_search": "🌐 Поиск в интернете:",
@@ -157,6 +207,8 @@ TRANSLATIONS = {
         "debug_generated_content": "📝 Сгенерированный контент:",
         "debug_section_titles": "Заголовки секций",
         "debug_slide_titles": "Заголовки слайдов",
+        
+        "debug_section_content": "Контент секции",
         "debug_title": "Название",
         "debug_count": "Количество",
         "debug_section": "Секция",
@@ -169,6 +221,9 @@ TRANSLATIONS = {
         "error_rate_limit": "Превышен лимит запросов",
         "error_api_error": "Ошибка API",
         "error_network": "Ошибка сети",
+        
+        "error_timeout": "Превышено время ожидания ответа API",
+        "error_circuit_open": "API недоступен, запросы приостановлены (повтор через {seconds} с)",
         "error_unknown": "Неизвестная ошибка",
         
         "section": "секция",
@@ -218,6 +273,43 @@ TRANSLATIONS = {
         "generation_failed": "Генерация не удалась",
         "generation_error": "Ошибка генерации",
         "generation_stopped": "Генерация остановлена из-за критических ошибок",
+        
+        "generation_resumable": "Готовые слайды сохранены — продолжить можно в меню «Управление презентациями»",
+        "checkpoint_not_found": "Незавершенная презентация не найдена",
+        
+        "batch_description": "Пакетная генерация презентаций из JSONL-файла с темами",
+        "batch_arg_topics": "JSONL-файл: по одной теме на строку (title, sections, slides, language, web_search, filename, deadline, token_budget)",
+        "batch_arg_output": "папка для PPTX-файлов",
+        "batch_arg_manifest": "путь к JSONL-манифесту с результатами",
+        "batch_arg_decks": "сколько презентаций генерировать одновременно",
+        "batch_arg_requests": "общий лимит одновременных запросов к ИИ для всех презентаций",
+        "batch_topics_not_found": "Файл с темами не найден",
+        "batch_api_key_missing": "API ключ не найден. Запустите программу в обычном режиме, чтобы сохранить ключ",
+        "batch_no_topics": "В файле нет тем для генерации",
+        "batch_missing_title": "не указано поле title",
+        "batch_invalid_spec": "Некорректная строка",
+        "batch_unknown_language": "неизвестный язык",
+        "batch_line": "строка {line}",
+        "batch_started": "Презентаций: {count}, одновременно: {decks}, лимит запросов: {requests}",
+        "batch_finished": "Готово: {ok}, ошибок: {failed}, время: {time}",
+        "batch_manifest": "Манифест",
+        
+        "batch_arg_trace": "записать трассировку в файл (.json для chrome://tracing и Perfetto, .jsonl построчно)",
+        
+        "batch_arg_deadline": "лимит времени на одну презентацию в секундах (поле deadline в строке переопределяет)",
+        "batch_arg_token_budget": "лимит токенов на одну презентацию (поле token_budget в строке переопределяет)",
+        
+        "export_description": "Параллельный экспорт сохраненных презентаций в PPTX на нескольких процессах",
+        "export_arg_ids": "ID презентаций из базы (по умолчанию все завершенные)",
+        "export_arg_workers": "число процессов рендеринга (по умолчанию по числу ядер)",
+        "export_arg_decks_per_worker": "перезапускать процесс после стольких презентаций (0 - не перезапускать)",
+        "export_arg_memory_limit": "лимит памяти на процесс в МБ (0 - без лимита)",
+        "export_arg_manifest": "путь к JSONL-манифесту экспорта",
+        "export_started": "Экспорт: процессов {workers}, презентаций на процесс {decks}, лимит памяти {memory}",
+        "export_finished": "Готово: {ok}, ошибок: {failed}, перезапусков пула: {restarts}, пик памяти процесса: {memory} МБ, время: {time}",
+        "export_not_found": "презентация не найдена в базе",
+        "export_worker_crashed": "процесс рендеринга аварийно завершился",
+        "trace_summary_line": "  {name}: {count} шт., всего {total} с, макс. {max} с",
         "language_russian": "русский",
         "language_english": "english",
         "project_damaged": "Проект повреждён. Переустановите его.",
@@ -251,6 +343,13 @@ TRANSLATIONS = {
         "menu_manage": "≡ Manage presentations",
         "menu_show": "≡ Show saved presentations",
         "menu_delete": "⌫ Delete presentation",
+        
+        "menu_resume": "↻ Resume unfinished presentation",
+        "unfinished_presentations": "Unfinished presentations",
+        "no_unfinished": "∅ No unfinished presentations",
+        "unfinished_title": "■ Title",
+        "unfinished_progress": "Slides done",
+        "enter_resume_number": "Enter the number of the presentation to resume",
         "menu_settings": "⚙ General settings",
         "menu_exit": "× Exit",
         "back_to_main": "← Back to main menu",
@@ -393,9 +492,52 @@ TRANSLATIONS = {
         
         "developer_mode": "Enable developer mode?",
         "developer_mode_info": "Show detailed information about generation process",
+        
+        "tracing_enabled": "Record generation traces?",
+        "tracing_info": "Timing of every AI request, search, page scrape, slide render and DB write is saved to output/traces (Chrome trace format: chrome://tracing or ui.perfetto.dev)",
+        "trace_saved": "Trace saved:",
         "dev_mode_enabled": "✓ Developer mode enabled",
         "dev_mode_disabled": "✓ Developer mode disabled",
         
+        "concurrent_generation": "Concurrent generation",
+        "concurrent_generation_info": "Generate sections and slides at the same time instead of one by one",
+        "max_concurrent_requests": "Maximum simultaneous AI requests",
+        
+        "response_cache": "AI response cache",
+        "response_cache_info": "Reuse AI answers for identical requests (takes effect after restart)",
+        "response_cache_stats": "hits: {hits}, misses: {misses}, saved {saved} KB",
+        
+        "hedged_requests": "Hedged requests",
+        "hedged_requests_stats": "{hedged} of {requests}, faster than original: {wins}",
+        
+        "token_usage": "Tokens",
+        "token_usage_stats": "{total} (prompt {prompt}, completion {completion}), requests: {requests}",
+        "token_usage_by_type": "Top token consumers",
+        "token_cost": "Cost",
+        
+        "deck_budget": "Budget",
+        "deck_budget_stats": "{level}; {elapsed} sec, {tokens} tokens; without web search: {web}, skipped requests: {skipped}",
+        "budget_level_normal": "within budget",
+        "budget_level_no_web": "web search disabled",
+        "budget_level_single_attempt": "retries disabled",
+        "budget_level_exhausted": "budget exhausted, some slides use default content",
+        "deck_budget_info": "Limits per presentation (0 means no limit). At 50% of the budget web search is skipped, at 75% retries are disabled, once exhausted the remaining slides get default content",
+        "deck_deadline_seconds": "Time limit per presentation, sec",
+        "deck_token_budget": "Token limit per presentation",
+        
+        "pptx_template_info": "A branded template (.potx or .pptx) is loaded once and reused for every presentation. \"-\" restores the default template",
+        "pptx_template_path": "Template path",
+        "pptx_template_not_found": "Template file not found",
+        "pptx_template_load_error": "Could not load the template, using the default one",
+        "pptx_template_no_title_layout": "The template has no layout with a title for the title and section slides",
+        
+        "stream_responses": "Streaming AI responses",
+        "stream_responses_info": "Replies are read as they are generated: the received token count is shown and the request ends as soon as the JSON is complete",
+        
+        "section_batch_generation": "Generate a section in one request",
+        "section_batch_generation_info": "Titles and content for all slides of a section are requested at once; with web search enabled slides are generated individually",
+        "tokens_received": "tokens: {count}",
+        
         "debug_ai_request": "🤖 AI request:",
         "debug_ai_response": "🤖 AI response:",
         "debug_web_search": "🌐 Web search:",
@@ -405,6 +547,8 @@ TRANSLATIONS = {
         "debug_generated_content": "📝 Generated content:",
         "debug_section_titles": "Section titles",
         "debug_slide_titles": "Slide titles",
+        
+        "debug_section_content": "Section content",
         "debug_title": "Title",
         "debug_count": "Count",
         "debug_section": "Section",
@@ -417,6 +561,9 @@ TRANSLATIONS = {
         "error_rate_limit": "Rate limit exceeded",
         "error_api_error": "API error",
         "error_network": "Network error",
+        
+        "error_timeout": "API response timed out",
+        "error_circuit_open": "API is unavailable, requests are paused (retry in {seconds}s)",
         "error_unknown": "Unknown error",
         
         "section": "section",
@@ -466,6 +613,43 @@ TRANSLATIONS = {
         "generation_failed": "Generation failed",
         "generation_error": "Generation error",
         "generation_stopped": "Generation stopped due to critical errors",
+        
+        "generation_resumable": "Completed slides were saved — you can resume from the \"Manage presentations\" menu",
+        "checkpoint_not_found": "Unfinished presentation not found",
+        
+        "batch_description": "Generate presentations in bulk from a JSONL file of topics",
+        "batch_arg_topics": "JSONL file with one topic per line (title, sections, slides, language, web_search, filename, deadline, token_budget)",
+        "batch_arg_output": "directory for the PPTX files",
+        "batch_arg_manifest": "path of the JSONL results manifest",
+        "batch_arg_decks": "how many presentations to generate at once",
+        "batch_arg_requests": "AI request concurrency shared by all presentations",
+        "batch_topics_not_found": "Topics file not found",
+        "batch_api_key_missing": "API key not found. Run the program interactively once to save it",
+        "batch_no_topics": "The topics file is empty",
+        "batch_missing_title": "the title field is missing",
+        "batch_invalid_spec": "Invalid line",
+        "batch_unknown_language": "unknown language",
+        "batch_line": "line {line}",
+        "batch_started": "Presentations: {count}, at once: {decks}, request limit: {requests}",
+        "batch_finished": "Done: {ok}, failed: {failed}, time: {time}",
+        "batch_manifest": "Manifest",
+        
+        "batch_arg_trace": "write a trace to this file (.json for chrome://tracing and Perfetto, .jsonl one span per line)",
+        
+        "batch_arg_deadline": "time limit per presentation in seconds (a deadline field on a line overrides it)",
+        "batch_arg_token_budget": "token limit per presentation (a token_budget field on a line overrides it)",
+        
+        "export_description": "Render saved presentations to PPTX in parallel across worker processes",
+        "export_arg_ids": "presentation IDs from the database (all completed ones by default)",
+        "export_arg_workers": "number of render processes (CPU count by default)",
+        "export_arg_decks_per_worker": "recycle a worker after this many presentations (0 disables)",
+        "export_arg_memory_limit": "memory ceiling per worker in MB (0 disables)",
+        "export_arg_manifest": "path of the JSONL export manifest",
+        "export_started": "Export: {workers} workers, {decks} presentations per worker, memory limit {memory}",
+        "export_finished": "Done: {ok}, failed: {failed}, pool restarts: {restarts}, peak worker memory: {memory} MB, time: {time}",
+        "export_not_found": "presentation not found in the database",
+        "export_worker_crashed": "render worker crashed",
+        "trace_summary_line": "  {name}: {count}x, total {total}s, max {max}s",
         "language_russian": "русский",
         "language_english": "english",
         "project_damaged": "Project is damaged. Reinstall it.",
@@ -45,6 +45,56 @@ def signal_handler(signum, frame):
     print(f"\n\n{loc.t('program_terminated')}")
     sys.exit(0)
 
+def batch_main(argv: list) -> int:
+    import argparse
+    from presentation_generator.ui.batch_interface import BatchInterface
+    
+    parser = argparse.ArgumentParser(prog="run.py batch", description=loc.t("batch_description"))
+    parser.add_argument("topics", help=loc.t("batch_arg_topics"))
+    parser.add_argument("--output", default="output", help=loc.t("batch_arg_output"))
+    parser.add_argument("--manifest", default=None, help=loc.t("batch_arg_manifest"))
+    parser.add_argument("--decks", type=int, default=None, help=loc.t("batch_arg_decks"))
+    parser.add_argument("--requests", type=int, default=None, help=loc.t("batch_arg_requests"))
+    parser.add_argument("--trace", default=None, help=loc.t("batch_arg_trace"))
+    parser.add_argument("--deadline", type=float, default=None, help=loc.t("batch_arg_deadline"))
+    parser.add_argument("--token-budget", type=int, default=None, help=loc.t("batch_arg_token_budget"))
+    args = parser.parse_args(argv)
+    
+    batch = BatchInterface(
+        args.topics,
+        output_dir=args.output,
+        manifest_path=args.manifest,
+        max_concurrent_decks=args.decks,
+        max_concurrent_requests=args.requests,
+        trace_path=args.trace,
+        deadline_seconds=args.deadline,
+        token_budget=args.token_budget
+    )
+    return batch.run()
+
+def export_main(argv: list) -> int:
+    import argparse
+    from presentation_generator.ui.export_interface import ExportInterface
+    
+    parser = argparse.ArgumentParser(prog="run.py export", description=loc.t("export_description"))
+    parser.add_argument("ids", nargs="*", type=int, help=loc.t("export_arg_ids"))
+    parser.add_argument("--output", default="output", help=loc.t("batch_arg_output"))
+    parser.add_argument("--manifest", default=None, help=loc.t("export_arg_manifest"))
+    parser.add_argument("--workers", type=int, default=None, help=loc.t("export_arg_workers"))
+    parser.add_argument("--decks-per-worker", type=int, default=None, help=loc.t("export_arg_decks_per_worker"))
+    parser.add_argument("--memory-limit", type=int, default=None, help=loc.t("export_arg_memory_limit"))
+    args = parser.parse_args(argv)
+    
+    export = ExportInterface(
+        args.ids,
+        output_dir=args.output,
+        manifest_path=args.manifest,
+        max_workers=args.workers,
+        decks_per_worker=args.decks_per_worker,
+        memory_limit_mb=args.memory_limit
+    )
+    return export.run()
+
 def main():
     global app, service
     
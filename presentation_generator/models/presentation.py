@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
 @dataclass
 class Slide:
     title: str
-    content: str
+    content: Optional[str]
     
     def to_dict(self) -> dict:
         return {
@@ -41,6 +41,10 @@ class Presentation:
     max_slides: int = 4
     created_at: datetime = field(default_factory=datetime.now)
     generated: bool = False
+    id: Optional[int] = None
+    token_usage: Dict[str, dict] = field(default_factory=dict)
+    budget_stats: Optional[dict] = None
+    filename: Optional[str] = None
     
     def add_section(self, section: Section) -> None:
         self.sections.append(section)
@@ -55,7 +59,9 @@ class Presentation:
             'max_sections': self.max_sections,
             'max_slides': self.max_slides,
             'created_at': self.created_at.isoformat(),
-            'generated': self.generated
+            'generated': self.generated,
+            'token_usage': self.token_usage,
+            'filename': self.filename
         }
     
     def get_total_slides(self) -> int:
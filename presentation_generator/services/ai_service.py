@@ -3,11 +3,15 @@ import sys
 import time
 import asyncio
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 from ..models.presentation import Presentation, Section, Slide
 from ..localization.manager import get_localization_manager
 from ..localization.prompts import get_current_date
 from .ionet_service import IoNetService
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+from .deck_budget import get_current_budget
+from ..utils.text_normalizer import get_text_normalizer
 
 def get_resource_path(relative_path):
     if getattr(sys, 'frozen', False):
@@ -17,41 +21,65 @@ def get_resource_path(relative_path):
 
 
 class AIService:
-    def __init__(self, api_key: str, model: str = "deepseek-ai/DeepSeek-R1-0528"):
-        self.ionet_service = IoNetService(api_key, model)
+    def __init__(self, api_key: str, model: str = "deepseek-ai/DeepSeek-R1-0528", response_cache: Optional[ResponseCache] = None, stream: bool = False, retry_policy: Optional[RetryPolicy] = None):
+        self.ionet_service = IoNetService(api_key, model, response_cache=response_cache, stream=stream, retry_policy=retry_policy)
         self.max_attempts = 3
         self.retry_delay = 1.0
+        self.section_tokens_per_slide = 400
         self.loc = get_localization_manager()
+        self.text_normalizer = get_text_normalizer()
+    
+    async def start(self) -> None:
+        await self.ionet_service.start()
+    
+    async def close(self) -> None:
+        await self.ionet_service.close()
+        
+    async def _make_request(self, prompt: str, temperature: float = 1.0, use_cache: bool = True, on_token: Optional[Callable[[int], None]] = None, max_completion_tokens: int = 800, prompt_type: Optional[str] = None, system_prompt: Optional[str] = None) -> Optional[str]:
+        budget = get_current_budget()
+        if budget is not None and budget.exhausted():
+            budget.stats['requests_skipped'] += 1
+            return None
         
-    async def _make_request(self, prompt: str, temperature: float = 1.0) -> Optional[str]:
-        for attempt in range(self.max_attempts):
-            try:
-                response = await self.ionet_service.generate_response(prompt, temperature)
-                if response:
-                    return response
-            except Exception as e:
-                if attempt < self.max_attempts - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                raise e
-        return None
+        try:
+            return await self.ionet_service.generate_response(
+                prompt,
+                temperature,
+                use_cache=use_cache,
+                on_token=on_token,
+                max_completion_tokens=max_completion_tokens,
+                prompt_type=prompt_type,
+                system_prompt=system_prompt
+            )
+        except Exception:
+            if budget is not None and budget.exhausted():
+                budget.stats['requests_cut'] += 1
+                return None
+            raise
     
-    def _parse_json_response(self, response_text: str) -> Optional[dict]:
-        return self.ionet_service.parse_json_response(response_text)
+    def _attempt_limit(self) -> int:
+        budget = get_current_budget()
+        if budget is None:
+            return self.max_attempts
+        return budget.max_attempts(self.max_attempts)
+    
+    def _parse_json_response(self, response_text: str, prompt_type: Optional[str] = None) -> Optional[dict]:
+        return self.ionet_service.parse_json_response(response_text, prompt_type)
     
     async def generate_filename(self, title: str, language: str = None) -> str:
         if language is None:
             language = self.loc.t('language_russian')
         try:
-            prompt_template = PROMPTS[language]["generate_filename"]
-            prompt = prompt_template.format(
+            prompt = self.loc.get_prompt(
+                "generate_filename",
                 title=title,
+                language=language,
                 current_date=get_current_date()
             )
             
-            response = await self._make_request(prompt, temperature=0.3)
+            response = await self._make_request(prompt, temperature=0.3, prompt_type="generate_filename")
             if response:
-                parsed = self._parse_json_response(response)
+                parsed = self._parse_json_response(response, "generate_filename")
                 if parsed and "filename" in parsed:
                     filename = parsed["filename"].strip()
                     if filename and len(filename) <= 50:
@@ -69,17 +97,19 @@ class AIService:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
             "section_titles",
+            language=language,
             count=count,
             title=presentation_title,
             current_date=get_current_date()
         )
         
-        for attempt in range(self.max_attempts):
-            response = await self._make_request(prompt, temperature=0.7)
+        max_attempts = self._attempt_limit()
+        for attempt in range(max_attempts):
+            response = await self._make_request(prompt, temperature=0.7, use_cache=attempt == 0, prompt_type="section_titles")
             if not response:
                 continue
                 
-            parsed = self._parse_json_response(response)
+            parsed = self._parse_json_response(response, "section_titles")
             if parsed and 'titles' in parsed:
                 titles = parsed['titles']
                 if isinstance(titles, list):
@@ -89,7 +119,7 @@ class AIService:
                 elif isinstance(titles, str) and self._is_valid_section_title(titles):
                     return [titles]
             
-            if attempt < self.max_attempts - 1:
+            if attempt < max_attempts - 1:
                 await asyncio.sleep(self.retry_delay)
         
         default_text = self.loc.t("section_default")
@@ -123,18 +153,20 @@ class AIService:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
             "slide_titles",
+            language=language,
             count=count,
             section_title=section_title,
             presentation_title=presentation_title,
             current_date=get_current_date()
         )
         
-        for attempt in range(self.max_attempts):
-            response = await self._make_request(prompt, temperature=0.7)
+        max_attempts = self._attempt_limit()
+        for attempt in range(max_attempts):
+            response = await self._make_request(prompt, temperature=0.7, use_cache=attempt == 0, prompt_type="slide_titles")
             if not response:
                 continue
                 
-            parsed = self._parse_json_response(response)
+            parsed = self._parse_json_response(response, "slide_titles")
             if parsed and 'titles' in parsed:
                 titles = parsed['titles']
                 if isinstance(titles, list):
@@ -144,7 +176,7 @@ class AIService:
                 elif isinstance(titles, str) and self._is_valid_slide_title(titles):
                     return [titles]
             
-            if attempt < self.max_attempts - 1:
+            if attempt < max_attempts - 1:
                 await asyncio.sleep(self.retry_delay)
         
         default_text = self.loc.t("slide_default")
@@ -174,7 +206,7 @@ class AIService:
         
         return True
     
-    async def generate_slide_content(self, slide_title: str, section_title: str, language: str = None) -> str:
+    async def generate_slide_content(self, slide_title: str, section_title: str, language: str = None, on_token: Optional[Callable[[int], None]] = None) -> str:
         if language is None:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
@@ -184,24 +216,74 @@ class AIService:
             current_date=get_current_date(),
             language=language
         )
+        system_prompt = self.loc.get_system_prompt("slide_content", language)
         
-        for attempt in range(self.max_attempts):
-            response = await self._make_request(prompt, temperature=0.5)
+        max_attempts = self._attempt_limit()
+        for attempt in range(max_attempts):
+            response = await self._make_request(prompt, temperature=0.5, use_cache=attempt == 0, on_token=on_token, prompt_type="slide_content", system_prompt=system_prompt)
             if not response:
                 continue
                 
-            parsed = self._parse_json_response(response)
+            parsed = self._parse_json_response(response, "slide_content")
             if parsed and 'content' in parsed:
                 content = parsed['content']
                 if self._is_valid_content(content) and not self._is_placeholder_content(content):
                     return content
             
-            if attempt < self.max_attempts - 1:
+            if attempt < max_attempts - 1:
                 await asyncio.sleep(self.retry_delay)
         
         default_text = self.loc.t("slide_content_default")
         return f"{default_text} '{slide_title}'"
     
+    async def generate_section_content(self, section_title: str, presentation_title: str, count: int, language: str = None, on_token: Optional[Callable[[int], None]] = None) -> List[dict]:
+        if language is None:
+            language = self.loc.t('language_russian')
+        prompt = self.loc.get_prompt(
+            "section_content",
+            count=count,
+            section_title=section_title,
+            presentation_title=presentation_title,
+            current_date=get_current_date(),
+            language=language
+        )
+        max_completion_tokens = self.section_tokens_per_slide * count + 200
+        
+        max_attempts = self._attempt_limit()
+        for attempt in range(max_attempts):
+            response = await self._make_request(
+                prompt,
+                temperature=0.5,
+                use_cache=attempt == 0,
+                on_token=on_token,
+                max_completion_tokens=max_completion_tokens,
+                prompt_type="section_content"
+            )
+            if not response:
+                continue
+            
+            parsed = self._parse_json_response(response, "section_content")
+            if parsed and isinstance(parsed.get('slides'), list):
+                slides = []
+                for item in parsed['slides']:
+                    if not isinstance(item, dict):
+                        continue
+                    title = item.get('title')
+                    if not isinstance(title, str) or not self._is_valid_slide_title(title):
+                        continue
+                    content = item.get('content')
+                    if not isinstance(content, str) or not self._is_valid_content(content) or self._is_placeholder_content(content):
+                        content = None
+                    slides.append({'title': title.strip(), 'content': content})
+                
+                if len(slides) >= count:
+                    return slides[:count]
+            
+            if attempt < max_attempts - 1:
+                await asyncio.sleep(self.retry_delay)
+        
+        return []
+    
     def _is_placeholder_content(self, content: str) -> bool:
         if not content or len(content.strip()) < 15:
             return True
@@ -248,16 +330,17 @@ class AIService:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
             "presentation_summary",
+            language=language,
             title=presentation_title,
             current_date=get_current_date()
         )
         
-        response = await self._make_request(prompt, temperature=0.7)
+        response = await self._make_request(prompt, temperature=0.7, prompt_type="presentation_summary")
         if not response:
             default_text = self.loc.t("presentation_topic")
             return f"{default_text} {presentation_title}"
             
-        parsed = self._parse_json_response(response)
+        parsed = self._parse_json_response(response, "presentation_summary")
         if parsed and 'summary' in parsed:
             return parsed['summary']
         
@@ -269,14 +352,15 @@ class AIService:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
             "title_slide_header",
+            language=language,
             topic=topic
         )
         
-        response = await self._make_request(prompt, temperature=0.8)
+        response = await self._make_request(prompt, temperature=0.8, prompt_type="title_slide_header")
         if not response:
             return topic
             
-        parsed = self._parse_json_response(response)
+        parsed = self._parse_json_response(response, "title_slide_header")
         if parsed and 'title' in parsed:
             return parsed['title']
         
@@ -287,17 +371,18 @@ class AIService:
             language = self.loc.t('language_russian')
         prompt = self.loc.get_prompt(
             "conclusion_slide",
+            language=language,
             presentation_title=presentation_title
         )
         
-        response = await self._make_request(prompt, temperature=0.7)
+        response = await self._make_request(prompt, temperature=0.7, prompt_type="conclusion_slide")
         if not response:
             return {
                 "title": self.loc.t("conclusion") if language == self.loc.t('language_russian') else "Conclusion",
                 "content": f"{self.loc.t('thank_you_attention')} '{presentation_title}' завершена."
             }
             
-        parsed = self._parse_json_response(response)
+        parsed = self._parse_json_response(response, "conclusion_slide")
         if parsed and 'title' in parsed and 'content' in parsed:
             return {"title": parsed['title'], "content": parsed['content']}
         
@@ -306,7 +391,7 @@ class AIService:
             "content": f"{self.loc.t('thank_you_attention')} '{presentation_title}' завершена."
         }
     
-    async def enhance_content_with_web_info(self, base_content: str, web_summary: str, slide_title: str, language: str = None) -> str:
+    async def enhance_content_with_web_info(self, base_content: str, web_summary: str, slide_title: str, language: str = None, on_token: Optional[Callable[[int], None]] = None) -> str:
         if language is None:
             language = self.loc.t('language_russian')
         if not web_summary or len(web_summary.strip()) < 20:
@@ -314,152 +399,28 @@ class AIService:
             
         prompt = self.loc.get_prompt(
             "web_enhanced_content",
+            language=language,
             base_content=base_content,
             web_summary=web_summary,
             slide_title=slide_title
         )
         
-        for attempt in range(self.max_attempts):
-            response = await self._make_request(prompt, temperature=0.7)
+        max_attempts = self._attempt_limit()
+        for attempt in range(max_attempts):
+            response = await self._make_request(prompt, temperature=0.7, use_cache=attempt == 0, on_token=on_token, prompt_type="web_enhanced_content")
             if not response:
                 continue
                 
-            parsed = self._parse_json_response(response)
+            parsed = self._parse_json_response(response, "web_enhanced_content")
             if parsed and 'content' in parsed:
                 enhanced_content = parsed['content']
                 if self._is_valid_content(enhanced_content):
                     return enhanced_content
             
-            if attempt < self.max_attempts - 1:
+            if attempt < max_attempts - 1:
                 await asyncio.sleep(self.retry_delay)
         
         return base_content
     
     def fix_line_breaks(self, content: str, language: str = None) -> str:
-        if language is None:
-            language = self.loc.t('language_russian')
-        if not content or len(content.strip()) < 10:
-            return content
-        
-        if content.strip().startswith('TABLE|'):
-            return content
-        
-        content = self._clean_markdown(content)
-        return self._add_line_breaks_manually(content)
-    
-    def _clean_markdown(self, content: str) -> str:
-        import re
-        
-        if not content:
-            return content
-        
-        content = re.sub(r'\*\*(.*?)\*\*', r'\1', content)
-        content = re.sub(r'\*(.*?)\*', r'\1', content)
-        content = re.sub(r'__(.*?)__', r'\1', content)
-        content = re.sub(r'_(.*?)_', r'\1', content)
-        content = re.sub(r'~~(.*?)~~', r'\1', content)
-        content = re.sub(r'`(.*?)`', r'\1', content)
-        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-        content = re.sub(r'```.*', '', content, flags=re.DOTALL)
-        content = re.sub(r'#{1,6}\s*', '', content)
-        content = re.sub(r'^\s*[-*+]\s*', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^\s*\d+\.\s*', '', content, flags=re.MULTILINE)
-        content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)
-        content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)
-        content = re.sub(r'^---+$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^\s*>\s*', '', content, flags=re.MULTILINE)
-        content = re.sub(r'^\s*\|.*\|.*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'\n\s*\n\s*\n+', '\n\n', content)
-        content = content.strip()
-        
-        return content
-    
-    def _add_line_breaks_manually(self, content: str) -> str:
-        if not content:
-            return content
-        
-        import re
-        
-        lines = []
-        
-        if ':' in content and any(word in content.lower() for word in ['основные', 'ключевые', 'главные', 'важные', 'преимущества', 'недостатки', 'этапы', 'шаги', 'причины', 'результаты', 'направления', 'включают', 'будет', 'рост', 'повышение', 'новые', 'этапы роста', 'олицетворяли', 'символизировал', 'подчеркивает', 'выражает', 'оборачивался']):
-            parts = content.split(':', 1)
-            if len(parts) == 2:
-                lines.append(parts[0].strip() + ':')
-                items_text = parts[1].strip()
-                
-                if '•' in items_text:
-                    items = [item.strip() for item in items_text.split('•') if item.strip()]
-                    for item in items:
-                        if item:
-                            lines.append('• ' + item)
-                else:
-                    items = [item.strip() for item in items_text.replace('.', '').split(',') if item.strip()]
-                    for item in items:
-                        if item:
-                            lines.append('• ' + item)
-            else:
-                lines.append(content)
-        else:
-            sentences = re.split(r'[.!?]\s+', content)
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if sentence:
-                    if not sentence.endswith(('.', '!', '?')):
-                        sentence += '.'
-                    
-                    if '•' in sentence:
-                        parts = sentence.split('•')
-                        if len(parts) > 1:
-                            lines.append(parts[0].strip())
-                            for part in parts[1:]:
-                                part = part.strip()
-                                if part:
-                                    lines.append('• ' + part)
-                        else:
-                            lines.append(sentence)
-                    elif any(word in sentence.lower() for word in ['позволяющее', 'зависит', 'такие как', 'в то время как', 'отличаются', 'потерей', 'беспомощность', 'утрату', 'каждый', 'уравнение', 'технологический', 'разрушение', 'сломанный']) and ',' in sentence:
-                        parts = sentence.split(',', 1)
-                        if len(parts) == 2:
-                            lines.append(parts[0].strip())
-                            items = [item.strip() for item in parts[1].replace('.', '').split(',') if item.strip()]
-                            for item in items:
-                                if item:
-                                    lines.append('• ' + item)
-                        else:
-                            lines.append(sentence)
-                    else:
-                        lines.append(sentence)
-        
-        result_lines = []
-        for line in lines:
-            if len(line) > 45:
-                words = line.split()
-                current_line = ""
-                for i, word in enumerate(words):
-                    if len(current_line + " " + word) <= 45:
-                        if current_line:
-                            current_line += " " + word
-                        else:
-                            current_line = word
-                    else:
-                        if current_line:
-                            last_word = current_line.split()[-1] if current_line.split() else ""
-                            if len(last_word) < 3 and i < len(words) - 1 and len(current_line + " " + word) <= 50:
-                                current_line += " " + word
-                            else:
-                                result_lines.append(current_line)
-                                current_line = word
-                        else:
-                            current_line = word
-                if current_line:
-                    result_lines.append(current_line)
-            else:
-                result_lines.append(line)
-        
-        result = '\n'.join(result_lines)
-        
-        if len(result) < len(content) * 0.7:
-            return content
-            
-        return result
\ No newline at end of file
+        return self.text_normalizer.normalize(content)
\ No newline at end of file
@@ -0,0 +1,101 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+from .token_usage import TokenUsage
+
+_current_budget: ContextVar[Optional["DeckBudget"]] = ContextVar("current_budget", default=None)
+
+LEVELS = ["normal", "no_web", "single_attempt", "exhausted"]
+
+
+class DeckBudget:
+    def __init__(
+        self,
+        deadline_seconds: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        usage: Optional[TokenUsage] = None,
+        skip_web_at: float = 0.5,
+        single_attempt_at: float = 0.75
+    ):
+        self.deadline_seconds = float(deadline_seconds) if deadline_seconds and deadline_seconds > 0 else None
+        self.token_budget = int(token_budget) if token_budget and token_budget > 0 else None
+        self.usage = usage
+        self.skip_web_at = skip_web_at
+        self.single_attempt_at = single_attempt_at
+        self.started_at = time.monotonic()
+        self.start_tokens = usage.totals()['total_tokens'] if usage else 0
+        self.worst_level = "normal"
+        self.stats = {
+            'web_skipped': 0,
+            'requests_skipped': 0,
+            'requests_cut': 0
+        }
+        self._token = None
+    
+    @property
+    def enabled(self) -> bool:
+        return self.deadline_seconds is not None or self.token_budget is not None
+    
+    @property
+    def deadline_at(self) -> Optional[float]:
+        if self.deadline_seconds is None:
+            return None
+        return self.started_at + self.deadline_seconds
+    
+    def tokens_spent(self) -> int:
+        if not self.usage:
+            return 0
+        return self.usage.totals()['total_tokens'] - self.start_tokens
+    
+    def spent(self) -> float:
+        fractions = [0.0]
+        if self.deadline_seconds is not None:
+            fractions.append((time.monotonic() - self.started_at) / self.deadline_seconds)
+        if self.token_budget is not None:
+            fractions.append(self.tokens_spent() / self.token_budget)
+        return max(fractions)
+    
+    def level(self) -> str:
+        spent = self.spent()
+        if spent >= 1:
+            return "exhausted"
+        if spent >= self.single_attempt_at:
+            return "single_attempt"
+        if spent >= self.skip_web_at:
+            return "no_web"
+        return "normal"
+    
+    def _observe(self) -> str:
+        level = self.level()
+        if LEVELS.index(level) > LEVELS.index(self.worst_level):
+            self.worst_level = level
+        return level
+    
+    def allows_web_search(self) -> bool:
+        return self._observe() == "normal"
+    
+    def max_attempts(self, default: int) -> int:
+        return 1 if self._observe() in ("single_attempt", "exhausted") else default
+    
+    def exhausted(self) -> bool:
+        return self._observe() == "exhausted"
+    
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['level'] = self.worst_level
+        stats['elapsed_seconds'] = round(time.monotonic() - self.started_at, 1)
+        stats['deadline_seconds'] = self.deadline_seconds
+        stats['tokens_spent'] = self.tokens_spent()
+        stats['token_budget'] = self.token_budget
+        return stats
+    
+    def __enter__(self) -> "DeckBudget":
+        self._token = _current_budget.set(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_budget.reset(self._token)
+
+
+def get_current_budget() -> Optional[DeckBudget]:
+    return _current_budget.get()
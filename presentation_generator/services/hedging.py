@@ -0,0 +1,142 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyHistogram:
+    def __init__(self, max_samples: int = 200):
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+    
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+        self.count += 1
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+        return ordered[index]
+    
+    def get_stats(self) -> dict:
+        return {
+            'count': self.count,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99)
+        }
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        enabled: bool = True,
+        percentile: float = 95,
+        budget_ratio: float = 0.1,
+        min_samples: int = 20,
+        min_delay: float = 1.0,
+        max_delay: float = 30.0
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.stats = {
+            'requests': 0,
+            'hedged': 0,
+            'hedge_wins': 0,
+            'budget_exhausted': 0
+        }
+    
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        percentile: Optional[float] = None,
+        budget_ratio: Optional[float] = None
+    ) -> None:
+        if enabled is not None:
+            self.enabled = enabled
+        if percentile is not None:
+            self.percentile = min(99.9, max(50.0, float(percentile)))
+        if budget_ratio is not None:
+            self.budget_ratio = max(0.0, float(budget_ratio))
+    
+    def record(self, prompt_type: str, seconds: float) -> None:
+        if prompt_type not in self.histograms:
+            self.histograms[prompt_type] = LatencyHistogram()
+        self.histograms[prompt_type].record(seconds)
+    
+    def hedge_delay(self, prompt_type: Optional[str]) -> Optional[float]:
+        if not self.enabled or not prompt_type:
+            return None
+        
+        histogram = self.histograms.get(prompt_type)
+        if not histogram or len(histogram.samples) < self.min_samples:
+            return None
+        
+        return min(self.max_delay, max(self.min_delay, histogram.percentile(self.percentile)))
+    
+    def try_hedge(self) -> bool:
+        if self.stats['hedged'] + 1 > self.budget_ratio * self.stats['requests']:
+            self.stats['budget_exhausted'] += 1
+            return False
+        self.stats['hedged'] += 1
+        return True
+    
+    async def run(
+        self,
+        prompt_type: Optional[str],
+        send: Callable[[bool], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        self.stats['requests'] += 1
+        delay = self.hedge_delay(prompt_type)
+        
+        primary = asyncio.ensure_future(send(False))
+        if delay is None:
+            return await primary
+        
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if not done and self.try_hedge():
+                pending.add(asyncio.ensure_future(send(True)))
+            
+            failure: Optional[BaseException] = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is not None:
+                        failure = failure or task.exception()
+                        continue
+                    if task.result() is not None:
+                        if task is not primary:
+                            self.stats['hedge_wins'] += 1
+                        return task.result()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            
+            if failure is not None:
+                raise failure
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['latency'] = {prompt_type: histogram.get_stats() for prompt_type, histogram in self.histograms.items()}
+        return stats
+
+
+_hedge_policy = HedgePolicy()
+
+def get_hedge_policy() -> HedgePolicy:
+    return _hedge_policy
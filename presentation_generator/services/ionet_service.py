@@ -3,22 +3,77 @@ import time
 import aiohttp
 import asyncio
 import warnings
-from typing import Optional
+import contextlib
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple
 from ..localization.manager import get_localization_manager
+from .response_cache import ResponseCache
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .json_stream import IncrementalJsonParser
+from .hedging import HedgePolicy, get_hedge_policy
+from .retry_policy import CircuitOpenError, RetryPolicy, get_retry_policy
+from .tracing import get_tracer
+from .token_usage import get_usage_tracker
+from .json_extractor import get_json_extractor
 
 warnings.filterwarnings('ignore', category=UnicodeWarning)
 
 
 class IoNetService:
-    def __init__(self, api_key: str, model: str = "meta-llama/Llama-3.3-70B-Instruct"):
+    def __init__(self, api_key: str, model: str = "meta-llama/Llama-3.3-70B-Instruct", base_url: str = "https://api.intelligence.io.solutions/api/v1", response_cache: Optional[ResponseCache] = None, rate_limiter: Optional[RateLimiter] = None, stream: bool = False, hedge_policy: Optional[HedgePolicy] = None, retry_policy: Optional[RetryPolicy] = None):
         self.api_key = api_key
         self.model = model
-        self.base_url = "https://api.intelligence.io.solutions/api/v1"
-        self.max_attempts = 3
-        self.retry_delay = 1.0
+        self.base_url = base_url
+        self.connection_limit = 32
+        self.connection_limit_per_host = 16
+        self.keepalive_timeout = 60
+        self.dns_cache_ttl = 300
         self.loc = get_localization_manager()
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.hedge_policy = hedge_policy or get_hedge_policy()
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.tracer = get_tracer()
+        self.usage_tracker = get_usage_tracker()
+        self.json_extractor = get_json_extractor()
+        self.stream = stream
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._session and not self._session.closed and self._session_loop is loop:
+            return
         
-    async def _make_request(self, messages: list, temperature: float = 0.7) -> Optional[str]:
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._session_loop = loop
+    
+    async def close(self) -> None:
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        if session and not session.closed:
+            await session.close()
+    
+    async def __aenter__(self) -> "IoNetService":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if not self._session or self._session.closed or self._session_loop is not asyncio.get_running_loop():
+            await self.start()
+        return self._session
+    
+    def _build_request(self, messages: list, temperature: float, stream: bool, max_completion_tokens: int = 800) -> tuple:
         headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
@@ -28,77 +83,224 @@ class IoNetService:
             "model": self.model,
             "messages": messages,
             "temperature": temperature,
-            "max_completion_tokens": 800,
-            "stream": False
+            "max_completion_tokens": max_completion_tokens,
+            "stream": stream
         }
+        if stream:
+            data["stream_options"] = {"include_usage": True}
         
-        for attempt in range(self.max_attempts):
+        return headers, data
+    
+    async def _check_response_status(self, response: aiohttp.ClientResponse) -> None:
+        if response.status == 401:
+            try:
+                error_text = await response.text()
+            except:
+                error_text = self.loc.t("error_invalid_api_key")
+            raise Exception(f"{self.loc.t('error_invalid_api_key')} (401): {error_text}")
+        elif response.status == 400:
+            try:
+                error_data = await response.json()
+                error_detail = error_data.get("detail", "")
+                if "does not support Chat Completions API" in error_detail:
+                    supported_models = error_data.get("Supported models", [])
+                    if supported_models:
+                        models_list = ", ".join(supported_models[:5])
+                        error_msg = f"{self.loc.t('error_model_not_supported')}. {self.loc.t('error_model_suggestion')}. {self.loc.t('error_supported_models')}: {models_list}..."
+                    else:
+                        error_msg = f"{self.loc.t('error_model_not_supported')}. {self.loc.t('error_switch_model')}."
+                    raise Exception(error_msg)
+                else:
+                    raise Exception(f"API error 400: {error_detail}")
+            except json.JSONDecodeError:
+                error_text = await response.text()
+                raise Exception(f"API error 400: {error_text}")
+        elif response.status != 200:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{self.base_url}/chat/completions",
-                        headers=headers,
-                        json=data,
-                        timeout=30
-                    ) as response:
-                        if response.status == 401:
-                            try:
-                                error_text = await response.text()
-                            except:
-                                error_text = self.loc.t("error_invalid_api_key")
-                            raise Exception(f"{self.loc.t('error_invalid_api_key')} (401): {error_text}")
-                        elif response.status == 429:
-                            if attempt < self.max_attempts - 1:
-                                await asyncio.sleep(self.retry_delay * (attempt + 1) * 2)
-                                continue
-                            raise Exception(self.loc.t("error_rate_limit"))
-                        elif response.status == 400:
-                            try:
-                                error_data = await response.json()
-                                error_detail = error_data.get("detail", "")
-                                if "does not support Chat Completions API" in error_detail:
-                                    supported_models = error_data.get("Supported models", [])
-                                    if supported_models:
-                                        models_list = ", ".join(supported_models[:5])
-                                        error_msg = f"{self.loc.t('error_model_not_supported')}. {self.loc.t('error_model_suggestion')}. {self.loc.t('error_supported_models')}: {models_list}..."
-                                    else:
-                                        error_msg = f"{self.loc.t('error_model_not_supported')}. {self.loc.t('error_switch_model')}."
-                                    raise Exception(error_msg)
-                                else:
-                                    raise Exception(f"API error 400: {error_detail}")
-                            except json.JSONDecodeError:
-                                error_text = await response.text()
-                                raise Exception(f"API error 400: {error_text}")
-                        elif response.status != 200:
-                            try:
-                                error_text = await response.text()
-                            except:
-                                error_text = f"HTTP {response.status}"
-                            raise Exception(f"{self.loc.t('error_api_error')} {response.status}: {error_text}")
-                        
-                        result = await response.json()
-                        content = result["choices"][0]["message"]["content"]
-                        if isinstance(content, str):
-                            try:
-                                return content.strip()
-                            except UnicodeDecodeError:
-                                return content.encode('utf-8', errors='ignore').decode('utf-8').strip()
-                        return str(content).strip()
+                error_text = await response.text()
+            except:
+                error_text = f"HTTP {response.status}"
+            raise Exception(f"{self.loc.t('error_api_error')} {response.status}: {error_text}")
+    
+    def _request_error(self, e: Exception) -> Exception:
+        if isinstance(e, CircuitOpenError):
+            return e
+        elif isinstance(e, asyncio.TimeoutError):
+            return Exception(self.loc.t("error_timeout"))
+        elif "Invalid API key" in str(e) or "401" in str(e):
+            return Exception(self.loc.t("error_invalid_api_key"))
+        elif "Rate limit" in str(e) or "429" in str(e):
+            return Exception(self.loc.t("error_rate_limit"))
+        elif "API error" in str(e):
+            return e
+        else:
+            return Exception(f"{self.loc.t('error_network')}: {str(e)}")
+    
+    def _is_retryable(self, e: Exception) -> bool:
+        message = str(e)
+        return not (
+            self.loc.t("error_invalid_api_key") in message
+            or self.loc.t("error_model_not_supported") in message
+            or "API error 400" in message
+        )
+    
+    def _trips_breaker(self, e: Exception) -> bool:
+        return self._is_retryable(e) and self.loc.t("error_rate_limit") not in str(e)
+    
+    async def _with_retries(self, operation: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        try:
+            return await self.retry_policy.run(operation, self._is_retryable, self._trips_breaker)
+        except Exception as e:
+            raise self._request_error(e)
+    
+    def _clean_content(self, content) -> str:
+        if isinstance(content, str):
+            try:
+                return content.strip()
+            except UnicodeDecodeError:
+                return content.encode('utf-8', errors='ignore').decode('utf-8').strip()
+        return str(content).strip()
+    
+    async def _make_request(self, messages: list, temperature: float = 0.7, max_completion_tokens: int = 800, prompt_type: Optional[str] = None, completion: Optional[dict] = None) -> Optional[str]:
+        headers, data = self._build_request(messages, temperature, stream=False, max_completion_tokens=max_completion_tokens)
+        reserved_tokens = self._estimate_tokens(messages, data["max_completion_tokens"])
+        attempt_number = 0
+        
+        async def attempt() -> Optional[str]:
+            nonlocal attempt_number
+            attempt_number += 1
+            with self.tracer.span("llm.attempt", "llm", attempt=attempt_number, stream=False) as span:
+                started_at = time.perf_counter()
+                session = await self._get_session()
+                async with self.rate_limiter.reserve(reserved_tokens) as reservation, session.post(
+                    f"{self.base_url}/chat/completions",
+                    headers=headers,
+                    json=data
+                ) as response:
+                    span.set(status=response.status)
+                    if response.status == 429:
+                        self.rate_limiter.on_rate_limited(response.headers)
+                        raise Exception(self.loc.t("error_rate_limit"))
+                    await self._check_response_status(response)
+                    
+                    result = await response.json()
+                    usage = result.get("usage") or {}
+                    reservation.used_tokens = usage.get("total_tokens")
+                    span.set(total_tokens=reservation.used_tokens)
+                    self.rate_limiter.on_success(response.headers)
+                    choice = result["choices"][0]
+                    content = self._clean_content(choice["message"]["content"])
+                    self.usage_tracker.record(prompt_type, usage, self._prompt_chars(messages), len(content))
+                    if completion is not None:
+                        completion['finish_reason'] = choice.get("finish_reason")
+                    self._record_latency(prompt_type, started_at)
+                    return content
+        
+        return await self._with_retries(attempt)
+    
+    async def stream_tokens(self, messages: list, temperature: float = 0.7, max_completion_tokens: int = 800, usage_sink: Optional[dict] = None, completion_sink: Optional[dict] = None) -> AsyncIterator[str]:
+        headers, data = self._build_request(messages, temperature, stream=True, max_completion_tokens=max_completion_tokens)
+        reserved_tokens = self._estimate_tokens(messages, data["max_completion_tokens"])
+        
+        session = await self._get_session()
+        async with self.rate_limiter.reserve(reserved_tokens) as reservation, session.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=data,
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+        ) as response:
+            if response.status == 429:
+                self.rate_limiter.on_rate_limited(response.headers)
+                raise Exception(self.loc.t("error_rate_limit"))
+            await self._check_response_status(response)
+            self.rate_limiter.on_success(response.headers)
+            
+            if response.content_type != "text/event-stream":
+                result = await response.json(content_type=None)
+                usage = result.get("usage") or {}
+                reservation.used_tokens = usage.get("total_tokens")
+                if usage_sink is not None:
+                    usage_sink.update(usage)
+                choice = result["choices"][0]
+                if completion_sink is not None:
+                    completion_sink['finish_reason'] = choice.get("finish_reason")
+                content = choice["message"]["content"]
+                if content:
+                    yield str(content)
+                return
+            
+            async for raw_line in response.content:
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                if not line.startswith("data:"):
+                    continue
+                
+                payload = line[5:].strip()
+                if payload == "[DONE]":
+                    break
                 
-            except Exception as e:
-                if attempt < self.max_attempts - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                try:
+                    chunk = json.loads(payload)
+                except json.JSONDecodeError:
                     continue
-                if "Invalid API key" in str(e) or "401" in str(e):
-                    raise Exception(self.loc.t("error_invalid_api_key"))
-                elif "Rate limit" in str(e) or "429" in str(e):
-                    raise Exception(self.loc.t("error_rate_limit"))
-                elif "API error" in str(e):
-                    raise e
-                else:
-                    raise Exception(f"{self.loc.t('error_network')}: {str(e)}")
                 
-        return None
+                usage = chunk.get("usage")
+                if usage:
+                    reservation.used_tokens = usage.get("total_tokens")
+                    if usage_sink is not None:
+                        usage_sink.update(usage)
+                
+                for choice in chunk.get("choices") or []:
+                    if choice.get("finish_reason") and completion_sink is not None:
+                        completion_sink['finish_reason'] = choice["finish_reason"]
+                    token = (choice.get("delta") or {}).get("content")
+                    if token:
+                        yield token
+    
+    async def _make_streaming_request(self, messages: list, temperature: float = 0.7, on_token: Optional[Callable[[int], None]] = None, max_completion_tokens: int = 800, prompt_type: Optional[str] = None, completion: Optional[dict] = None) -> Optional[str]:
+        attempt_number = 0
+        
+        async def attempt() -> Optional[str]:
+            nonlocal attempt_number
+            attempt_number += 1
+            with self.tracer.span("llm.attempt", "llm", attempt=attempt_number, stream=True) as span:
+                started_at = time.perf_counter()
+                parser = IncrementalJsonParser(lambda parsed: self.json_extractor.matches_schema(parsed, prompt_type))
+                token_count = 0
+                usage = {}
+                finish = {}
+                async with contextlib.aclosing(self.stream_tokens(messages, temperature, max_completion_tokens, usage, finish)) as tokens:
+                    async for token in tokens:
+                        token_count += 1
+                        if token_count == 1:
+                            span.set(first_token_ms=round((time.perf_counter() - started_at) * 1000, 1))
+                        if on_token:
+                            on_token(token_count)
+                        if parser.feed(token) is not None:
+                            break
+                
+                span.set(tokens_received=token_count, closed_early=parser.json_text is not None)
+                self.usage_tracker.record(prompt_type, usage, self._prompt_chars(messages), len(parser.buffer))
+                if completion is not None:
+                    completion['finish_reason'] = "stop" if parser.json_text is not None else finish.get('finish_reason')
+                if parser.json_text is not None:
+                    self._record_latency(prompt_type, started_at)
+                    return parser.json_text
+                if parser.buffer.strip():
+                    self._record_latency(prompt_type, started_at)
+                    return self._clean_content(parser.buffer)
+                return None
+        
+        return await self._with_retries(attempt)
+    
+    def _record_latency(self, prompt_type: Optional[str], started_at: float) -> None:
+        if prompt_type:
+            self.hedge_policy.record(prompt_type, time.perf_counter() - started_at)
+    
+    def _prompt_chars(self, messages: list) -> int:
+        return sum(len(str(message.get("content", ""))) for message in messages)
+    
+    def _estimate_tokens(self, messages: list, max_completion_tokens: int) -> int:
+        return self._prompt_chars(messages) // 4 + max_completion_tokens
     
     async def test_api_key(self) -> bool:
         try:
@@ -117,21 +319,38 @@ class IoNetService:
                 return False
             return False
     
-    async def generate_response(self, prompt: str, temperature: float = 0.7) -> Optional[str]:
+    async def generate_response(self, prompt: str, temperature: float = 0.7, use_cache: bool = True, on_token: Optional[Callable[[int], None]] = None, max_completion_tokens: int = 800, prompt_type: Optional[str] = None, system_prompt: Optional[str] = None) -> Optional[str]:
         messages = [{"role": "user", "content": prompt}]
-        return await self._make_request(messages, temperature)
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        with self.tracer.span("llm.generate", "llm", prompt_type=prompt_type, model=self.model, prompt_bytes=len(prompt.encode('utf-8')), system_bytes=len(system_prompt.encode('utf-8')) if system_prompt else 0) as span:
+            cache_key = None
+            if self.response_cache:
+                cache_key = self.response_cache.make_key(self.model, messages, temperature, max_completion_tokens)
+                if use_cache:
+                    cached_response = self.response_cache.get(cache_key)
+                    if cached_response is not None:
+                        span.set(cache_hit=True, response_bytes=len(cached_response.encode('utf-8')))
+                        return cached_response
+            
+            response, finish_reason = await self._request(messages, temperature, on_token, max_completion_tokens, prompt_type)
+            span.set(cache_hit=False, response_bytes=len(response.encode('utf-8')) if response else 0, finish_reason=finish_reason)
+            if cache_key and response and finish_reason == "stop" and self.json_extractor.parses_cleanly(response, prompt_type):
+                self.response_cache.set(cache_key, response)
+            return response
     
-    def parse_json_response(self, response_text: str) -> Optional[dict]:
-        try:
-            cleaned_response = response_text.replace('\n', '').replace('\r', '')
-            return json.loads(cleaned_response)
-        except json.JSONDecodeError:
-            try:
-                start_idx = cleaned_response.find('{')
-                end_idx = cleaned_response.rfind('}') + 1
-                if start_idx != -1 and end_idx != 0:
-                    json_part = cleaned_response[start_idx:end_idx]
-                    return json.loads(json_part)
-            except json.JSONDecodeError:
-                pass
-        return None
+    async def _request(self, messages: list, temperature: float, on_token: Optional[Callable[[int], None]] = None, max_completion_tokens: int = 800, prompt_type: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        async def send(is_hedge: bool) -> Optional[Tuple[str, Optional[str]]]:
+            completion = {}
+            if self.stream:
+                content = await self._make_streaming_request(messages, temperature, None if is_hedge else on_token, max_completion_tokens, prompt_type, completion)
+            else:
+                content = await self._make_request(messages, temperature, max_completion_tokens, prompt_type, completion)
+            if content is None:
+                return None
+            return content, completion.get('finish_reason')
+        
+        return await self.hedge_policy.run(prompt_type, send) or (None, None)
+    
+    def parse_json_response(self, response_text: str, prompt_type: Optional[str] = None) -> Optional[dict]:
+        return self.json_extractor.extract(response_text, prompt_type)
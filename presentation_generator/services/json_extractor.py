@@ -0,0 +1,214 @@
+import re
+import ast
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+THINK_PATTERN = re.compile(r"<think>.*?(?:</think>|$)", re.DOTALL)
+FENCE_PATTERN = re.compile(r"```[ \t]*(?:json|JSON|javascript|js)?[ \t]*\n?(.*?)(?:```|$)", re.DOTALL)
+SMART_QUOTES = str.maketrans({'“': '"', '”': '"', '„': '"', '«': '"', '»': '"'})
+
+SCHEMAS: Dict[str, Dict[str, type]] = {
+    "section_titles": {"titles": list},
+    "slide_titles": {"titles": list},
+    "slide_content": {"content": str},
+    "section_content": {"slides": list},
+    "presentation_summary": {"summary": str},
+    "title_slide_header": {"title": str},
+    "conclusion_slide": {"title": str, "content": str},
+    "web_enhanced_content": {"content": str},
+    "generate_filename": {"filename": str}
+}
+
+
+class JsonExtractor:
+    def __init__(self):
+        self.stats = {
+            'parsed': 0,
+            'repaired': 0,
+            'rejected': 0,
+            'failed': 0
+        }
+    
+    def extract(self, text: Optional[str], prompt_type: Optional[str] = None) -> Optional[dict]:
+        if not text:
+            return None
+        
+        result, outcome = self._extract(text, prompt_type)
+        self.stats[outcome] += 1
+        return result
+    
+    def matches_schema(self, parsed: dict, prompt_type: Optional[str] = None) -> bool:
+        schema = SCHEMAS.get(prompt_type) if prompt_type else None
+        return self._validate(parsed, schema) is not None
+    
+    def parses_cleanly(self, text: Optional[str], prompt_type: Optional[str] = None) -> bool:
+        if not text:
+            return False
+        return self._extract(text, prompt_type)[1] == 'parsed'
+    
+    def _extract(self, text: str, prompt_type: Optional[str]) -> Tuple[Optional[dict], str]:
+        schema = SCHEMAS.get(prompt_type) if prompt_type else None
+        fallback_list: Optional[list] = None
+        rejected = False
+        
+        for candidate, truncated in self._candidates(text):
+            parsed, repaired = self._load(candidate, truncated)
+            if isinstance(parsed, list) and fallback_list is None and parsed and all(isinstance(item, (str, dict)) for item in parsed):
+                fallback_list = parsed
+            if not isinstance(parsed, dict):
+                continue
+            
+            validated = self._validate(parsed, schema)
+            if validated is None:
+                rejected = True
+                continue
+            
+            return validated, 'repaired' if repaired else 'parsed'
+        
+        if fallback_list is not None and schema:
+            list_keys = [key for key, expected in schema.items() if expected is list]
+            if len(schema) == 1 and list_keys:
+                return {list_keys[0]: fallback_list}, 'repaired'
+        
+        return None, 'rejected' if rejected else 'failed'
+    
+    def _validate(self, parsed: dict, schema: Optional[Dict[str, type]]) -> Optional[dict]:
+        if not schema:
+            return parsed
+        
+        lowered = {str(key).strip().lower(): key for key in parsed}
+        result = dict(parsed)
+        for key, expected in schema.items():
+            if key not in parsed and key in lowered:
+                result[key] = parsed[lowered[key]]
+            value = result.get(key)
+            if expected is str and isinstance(value, list) and all(isinstance(item, str) for item in value):
+                result[key] = "\n".join(value)
+            elif expected is list and isinstance(value, str) and key == "titles":
+                result[key] = [line.strip(" •-*\t") for line in value.splitlines() if line.strip(" •-*\t")]
+            if not isinstance(result.get(key), expected):
+                return None
+        return result
+    
+    def _candidates(self, text: str) -> Iterator[Tuple[str, bool]]:
+        text = THINK_PATTERN.sub("", text)
+        
+        sources = [match.group(1) for match in FENCE_PATTERN.finditer(text) if match.group(1).strip()]
+        sources.append(text)
+        
+        for source in sources:
+            spans, tail = self._scan(source)
+            for start, end in spans:
+                yield source[start:end], False
+            if tail is not None:
+                yield tail, True
+    
+    def _scan(self, text: str) -> Tuple[List[Tuple[int, int]], Optional[str]]:
+        spans = []
+        stack: List[str] = []
+        start = -1
+        in_string = False
+        escaped = False
+        
+        for position, char in enumerate(text):
+            if start == -1:
+                if char in "{[":
+                    start = position
+                    stack = ['}' if char == '{' else ']']
+                    in_string = False
+                    escaped = False
+                continue
+            
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                stack.append('}' if char == '{' else ']')
+            elif char in "}]":
+                if stack and stack[-1] == char:
+                    stack.pop()
+                if not stack:
+                    spans.append((start, position + 1))
+                    start = -1
+        
+        tail = None
+        if start != -1 and stack:
+            tail = text[start:].rstrip()
+            if in_string:
+                tail += '"'
+            tail = self._strip_trailing_commas(tail.rstrip(",: \n\t")) + "".join(reversed(stack))
+        return spans, tail
+    
+    def _load(self, candidate: str, truncated: bool) -> Tuple[Any, bool]:
+        try:
+            return json.loads(candidate, strict=False), truncated
+        except json.JSONDecodeError:
+            pass
+        
+        repaired = self._strip_trailing_commas(candidate)
+        if '"' not in repaired:
+            repaired = repaired.translate(SMART_QUOTES)
+        try:
+            return json.loads(repaired, strict=False), True
+        except json.JSONDecodeError:
+            pass
+        
+        if "'" in candidate and len(candidate) <= 20000:
+            for variant in (candidate, candidate.replace("\n", "\\n")):
+                try:
+                    literal = ast.literal_eval(variant)
+                except (ValueError, SyntaxError, MemoryError, RecursionError):
+                    continue
+                if isinstance(literal, (dict, list)):
+                    return literal, True
+        
+        return None, False
+    
+    def _strip_trailing_commas(self, text: str) -> str:
+        result = []
+        in_string = False
+        escaped = False
+        length = len(text)
+        position = 0
+        
+        while position < length:
+            char = text[position]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == ',':
+                lookahead = position + 1
+                while lookahead < length and text[lookahead] in " \t\r\n":
+                    lookahead += 1
+                if lookahead < length and text[lookahead] in "}]":
+                    position += 1
+                    continue
+            result.append(char)
+            position += 1
+        
+        return "".join(result)
+    
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+    
+    def reset_stats(self) -> None:
+        for key in self.stats:
+            self.stats[key] = 0
+
+
+_json_extractor = JsonExtractor()
+
+def get_json_extractor() -> JsonExtractor:
+    return _json_extractor
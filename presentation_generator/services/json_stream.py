@@ -0,0 +1,74 @@
+import json
+from typing import Callable, Optional
+
+
+class IncrementalJsonParser:
+    def __init__(self, accept: Optional[Callable[[dict], bool]] = None):
+        self.accept = accept
+        self.buffer = ""
+        self.position = 0
+        self.start = -1
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.think_end = 0
+        self.result: Optional[dict] = None
+        self.json_text: Optional[str] = None
+    
+    def feed(self, chunk: str) -> Optional[dict]:
+        if self.result is not None:
+            return self.result
+        
+        self.buffer += chunk
+        
+        if self.start == -1:
+            think_start = self.buffer.find("<think>", self.think_end)
+            if think_start != -1:
+                think_end = self.buffer.find("</think>", think_start)
+                if think_end == -1:
+                    return None
+                self.think_end = think_end + len("</think>")
+                self.position = max(self.position, self.think_end)
+        
+        while self.position < len(self.buffer):
+            char = self.buffer[self.position]
+            
+            if self.start == -1:
+                if char == '{':
+                    self.start = self.position
+                    self.depth = 1
+            elif self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    candidate = self.buffer[self.start:self.position + 1]
+                    parsed = self._load(candidate)
+                    if isinstance(parsed, dict):
+                        self.start = -1
+                        if self.accept is None or self.accept(parsed):
+                            self.result = parsed
+                            self.json_text = candidate
+                            return parsed
+                    else:
+                        self.position = self.start
+                        self.start = -1
+            
+            self.position += 1
+        
+        return None
+    
+    def _load(self, text: str) -> Optional[dict]:
+        try:
+            return json.loads(text, strict=False)
+        except json.JSONDecodeError:
+            return None
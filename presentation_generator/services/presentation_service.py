@@ -1,14 +1,23 @@
 import sys
 import time
 import asyncio
-from typing import Callable, Optional
+import contextlib
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 from pathlib import Path
 from ..models.presentation import Presentation, Section, Slide
 from ..services.ai_service import AIService
 from ..database.db_manager import DatabaseManager
 from ..services.web_search_service import WebSearchService
 from ..services.summary_service import SummaryService
+from ..services.response_cache import ResponseCache
+from ..services.rate_limiter import get_rate_limiter
+from ..services.hedging import get_hedge_policy
+from ..services.retry_policy import get_retry_policy
+from ..services.tracing import get_tracer
+from ..services.token_usage import TokenUsage, get_usage_tracker
+from ..services.deck_budget import DeckBudget, get_current_budget
 from ..generators.pptx_generator import PPTXGenerator
+from ..generators.batch_renderer import BatchRenderer
 from ..localization.manager import LocalizationManager
 
 def get_resource_path(relative_path):
@@ -19,7 +28,7 @@ def get_resource_path(relative_path):
 
 
 class PresentationService:
-    def __init__(self, api_key: str, ai_model: str = "meta-llama/Llama-3.3-70B-Instruct", output_dir: str = "output", interface_language: str = None):
+    def __init__(self, api_key: str, ai_model: str = "meta-llama/Llama-3.3-70B-Instruct", output_dir: str = "output", interface_language: str = None, data_dir: Optional[str] = None):
         if interface_language is None:
             from ..localization.manager import get_localization_manager
             loc = get_localization_manager()
@@ -29,16 +38,64 @@ class PresentationService:
         
         ai_model = self.settings.get("ai_model", "meta-llama/Llama-3.3-70B-Instruct")
         
-        self.ai_service = AIService(api_key, model=ai_model)
-        self.web_search_service = WebSearchService(self.settings)
-        self.summary_service = SummaryService(api_key, model=ai_model)
-        self.pptx_generator = PPTXGenerator(output_dir=output_dir)
-        self.db_manager = DatabaseManager()
+        self.response_cache = None
+        if self.settings.get("response_cache_enabled", False):
+            self.response_cache = ResponseCache(
+                db_path=Path(data_dir) / "response_cache.db" if data_dir else None,
+                ttl_seconds=float(self.settings.get("response_cache_ttl_hours", 24)) * 3600,
+                max_bytes=int(float(self.settings.get("response_cache_max_mb", 50)) * 1024 * 1024)
+            )
+        
+        get_rate_limiter().configure(
+            requests_per_minute=float(self.settings.get("api_requests_per_minute", 120)),
+            tokens_per_minute=float(self.settings.get("api_tokens_per_minute", 0)),
+            max_concurrency=int(self.settings.get("api_max_concurrency", 16))
+        )
+        get_hedge_policy().configure(
+            enabled=self.settings.get("hedge_requests", True),
+            percentile=float(self.settings.get("hedge_percentile", 95)),
+            budget_ratio=float(self.settings.get("hedge_budget_percent", 10)) / 100
+        )
+        self.tracer = get_tracer()
+        self.tracer.configure(enabled=self.settings.get("tracing_enabled", False))
+        self.usage_tracker = get_usage_tracker()
+        self.retry_policy = get_retry_policy()
+        self.retry_policy.configure(
+            max_attempts=int(self.settings.get("api_max_attempts", 3)),
+            attempt_timeout=float(self.settings.get("api_attempt_timeout", 60)),
+            deadline=float(self.settings.get("api_deadline", 180)),
+            failure_threshold=int(self.settings.get("circuit_failure_threshold", 5)),
+            reset_timeout=float(self.settings.get("circuit_reset_seconds", 30))
+        )
+        
+        self.ai_service = AIService(
+            api_key,
+            model=ai_model,
+            response_cache=self.response_cache,
+            stream=self.settings.get("stream_responses", True),
+            retry_policy=self.retry_policy
+        )
+        self.web_search_service = WebSearchService(self.settings, cache_path=Path(data_dir) / "search_cache.db" if data_dir else None)
+        self.summary_service = SummaryService(api_key, model=ai_model, retry_policy=self.retry_policy)
+        self.pptx_generator = PPTXGenerator(output_dir=output_dir, template_path=self.settings.get("pptx_template_path", "") or None)
+        self.db_manager = DatabaseManager(Path(data_dir) / "presentations.db" if data_dir else None)
         self.loc = LocalizationManager()
-        self.loc.set_language(interface_language)
+        self.loc.set_language(interface_language, persist=False)
         self.avg_step_time = 5.0
         self.step_times = []
         self.developer_mode = self.settings.get("developer_mode", False)
+        self.request_semaphore: Optional[asyncio.Semaphore] = None
+        self.batch_renderer: Optional[BatchRenderer] = None
+    
+    async def start(self) -> None:
+        await self.ai_service.start()
+        await self.summary_service.start()
+        await self.web_search_service.start()
+    
+    async def close(self) -> None:
+        await self.ai_service.close()
+        await self.summary_service.close()
+        await self.web_search_service.close()
     
     async def generate_presentation(
         self, 
@@ -47,11 +104,84 @@ class PresentationService:
         max_slides: int = 4,
         language: str = None,
         enable_web_search: bool = False,
-        progress_callback: Optional[Callable[[str, int, int], None]] = None
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        deadline_seconds: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        smart_filename: bool = True
     ) -> Presentation:
         if language is None:
             language = self.loc.t('language_russian')
+        self._prepare_generation(progress_callback)
+        
+        with self.tracer.span("deck.generate", "deck", title=title, sections=max_sections, slides=max_slides, web_search=enable_web_search) as span:
+            presentation = Presentation(
+                title=title,
+                language=language,
+                max_sections=max_sections,
+                max_slides=max_slides
+            )
+            presentation.id = self.db_manager.create_checkpoint(presentation, enable_web_search)
+            span.set(presentation_id=presentation.id)
+            
+            with self._track_deck(presentation, deadline_seconds, token_budget) as budget:
+                async with self._background_filename(presentation, smart_filename):
+                    presentation = await self._complete_presentation(presentation, enable_web_search, progress_callback)
+                span.set(budget_level=budget.worst_level)
+                return presentation
+    
+    async def resume_presentation(
+        self,
+        presentation_id: int,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        deadline_seconds: Optional[float] = None,
+        token_budget: Optional[int] = None
+    ) -> Presentation:
+        checkpoint = self.db_manager.get_checkpoint(presentation_id)
+        if not checkpoint or checkpoint['status'] != 'in_progress':
+            raise Exception(f"{self.loc.t('checkpoint_not_found')}: {presentation_id}")
+        
+        self._prepare_generation(progress_callback)
+        
+        presentation = checkpoint['presentation']
+        with self.tracer.span("deck.resume", "deck", title=presentation.title, presentation_id=presentation_id), self._track_deck(presentation, deadline_seconds, token_budget):
+            async with self._background_filename(presentation, True):
+                return await self._complete_presentation(presentation, checkpoint['enable_web_search'], progress_callback)
+    
+    @contextlib.contextmanager
+    def _track_deck(self, presentation: Presentation, deadline_seconds: Optional[float], token_budget: Optional[int]):
+        usage = TokenUsage(presentation.token_usage)
+        budget = DeckBudget(
+            deadline_seconds=deadline_seconds if deadline_seconds is not None else float(self.settings.get("deck_deadline_seconds", 0)),
+            token_budget=token_budget if token_budget is not None else int(self.settings.get("deck_token_budget", 0)),
+            usage=usage
+        )
+        with self.usage_tracker.track(usage), budget:
+            try:
+                yield budget
+            except BaseException:
+                self.db_manager.checkpoint_token_usage(presentation.id, presentation.token_usage)
+                raise
+            finally:
+                presentation.budget_stats = budget.get_stats() if budget.enabled else None
+    
+    @contextlib.asynccontextmanager
+    async def _background_filename(self, presentation: Presentation, enabled: bool):
+        task = None
+        if enabled and not presentation.filename:
+            task = asyncio.create_task(self._generate_filename(presentation))
+        try:
+            yield
+            if task:
+                presentation.filename = await task
+                self.db_manager.checkpoint_filename(presentation.id, presentation.filename)
+        finally:
+            if task and not task.done():
+                task.cancel()
+    
+    def _prepare_generation(self, progress_callback: Optional[Callable[[str, int, int], None]]):
         self.developer_mode = self.settings.get("developer_mode", False)
+        if self.response_cache:
+            self.response_cache.reset_stats()
         
         if progress_callback:
             progress_callback(self.loc.t("initializing"), 0, 1)
@@ -71,152 +201,421 @@ class PresentationService:
                 print(f"{self.loc.t('error_marker')} {error}")
             print(f"\n{self.loc.t('critical_error_stop')}")
             raise Exception(self.loc.t("project_validation_failed"))
-        
-        presentation = Presentation(
-            title=title,
-            language=language,
-            max_sections=max_sections,
-            max_slides=max_slides
-        )
+    
+    async def _complete_presentation(
+        self,
+        presentation: Presentation,
+        enable_web_search: bool,
+        progress_callback: Optional[Callable[[str, int, int], None]]
+    ) -> Presentation:
+        title = presentation.title
+        language = presentation.language
+        max_sections = presentation.max_sections
+        max_slides = presentation.max_slides
         
         web_search_multiplier = 2 if enable_web_search else 1
+        steps_per_slide = web_search_multiplier
         total_steps = 2 + max_sections * (1 + max_slides * web_search_multiplier)
-        current_step = 1
+        current_step = 1 + self._count_completed_steps(presentation, steps_per_slide)
         start_time = time.time()
         
-        if progress_callback:
-            progress_callback(self.loc.t("gen_summary"), current_step, total_steps)
-        
-        step_start = time.time()
-        presentation.summary = await self.ai_service.generate_presentation_summary(title, language)
-        presentation.title_slide_header = await self.ai_service.generate_title_slide_header(title, language)
-        step_duration = time.time() - step_start
-        self._update_step_timing(step_duration)
-        current_step += 1
-        
-        if progress_callback:
-            remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
-            progress_callback(f"{self.loc.t('gen_sections')} ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", current_step, total_steps)
-        
-        self._debug_log(f"{self.loc.t('debug_ai_request')} {self.loc.t('debug_section_titles')}", f"{self.loc.t('debug_title')}: {title}, {self.loc.t('debug_count')}: {max_sections}")
-        
-        step_start = time.time()
-        section_titles = await self.ai_service.generate_section_titles(title, max_sections, language)
-        
-        self._debug_log(f"{self.loc.t('debug_ai_response')} {self.loc.t('debug_section_titles')}", str(section_titles))
-        
-        step_duration = time.time() - step_start
-        self._update_step_timing(step_duration)
-        if not section_titles or len(section_titles) < max_sections:
-            section_titles = [f"{self.loc.t('section_default')} {i+1}" for i in range(max_sections)]
-        
-        for section_index, section_title in enumerate(section_titles):
+        if not presentation.summary:
             if progress_callback:
-                remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
-                section_short = section_title[:30] + "..." if len(section_title) > 30 else section_title
-                progress_callback(f"{self.loc.t('processing_section')} '{section_short}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", current_step, total_steps)
+                progress_callback(self.loc.t("gen_summary"), current_step, total_steps)
             
-            section = Section(title=section_title)
+            step_start = time.time()
+            presentation.summary, presentation.title_slide_header = await self._gather_or_cancel([
+                self._in_request_slot(self.ai_service.generate_presentation_summary(title, language)),
+                self._in_request_slot(self.ai_service.generate_title_slide_header(title, language))
+            ])
+            step_duration = time.time() - step_start
+            self._update_step_timing(step_duration)
             current_step += 1
+            self.db_manager.checkpoint_summary(presentation.id, presentation.summary, presentation.title_slide_header)
+        
+        if not presentation.sections:
+            if progress_callback:
+                remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
+                progress_callback(f"{self.loc.t('gen_sections')} ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", current_step, total_steps)
             
-            self._debug_log(f"{self.loc.t('debug_ai_request')} {self.loc.t('debug_slide_titles')}", f"{self.loc.t('debug_section')}: {section_title}, {self.loc.t('debug_count')}: {max_slides}")
+            self._debug_log(f"{self.loc.t('debug_ai_request')} {self.loc.t('debug_section_titles')}", f"{self.loc.t('debug_title')}: {title}, {self.loc.t('debug_count')}: {max_sections}")
             
             step_start = time.time()
-            slide_titles = await self.ai_service.generate_slide_titles(
-                section_title, title, max_slides, language
-            )
+            async with self._request_slot():
+                section_titles = await self.ai_service.generate_section_titles(title, max_sections, language)
             
-            self._debug_log(f"{self.loc.t('debug_ai_response')} {self.loc.t('debug_slide_titles')}", str(slide_titles))
+            self._debug_log(f"{self.loc.t('debug_ai_response')} {self.loc.t('debug_section_titles')}", str(section_titles))
             
             step_duration = time.time() - step_start
             self._update_step_timing(step_duration)
-            if not slide_titles or len(slide_titles) < max_slides:
-                slide_titles = [f"{self.loc.t('slide_default')} {i+1}" for i in range(max_slides)]
+            if not section_titles or len(section_titles) < max_sections:
+                section_titles = [f"{self.loc.t('section_default')} {i+1}" for i in range(max_sections)]
             
-            for slide_index, slide_title in enumerate(slide_titles):
-                if progress_callback:
-                    remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
-                    title_short = slide_title[:30] + "..." if len(slide_title) > 30 else slide_title
-                    progress_callback(
-                        f"{self.loc.t('generating_slide')} '{title_short}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", 
-                        current_step, 
+            presentation.sections = [Section(title=section_title) for section_title in section_titles]
+            self.db_manager.checkpoint_sections(presentation.id, section_titles)
+        
+        if self.settings.get("concurrent_generation", True):
+            await self._generate_sections_concurrently(
+                presentation, enable_web_search, progress_callback,
+                current_step, total_steps, start_time, steps_per_slide
+            )
+            current_step = total_steps
+        else:
+            for section_index, section in enumerate(presentation.sections):
+                if not section.slides:
+                    if progress_callback:
+                        remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
+                        section_short = self._shorten(section.title)
+                        progress_callback(f"{self.loc.t('processing_section')} '{section_short}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", current_step, total_steps)
+                    
+                    on_section_token = self._token_reporter(
+                        progress_callback,
+                        f"{self.loc.t('processing_section')} '{self._shorten(section.title)}'",
+                        lambda: current_step,
                         total_steps
                     )
+                    
+                    step_start = time.time()
+                    async with self._request_slot():
+                        completed_slides = await self._plan_section(presentation, section_index, enable_web_search, on_section_token)
+                    self._update_step_timing((time.time() - step_start) / (1 + completed_slides * steps_per_slide))
+                    current_step += 1 + completed_slides * steps_per_slide
                 
-                web_content = None
-                if enable_web_search and self.web_search_service.is_search_beneficial(slide_title):
-                    self._debug_log(f"{self.loc.t('debug_web_search')} {slide_title}")
+                for slide_index, pending_slide in enumerate(section.slides):
+                    if pending_slide.content is not None:
+                        continue
                     
+                    slide_title = pending_slide.title
                     if progress_callback:
                         remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
-                        title_short = slide_title[:30] + "..." if len(slide_title) > 30 else slide_title
                         progress_callback(
-                            f"{self.loc.t('searching_web')} '{title_short}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", 
+                            f"{self.loc.t('generating_slide')} '{self._shorten(slide_title)}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", 
                             current_step, 
                             total_steps
                         )
                     
-                    step_start = time.time()
-                    search_result = self.web_search_service.search_information(slide_title, language)
-                    
-                    if search_result and isinstance(search_result, dict) and 'content' in search_result:
-                        web_content = search_result['content']
-                        self._debug_log(f"{self.loc.t('debug_web_result')} {slide_title}", web_content[:200] + "..." if len(web_content) > 200 else web_content)
+                    def on_search():
+                        if progress_callback:
+                            remaining_time = self._calculate_remaining_time(current_step, total_steps, start_time)
+                            progress_callback(
+                                f"{self.loc.t('searching_web')} '{self._shorten(slide_title)}'... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})", 
+                                current_step, 
+                                total_steps
+                            )
                     
-                    step_duration = time.time() - step_start
-                    self._update_step_timing(step_duration)
-                
-                current_step += 1
-                
-                step_start = time.time()
-                self._debug_log(f"{self.loc.t('debug_ai_request')} {slide_title}", f"{self.loc.t('debug_section')}: {section_title}")
-                
-                if web_content:
-                    slide_content = await self.ai_service.enhance_content_with_web_info(
-                        "", web_content, slide_title, language
-                    )
-                    if not slide_content or len(slide_content.strip()) < 20:
-                        slide_content = await self.ai_service.generate_slide_content(
-                            slide_title, section_title, language
-                        )
-                else:
-                    slide_content = await self.ai_service.generate_slide_content(
-                        slide_title, section_title, language
+                    on_token = self._token_reporter(
+                        progress_callback,
+                        f"{self.loc.t('generating_slide')} '{self._shorten(slide_title)}'",
+                        lambda: current_step,
+                        total_steps
                     )
-                
-                self._debug_log(f"{self.loc.t('debug_ai_response')} {slide_title}", slide_content)
-                
-                slide_content = self.ai_service.fix_line_breaks(slide_content, language)
-                
-                step_duration = time.time() - step_start
-                self._update_step_timing(step_duration)
-                
-                if not slide_content or len(slide_content.strip()) < 20 or self._is_placeholder_content(slide_content):
-                    slide_content = await self.ai_service.generate_slide_content(slide_title, section_title, language)
-                    if not slide_content or len(slide_content.strip()) < 20 or self._is_placeholder_content(slide_content):
-                        slide_content = f"{self.loc.t('slide_content_default')} '{slide_title}'"
-                
-                
-                current_step += 1
-                
-                slide = Slide(title=slide_title, content=slide_content)
-                section.add_slide(slide)
-            
-            presentation.add_section(section)
-        
+                    
+                    step_start = time.time()
+                    async with self._request_slot():
+                        slide = await self._generate_slide(slide_title, section.title, language, enable_web_search, on_search, on_token)
+                    self._update_step_timing((time.time() - step_start) / steps_per_slide)
+                    current_step += steps_per_slide
+                    
+                    section.slides[slide_index] = slide
+                    self.db_manager.checkpoint_slide(presentation.id, section_index, slide_index, slide.content)
         
         presentation.generated = True
+        self.db_manager.complete_checkpoint(presentation.id, presentation.token_usage)
         
         if progress_callback:
             progress_callback(self.loc.t("presentation_ready"), current_step, total_steps)
         
         return presentation
     
+    def _request_slot(self):
+        if self.request_semaphore:
+            return self.request_semaphore
+        return contextlib.nullcontext()
+    
+    async def _in_request_slot(self, coroutine):
+        async with self._request_slot():
+            return await coroutine
+    
+    async def _gather_or_cancel(self, coroutines) -> list:
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    def _token_reporter(
+        self,
+        progress_callback: Optional[Callable[[str, int, int], None]],
+        message: str,
+        get_step: Callable[[], int],
+        total_steps: int
+    ) -> Optional[Callable[[int], None]]:
+        if not progress_callback:
+            return None
+        
+        def on_token(token_count: int):
+            progress_callback(f"{message}... ({self.loc.t('tokens_received', count=token_count)})", get_step(), total_steps)
+        
+        return on_token
+    
+    def _count_completed_steps(self, presentation: Presentation, steps_per_slide: int) -> int:
+        completed_steps = 1 if presentation.summary else 0
+        for section in presentation.sections:
+            if section.slides:
+                completed_steps += 1
+                completed_steps += steps_per_slide * sum(1 for slide in section.slides if slide.content is not None)
+        return completed_steps
+    
+    async def _generate_sections_concurrently(
+        self,
+        presentation: Presentation,
+        enable_web_search: bool,
+        progress_callback: Optional[Callable[[str, int, int], None]],
+        current_step: int,
+        total_steps: int,
+        start_time: float,
+        steps_per_slide: int
+    ) -> None:
+        semaphore = self.request_semaphore or asyncio.Semaphore(max(1, int(self.settings.get("max_concurrent_requests", 4))))
+        progress = {"step": current_step, "last_completion": time.time()}
+        
+        def unit_completed(message: str, steps: int):
+            now = time.time()
+            self._update_step_timing((now - progress["last_completion"]) / steps)
+            progress["last_completion"] = now
+            progress["step"] += steps
+            if progress_callback:
+                remaining_time = self._calculate_remaining_time(progress["step"], total_steps, start_time)
+                progress_callback(
+                    f"{message}... ({self.loc.t('remaining_time')} ~{self._format_time(remaining_time)})",
+                    progress["step"],
+                    total_steps
+                )
+        
+        async def build_slide(section_index: int, section: Section, slide_index: int):
+            slide_title = section.slides[slide_index].title
+            on_token = self._token_reporter(
+                progress_callback,
+                f"{self.loc.t('generating_slide')} '{self._shorten(slide_title)}'",
+                lambda: progress["step"],
+                total_steps
+            )
+            
+            async with semaphore:
+                slide = await self._generate_slide(slide_title, section.title, presentation.language, enable_web_search, on_token=on_token)
+            section.slides[slide_index] = slide
+            self.db_manager.checkpoint_slide(presentation.id, section_index, slide_index, slide.content)
+            unit_completed(f"{self.loc.t('generating_slide')} '{self._shorten(slide_title)}'", steps_per_slide)
+        
+        async def build_section(section_index: int, section: Section):
+            if not section.slides:
+                section_message = f"{self.loc.t('processing_section')} '{self._shorten(section.title)}'"
+                on_token = self._token_reporter(progress_callback, section_message, lambda: progress["step"], total_steps)
+                async with semaphore:
+                    completed_slides = await self._plan_section(presentation, section_index, enable_web_search, on_token)
+                unit_completed(section_message, 1 + completed_slides * steps_per_slide)
+            
+            await self._gather_or_cancel([
+                build_slide(section_index, section, slide_index)
+                for slide_index, slide in enumerate(section.slides)
+                if slide.content is None
+            ])
+        
+        await self._gather_or_cancel([
+            build_section(section_index, section)
+            for section_index, section in enumerate(presentation.sections)
+        ])
+    
+    async def _plan_section(
+        self,
+        presentation: Presentation,
+        section_index: int,
+        enable_web_search: bool,
+        on_token: Optional[Callable[[int], None]] = None
+    ) -> int:
+        section = presentation.sections[section_index]
+        
+        with self.tracer.span("section.plan", "deck", title=section.title) as span:
+            if self.settings.get("section_batch_generation", False) and not enable_web_search:
+                self._debug_log(f"{self.loc.t('debug_ai_request')} {self.loc.t('debug_section_content')}", f"{self.loc.t('debug_section')}: {section.title}, {self.loc.t('debug_count')}: {presentation.max_slides}")
+            
+                batch = await self.ai_service.generate_section_content(
+                    section.title, presentation.title, presentation.max_slides, presentation.language, on_token=on_token
+                )
+            
+                self._debug_log(f"{self.loc.t('debug_ai_response')} {self.loc.t('debug_section_content')}", str(batch))
+            
+                if batch:
+                    section.slides = [Slide(title=item['title'], content=None) for item in batch]
+                    self.db_manager.checkpoint_slide_titles(presentation.id, section_index, [slide.title for slide in section.slides])
+                
+                    completed_slides = 0
+                    for slide_index, item in enumerate(batch):
+                        if not item['content']:
+                            continue
+                        content = self.ai_service.fix_line_breaks(item['content'], presentation.language)
+                        if not content or len(content.strip()) < 20 or self._is_placeholder_content(content):
+                            continue
+                        section.slides[slide_index].content = content
+                        self.db_manager.checkpoint_slide(presentation.id, section_index, slide_index, content)
+                        completed_slides += 1
+                    span.set(batched=True, completed_slides=completed_slides)
+                    return completed_slides
+            
+            slide_titles = await self._generate_section_slide_titles(
+                section.title, presentation.title, presentation.max_slides, presentation.language
+            )
+            section.slides = [Slide(title=slide_title, content=None) for slide_title in slide_titles]
+            self.db_manager.checkpoint_slide_titles(presentation.id, section_index, slide_titles)
+            span.set(batched=False)
+            return 0
+    
+    async def _generate_section_slide_titles(self, section_title: str, title: str, max_slides: int, language: str) -> List[str]:
+        self._debug_log(f"{self.loc.t('debug_ai_request')} {self.loc.t('debug_slide_titles')}", f"{self.loc.t('debug_section')}: {section_title}, {self.loc.t('debug_count')}: {max_slides}")
+        
+        slide_titles = await self.ai_service.generate_slide_titles(
+            section_title, title, max_slides, language
+        )
+        
+        self._debug_log(f"{self.loc.t('debug_ai_response')} {self.loc.t('debug_slide_titles')}", str(slide_titles))
+        
+        if not slide_titles or len(slide_titles) < max_slides:
+            slide_titles = [f"{self.loc.t('slide_default')} {i+1}" for i in range(max_slides)]
+        return slide_titles
+    
+    async def _generate_slide(
+        self,
+        slide_title: str,
+        section_title: str,
+        language: str,
+        enable_web_search: bool,
+        on_search: Optional[Callable[[], None]] = None,
+        on_token: Optional[Callable[[int], None]] = None
+    ) -> Slide:
+        with self.tracer.span("slide.generate", "deck", title=slide_title, web_search=enable_web_search):
+            budget = get_current_budget()
+            if budget is not None and budget.exhausted():
+                return Slide(title=slide_title, content=f"{self.loc.t('slide_content_default')} '{slide_title}'")
+            if enable_web_search and budget is not None and not budget.allows_web_search():
+                budget.stats['web_skipped'] += 1
+                enable_web_search = False
+            
+            web_content = None
+            if enable_web_search and self.web_search_service.is_search_beneficial(slide_title):
+                self._debug_log(f"{self.loc.t('debug_web_search')} {slide_title}")
+            
+                if on_search:
+                    on_search()
+            
+                search_result = await self.web_search_service.search_information(slide_title, language)
+            
+                if search_result and isinstance(search_result, dict) and 'content' in search_result:
+                    web_content = search_result['content']
+                    self._debug_log(f"{self.loc.t('debug_web_result')} {slide_title}", web_content[:200] + "..." if len(web_content) > 200 else web_content)
+        
+            self._debug_log(f"{self.loc.t('debug_ai_request')} {slide_title}", f"{self.loc.t('debug_section')}: {section_title}")
+        
+            if web_content:
+                slide_content = await self.ai_service.enhance_content_with_web_info(
+                    "", web_content, slide_title, language, on_token=on_token
+                )
+                if not slide_content or len(slide_content.strip()) < 20:
+                    slide_content = await self.ai_service.generate_slide_content(
+                        slide_title, section_title, language, on_token=on_token
+                    )
+            else:
+                slide_content = await self.ai_service.generate_slide_content(
+                    slide_title, section_title, language, on_token=on_token
+                )
+        
+            self._debug_log(f"{self.loc.t('debug_ai_response')} {slide_title}", slide_content)
+        
+            slide_content = self.ai_service.fix_line_breaks(slide_content, language)
+        
+            if not slide_content or len(slide_content.strip()) < 20 or self._is_placeholder_content(slide_content):
+                slide_content = await self.ai_service.generate_slide_content(slide_title, section_title, language, on_token=on_token)
+                if not slide_content or len(slide_content.strip()) < 20 or self._is_placeholder_content(slide_content):
+                    slide_content = f"{self.loc.t('slide_content_default')} '{slide_title}'"
+        
+            return Slide(title=slide_title, content=slide_content)
+    
+    def _shorten(self, text: str, limit: int = 30) -> str:
+        return text[:limit] + "..." if len(text) > limit else text
+    
     def save_presentation(self, presentation: Presentation, filename: Optional[str] = None) -> str:
         file_path = self.pptx_generator.generate_pptx(presentation, filename)
-        self.db_manager.save_presentation(presentation)
+        if presentation.id is None:
+            presentation.id = self.db_manager.save_presentation(presentation)
         return file_path
     
+    async def save_presentation_async(self, presentation: Presentation, filename: Optional[str] = None) -> str:
+        filename = filename or presentation.filename or self.pptx_generator._fallback_filename(presentation)
+        
+        tasks = [asyncio.to_thread(self.pptx_generator.generate_pptx, presentation, filename)]
+        if presentation.id is None:
+            tasks.append(asyncio.to_thread(self.db_manager.save_presentation, presentation))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if len(results) > 1 and isinstance(results[1], int):
+            presentation.id = results[1]
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results[0]
+    
+    async def _generate_filename(self, presentation: Presentation) -> str:
+        try:
+            async with self._request_slot():
+                name = await self.ai_service.generate_filename(presentation.title, presentation.language)
+        except Exception:
+            name = None
+        
+        if name and name != "Presentation":
+            return f"{self.pptx_generator._sanitize_filename(name)}.pptx"
+        return self.pptx_generator._fallback_filename(presentation)
+    
+    def export_presentations(
+        self,
+        items: Optional[Iterable[Union[Presentation, int]]] = None,
+        max_workers: Optional[int] = None,
+        decks_per_worker: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None
+    ) -> Iterator[dict]:
+        if items is None:
+            in_progress = {entry['id'] for entry in self.db_manager.list_in_progress()}
+            items = [entry['id'] for entry in self.db_manager.list_presentations() if entry['id'] not in in_progress]
+        
+        self.batch_renderer = BatchRenderer(
+            output_dir=str(self.pptx_generator.output_dir),
+            template_path=self.pptx_generator.template_path,
+            max_workers=max_workers or int(self.settings.get("export_workers", 0)) or None,
+            decks_per_worker=decks_per_worker if decks_per_worker is not None else int(self.settings.get("export_decks_per_worker", 25)),
+            memory_limit_mb=memory_limit_mb if memory_limit_mb is not None else int(self.settings.get("export_memory_limit_mb", 1024))
+        )
+        return self.batch_renderer.render(self._export_job(item, index) for index, item in enumerate(items, 1))
+    
+    def _export_job(self, item: Union[Presentation, int], index: int) -> tuple:
+        if isinstance(item, Presentation):
+            presentation = item
+            key = item.id if item.id is not None else item.title
+        else:
+            key = int(item)
+            presentation = self.db_manager.get_presentation(key)
+        
+        filename = None
+        if presentation:
+            prefix = f"{presentation.id}_" if presentation.id is not None else f"{index:04d}_"
+            filename = f"{prefix}{self.pptx_generator._sanitize_filename(presentation.title)}.pptx"
+        return key, presentation, filename
+    
+    def get_export_stats(self) -> Optional[dict]:
+        if not self.batch_renderer:
+            return None
+        return self.batch_renderer.get_stats()
+    
     def get_presentation_stats(self, presentation: Presentation) -> dict:
         return {
             'title': presentation.title,
@@ -227,6 +626,42 @@ class PresentationService:
             'created_at': presentation.created_at.strftime('%d.%m.%Y %H:%M:%S')
         }
     
+    def get_cache_stats(self) -> Optional[dict]:
+        if not self.response_cache:
+            return None
+        return self.response_cache.get_stats()
+    
+    def get_token_usage_stats(self, presentation: Presentation) -> Optional[dict]:
+        usage = TokenUsage(presentation.token_usage)
+        totals = usage.totals()
+        if not totals['requests']:
+            return None
+        
+        prompt_price = float(self.settings.get("token_price_prompt_per_million", 0))
+        completion_price = float(self.settings.get("token_price_completion_per_million", 0))
+        totals['cost'] = usage.cost(prompt_price, completion_price) if prompt_price or completion_price else None
+        totals['top_types'] = usage.top_types()
+        return totals
+    
+    def get_hedge_stats(self) -> dict:
+        return get_hedge_policy().get_stats()
+    
+    def export_trace(self, presentation: Optional[Presentation] = None, path: Optional[str] = None) -> Optional[str]:
+        if not self.tracer.enabled:
+            return None
+        
+        if path is None:
+            extension = "jsonl" if self.settings.get("tracing_format", "chrome") == "jsonl" else "json"
+            deck_id = presentation.id if presentation and presentation.id is not None else "session"
+            path = str(self.pptx_generator.output_dir / "traces" / f"deck_{deck_id}_{time.strftime('%Y%m%d_%H%M%S')}.{extension}")
+        
+        trace_path = self.tracer.export(path)
+        self.tracer.clear()
+        return trace_path
+    
+    def get_trace_summary(self) -> dict:
+        return self.tracer.summary()
+    
     def list_saved_presentations(self) -> list:
         return self.pptx_generator.list_presentations()
     
@@ -243,11 +678,15 @@ class PresentationService:
     def get_database_presentations(self) -> list:
         return self.db_manager.list_presentations()
     
+    def get_unfinished_presentations(self) -> list:
+        return self.db_manager.list_in_progress()
+    
     def delete_database_presentation(self, presentation_id: int) -> bool:
         return self.db_manager.delete_presentation(presentation_id)
     
     def cleanup_database(self):
-        self.db_manager.clear_all()
+        if not self.settings.get("keep_completed_presentations", True):
+            self.db_manager.clear_all(keep_in_progress=True)
     
     def _update_step_timing(self, step_duration: float):
         self.step_times.append(step_duration)
@@ -0,0 +1,249 @@
+import re
+import time
+import random
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float = 0):
+        self.capacity = 0.0
+        self.rate = 0.0
+        self.tokens = 0.0
+        self.updated_at = time.monotonic()
+        self.set_capacity(per_minute)
+    
+    def set_capacity(self, per_minute: float) -> None:
+        was_enabled = self.capacity > 0
+        self.capacity = max(0.0, float(per_minute or 0))
+        self.rate = self.capacity / 60.0
+        self.tokens = min(self.tokens, self.capacity) if was_enabled else self.capacity
+    
+    def refill(self, now: float) -> None:
+        if self.capacity > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def wait_time(self, amount: float) -> float:
+        if self.capacity <= 0:
+            return 0.0
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+    
+    def consume(self, amount: float) -> None:
+        if self.capacity > 0:
+            self.tokens -= min(amount, self.capacity)
+    
+    def refund(self, amount: float) -> None:
+        if self.capacity > 0:
+            self.tokens = min(self.capacity, self.tokens + amount)
+    
+    def limit_remaining(self, remaining: float) -> None:
+        if self.capacity > 0:
+            self.tokens = min(self.tokens, remaining)
+
+
+class RateLimitReservation:
+    def __init__(self, limiter: "RateLimiter", tokens: int):
+        self.limiter = limiter
+        self.tokens = tokens
+        self.used_tokens: Optional[int] = None
+    
+    async def __aenter__(self) -> "RateLimitReservation":
+        await self.limiter.acquire(self.tokens)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.limiter.release(self.tokens, self.used_tokens)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests_per_minute: float = 120,
+        tokens_per_minute: float = 0,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max(min_concurrency, max_concurrency)
+        self.concurrency_limit = float(self.max_concurrency)
+        self.active_requests = 0
+        self.blocked_until = 0.0
+        self.last_decrease = 0.0
+        self.decrease_interval = 2.0
+        self.default_retry_after = 2.0
+        self.stats = {
+            'requests': 0,
+            'rate_limited': 0,
+            'wait_seconds': 0.0
+        }
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def configure(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None
+    ) -> None:
+        if requests_per_minute is not None:
+            self.request_bucket.set_capacity(requests_per_minute)
+        if tokens_per_minute is not None:
+            self.token_bucket.set_capacity(tokens_per_minute)
+        if max_concurrency is not None:
+            self.max_concurrency = max(self.min_concurrency, int(max_concurrency))
+            self.concurrency_limit = float(self.max_concurrency)
+    
+    def reserve(self, tokens: int = 0) -> RateLimitReservation:
+        return RateLimitReservation(self, tokens)
+    
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+    
+    async def acquire(self, tokens: int = 0) -> None:
+        condition = self._get_condition()
+        started_at = time.monotonic()
+        async with condition:
+            while True:
+                now = time.monotonic()
+                self.request_bucket.refill(now)
+                self.token_bucket.refill(now)
+                wait_time = max(
+                    self.blocked_until - now,
+                    self.request_bucket.wait_time(1),
+                    self.token_bucket.wait_time(tokens)
+                )
+                
+                if wait_time <= 0 and self.active_requests < int(self.concurrency_limit):
+                    self.request_bucket.consume(1)
+                    self.token_bucket.consume(tokens)
+                    self.active_requests += 1
+                    self.stats['requests'] += 1
+                    self.stats['wait_seconds'] += now - started_at
+                    return
+                
+                try:
+                    await asyncio.wait_for(condition.wait(), timeout=wait_time if wait_time > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+    
+    async def release(self, reserved_tokens: int = 0, used_tokens: Optional[int] = None) -> None:
+        if used_tokens is not None:
+            if used_tokens < reserved_tokens:
+                self.token_bucket.refund(reserved_tokens - used_tokens)
+            else:
+                self.token_bucket.consume(used_tokens - reserved_tokens)
+        
+        condition = self._get_condition()
+        async with condition:
+            self.active_requests = max(0, self.active_requests - 1)
+            condition.notify_all()
+    
+    def on_success(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        self.concurrency_limit = min(float(self.max_concurrency), self.concurrency_limit + 1.0 / self.concurrency_limit)
+        self._apply_headers(headers)
+    
+    def on_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> float:
+        now = time.monotonic()
+        self.stats['rate_limited'] += 1
+        
+        retry_after = self._parse_retry_after(headers)
+        if retry_after is None:
+            retry_after = self.default_retry_after * random.uniform(1.0, 1.5)
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+        
+        if now - self.last_decrease >= self.decrease_interval:
+            self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit / 2)
+            self.last_decrease = now
+        
+        self._apply_headers(headers)
+        return retry_after
+    
+    def _apply_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        if not headers:
+            return
+        
+        now = time.monotonic()
+        for bucket, kind in ((self.request_bucket, 'requests'), (self.token_bucket, 'tokens')):
+            limit = self._parse_number(headers.get(f'x-ratelimit-limit-{kind}'))
+            if limit:
+                bucket.set_capacity(limit)
+            
+            remaining = self._parse_number(headers.get(f'x-ratelimit-remaining-{kind}'))
+            if remaining is None:
+                continue
+            bucket.refill(now)
+            bucket.limit_remaining(remaining)
+            
+            if remaining <= 0:
+                reset = self._parse_duration(headers.get(f'x-ratelimit-reset-{kind}'))
+                if reset:
+                    self.blocked_until = max(self.blocked_until, now + reset)
+    
+    def _parse_retry_after(self, headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        if not headers:
+            return None
+        
+        retry_after_ms = self._parse_number(headers.get('retry-after-ms'))
+        if retry_after_ms is not None:
+            return retry_after_ms / 1000
+        
+        retry_after = headers.get('retry-after')
+        if not retry_after:
+            return None
+        
+        seconds = self._parse_number(retry_after)
+        if seconds is not None:
+            return max(0.0, seconds)
+        
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+    
+    def _parse_number(self, value: Optional[str]) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    
+    def _parse_duration(self, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        
+        seconds = self._parse_number(value)
+        if seconds is not None:
+            return seconds
+        
+        units = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        parts = re.findall(r'(\d+(?:\.\d+)?)(ms|s|m|h)', value)
+        if not parts:
+            return None
+        return sum(float(amount) * units[unit] for amount, unit in parts)
+    
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['concurrency_limit'] = int(self.concurrency_limit)
+        return stats
+
+
+_rate_limiter = RateLimiter()
+
+def get_rate_limiter() -> RateLimiter:
+    return _rate_limiter
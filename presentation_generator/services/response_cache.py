@@ -0,0 +1,131 @@
+import json
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    def __init__(self, db_path: Optional[Path] = None, ttl_seconds: float = 86400, max_bytes: int = 50 * 1024 * 1024):
+        if db_path is None:
+            config_dir = Path(__file__).parent.parent / "config"
+            config_dir.mkdir(exist_ok=True)
+            db_path = config_dir / "response_cache.db"
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._init_database()
+    
+    def _init_database(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+            conn.commit()
+    
+    def make_key(self, model: str, messages: list, temperature: float, max_completion_tokens: int) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": round(float(temperature), 4),
+                "max_completion_tokens": int(max_completion_tokens)
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT response, size, created_at FROM responses WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            
+            if not row:
+                self.misses += 1
+                return None
+            
+            response, size, created_at = row
+            if now - created_at > self.ttl_seconds:
+                cursor.execute('DELETE FROM responses WHERE key = ?', (key,))
+                conn.commit()
+                self.misses += 1
+                return None
+            
+            cursor.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+            conn.commit()
+        
+        self.hits += 1
+        self.bytes_saved += size
+        return response
+    
+    def set(self, key: str, response: str) -> None:
+        now = time.time()
+        size = len(response.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO responses (key, response, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (key, response, size, now, now))
+            self._evict(cursor, now)
+            conn.commit()
+    
+    def _evict(self, cursor, now: float) -> None:
+        cursor.execute('DELETE FROM responses WHERE created_at < ?', (now - self.ttl_seconds,))
+        
+        cursor.execute('SELECT COALESCE(SUM(size), 0) FROM responses')
+        total_size = cursor.fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        
+        cursor.execute('SELECT key, size FROM responses ORDER BY last_access ASC')
+        stale_keys = []
+        for key, size in cursor.fetchall():
+            if total_size <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            total_size -= size
+        cursor.executemany('DELETE FROM responses WHERE key = ?', stale_keys)
+    
+    def get_stats(self) -> dict:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses')
+            entries, total_size = cursor.fetchone()
+        
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'bytes_saved': self.bytes_saved,
+            'entries': entries,
+            'size': total_size
+        }
+    
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+    
+    def clear(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM responses')
+            conn.commit()
@@ -0,0 +1,172 @@
+import time
+import random
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+from ..localization.manager import get_localization_manager
+from .deck_budget import get_current_budget
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.stats = {
+            'opened': 0,
+            'rejected': 0
+        }
+        self.loc = get_localization_manager()
+    
+    def before_call(self) -> None:
+        if self.state == "closed" or self.failure_threshold <= 0:
+            return
+        
+        if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            self.probe_in_flight = False
+        
+        if self.state == "half_open" and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return
+        
+        self.stats['rejected'] += 1
+        retry_in = max(0, int(self.reset_timeout - (time.monotonic() - self.opened_at)))
+        raise CircuitOpenError(self.loc.t("error_circuit_open", seconds=retry_in))
+    
+    def on_success(self) -> None:
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+    
+    def on_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == "half_open" or (self.state == "closed" and 0 < self.failure_threshold <= self.consecutive_failures):
+            if self.state != "open":
+                self.stats['opened'] += 1
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.probe_in_flight = False
+    
+    def on_ignored(self) -> None:
+        self.probe_in_flight = False
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 10.0,
+        attempt_timeout: float = 60.0,
+        deadline: float = 180.0,
+        circuit_breaker: Optional[CircuitBreaker] = None
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.attempt_timeout = attempt_timeout
+        self.deadline = deadline
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.stats = {
+            'attempts': 0,
+            'retries': 0,
+            'timeouts': 0
+        }
+    
+    def configure(
+        self,
+        max_attempts: Optional[int] = None,
+        attempt_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ) -> None:
+        if max_attempts is not None:
+            self.max_attempts = max(1, int(max_attempts))
+        if attempt_timeout is not None:
+            self.attempt_timeout = max(1.0, float(attempt_timeout))
+        if deadline is not None:
+            self.deadline = max(1.0, float(deadline))
+        if failure_threshold is not None:
+            self.circuit_breaker.failure_threshold = int(failure_threshold)
+        if reset_timeout is not None:
+            self.circuit_breaker.reset_timeout = max(0.0, float(reset_timeout))
+    
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    async def run(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        is_retryable: Optional[Callable[[Exception], bool]] = None,
+        trips_breaker: Optional[Callable[[Exception], bool]] = None
+    ) -> T:
+        deadline_at = time.monotonic() + self.deadline
+        max_attempts = self.max_attempts
+        budget = get_current_budget()
+        if budget is not None:
+            max_attempts = budget.max_attempts(max_attempts)
+            if budget.deadline_at is not None:
+                deadline_at = min(deadline_at, budget.deadline_at)
+        last_error: Optional[Exception] = None
+        
+        for attempt in range(max_attempts):
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            self.circuit_breaker.before_call()
+            self.stats['attempts'] += 1
+            if attempt > 0:
+                self.stats['retries'] += 1
+            
+            try:
+                result = await asyncio.wait_for(operation(), timeout=min(self.attempt_timeout, remaining))
+                self.circuit_breaker.on_success()
+                return result
+            except asyncio.TimeoutError as e:
+                self.stats['timeouts'] += 1
+                self.circuit_breaker.on_failure()
+                last_error = e
+            except Exception as e:
+                last_error = e
+                if trips_breaker is None or trips_breaker(e):
+                    self.circuit_breaker.on_failure()
+                else:
+                    self.circuit_breaker.on_ignored()
+                if is_retryable is not None and not is_retryable(e):
+                    raise
+            except BaseException:
+                self.circuit_breaker.on_ignored()
+                raise
+            
+            if attempt < max_attempts - 1:
+                delay = min(self.backoff(attempt), deadline_at - time.monotonic())
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        
+        if last_error is None:
+            last_error = asyncio.TimeoutError()
+        raise last_error
+    
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats['circuit_state'] = self.circuit_breaker.state
+        stats['circuit_opened'] = self.circuit_breaker.stats['opened']
+        stats['circuit_rejected'] = self.circuit_breaker.stats['rejected']
+        return stats
+
+
+_retry_policy = RetryPolicy()
+
+def get_retry_policy() -> RetryPolicy:
+    return _retry_policy
@@ -0,0 +1,185 @@
+import json
+import time
+import sqlite3
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class SearchCache:
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        results_ttl_seconds: float = 6 * 3600,
+        pages_ttl_seconds: float = 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        if db_path is None:
+            config_dir = Path(__file__).parent.parent / "config"
+            config_dir.mkdir(exist_ok=True)
+            db_path = config_dir / "search_cache.db"
+        self.db_path = Path(db_path)
+        self.results_ttl_seconds = results_ttl_seconds
+        self.pages_ttl_seconds = pages_ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats = {
+            'results_hits': 0,
+            'results_misses': 0,
+            'pages_hits': 0,
+            'pages_revalidated': 0,
+            'pages_misses': 0
+        }
+        self._init_database()
+    
+    def _init_database(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS search_results (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            ''')
+            
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_search_results_last_access ON search_results (last_access)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages (last_access)')
+            conn.commit()
+    
+    def _results_key(self, query: str, region: str, max_results: int) -> str:
+        payload = json.dumps([query.strip().lower(), region, max_results], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get_results(self, query: str, region: str, max_results: int) -> Optional[List[Dict]]:
+        key = self._results_key(query, region, max_results)
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT results, created_at FROM search_results WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            
+            if not row or now - row[1] > self.results_ttl_seconds:
+                self.stats['results_misses'] += 1
+                return None
+            
+            cursor.execute('UPDATE search_results SET last_access = ? WHERE key = ?', (now, key))
+            conn.commit()
+        
+        self.stats['results_hits'] += 1
+        return json.loads(row[0])
+    
+    def set_results(self, query: str, region: str, max_results: int, results: List[Dict]) -> None:
+        key = self._results_key(query, region, max_results)
+        now = time.time()
+        payload = json.dumps(results, ensure_ascii=False)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO search_results (key, query, results, size, created_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (key, query, payload, len(payload.encode('utf-8')), now, now))
+            self._evict(cursor, now)
+            conn.commit()
+    
+    def get_page(self, url: str) -> Optional[Dict]:
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT text, etag, last_modified, fetched_at FROM pages WHERE url = ?', (url,))
+            row = cursor.fetchone()
+            
+            if not row:
+                self.stats['pages_misses'] += 1
+                return None
+            
+            cursor.execute('UPDATE pages SET last_access = ? WHERE url = ?', (now, url))
+            conn.commit()
+        
+        text, etag, last_modified, fetched_at = row
+        fresh = now - fetched_at <= self.pages_ttl_seconds
+        if fresh:
+            self.stats['pages_hits'] += 1
+        elif not etag and not last_modified:
+            self.stats['pages_misses'] += 1
+            return None
+        
+        return {
+            'text': text,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': fresh
+        }
+    
+    def set_page(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO pages (url, text, etag, last_modified, size, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (url, text, etag, last_modified, len(text.encode('utf-8')), now, now))
+            self._evict(cursor, now)
+            conn.commit()
+    
+    def mark_page_revalidated(self, url: str) -> None:
+        now = time.time()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('UPDATE pages SET fetched_at = ?, last_access = ? WHERE url = ?', (now, now, url))
+            conn.commit()
+        self.stats['pages_revalidated'] += 1
+    
+    def _evict(self, cursor, now: float) -> None:
+        cursor.execute('DELETE FROM search_results WHERE created_at < ?', (now - self.results_ttl_seconds,))
+        
+        cursor.execute('''
+            SELECT (SELECT COALESCE(SUM(size), 0) FROM search_results) + (SELECT COALESCE(SUM(size), 0) FROM pages)
+        ''')
+        total_size = cursor.fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        
+        cursor.execute('''
+            SELECT 'search_results', key, size, last_access FROM search_results
+            UNION ALL
+            SELECT 'pages', url, size, last_access FROM pages
+            ORDER BY last_access ASC
+        ''')
+        stale_results = []
+        stale_pages = []
+        for table, key, size, last_access in cursor.fetchall():
+            if total_size <= self.max_bytes:
+                break
+            if table == 'pages':
+                stale_pages.append((key,))
+            else:
+                stale_results.append((key,))
+            total_size -= size
+        
+        cursor.executemany('DELETE FROM search_results WHERE key = ?', stale_results)
+        cursor.executemany('DELETE FROM pages WHERE url = ?', stale_pages)
+    
+    def get_stats(self) -> dict:
+        return dict(self.stats)
+    
+    def clear(self) -> None:
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM search_results')
+            cursor.execute('DELETE FROM pages')
+            conn.commit()
@@ -3,14 +3,23 @@ import asyncio
 from typing import Optional
 from ..localization.manager import get_localization_manager
 from .ionet_service import IoNetService
+from .retry_policy import RetryPolicy
+from .tracing import get_tracer
 
 
 class SummaryService:
-    def __init__(self, api_key: str, model: str = "meta-llama/Llama-3.3-70B-Instruct"):
-        self.ionet_service = IoNetService(api_key, model)
+    def __init__(self, api_key: str, model: str = "meta-llama/Llama-3.3-70B-Instruct", retry_policy: Optional[RetryPolicy] = None):
+        self.ionet_service = IoNetService(api_key, model, retry_policy=retry_policy)
         self.max_attempts = 3
         self.retry_delay = 1.0
         self.loc = get_localization_manager()
+        self.tracer = get_tracer()
+    
+    async def start(self) -> None:
+        await self.ionet_service.start()
+    
+    async def close(self) -> None:
+        await self.ionet_service.close()
         
     async def summarize_web_content(self, content: str, slide_title: str, language: str = None) -> str:
         if language is None:
@@ -20,19 +29,22 @@ class SummaryService:
             
         prompt = self._build_summary_prompt(content, slide_title, language)
         
-        for attempt in range(self.max_attempts):
-            try:
-                summary = await self.ionet_service.generate_response(prompt, temperature=0.7)
+        with self.tracer.span("summarize", "summarize", content_bytes=len(content.encode('utf-8'))) as span:
+            for attempt in range(self.max_attempts):
+                span.set(attempts=attempt + 1)
+                try:
+                    summary = await self.ionet_service.generate_response(prompt, temperature=0.7, use_cache=attempt == 0, prompt_type="web_summary")
+                except Exception:
+                    return ""
                 
                 if summary and self._is_valid_summary(summary):
+                    span.set(summary_bytes=len(summary.encode('utf-8')))
                     return summary
-                    
-            except Exception as e:
+                
                 if attempt < self.max_attempts - 1:
-                    await asyncio.sleep(self.retry_delay * (attempt + 1))
-                    continue
-                    
-        return ""
+                    await asyncio.sleep(self.retry_delay)
+            
+            return ""
     
     def _build_summary_prompt(self, content: str, slide_title: str, language: str) -> str:
         if language == self.loc.t('language_russian'):
@@ -0,0 +1,76 @@
+import contextlib
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+_current_usage: ContextVar[Optional["TokenUsage"]] = ContextVar("current_usage", default=None)
+
+
+class TokenUsage:
+    def __init__(self, by_type: Optional[Dict[str, dict]] = None):
+        self.by_type = by_type if by_type is not None else {}
+    
+    def record(self, prompt_type: Optional[str], prompt_tokens: int, completion_tokens: int, estimated: bool = False) -> None:
+        entry = self.by_type.setdefault(prompt_type or "other", {
+            'requests': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'estimated': 0
+        })
+        entry['requests'] += 1
+        entry['prompt_tokens'] += prompt_tokens
+        entry['completion_tokens'] += completion_tokens
+        if estimated:
+            entry['estimated'] += 1
+    
+    def totals(self) -> dict:
+        totals = {'requests': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'estimated': 0}
+        for entry in self.by_type.values():
+            for key in totals:
+                totals[key] += entry.get(key, 0)
+        totals['total_tokens'] = totals['prompt_tokens'] + totals['completion_tokens']
+        return totals
+    
+    def cost(self, prompt_price_per_million: float, completion_price_per_million: float) -> float:
+        totals = self.totals()
+        return (totals['prompt_tokens'] * prompt_price_per_million + totals['completion_tokens'] * completion_price_per_million) / 1000000
+    
+    def top_types(self, limit: int = 3) -> list:
+        return sorted(
+            self.by_type.items(),
+            key=lambda item: item[1]['prompt_tokens'] + item[1]['completion_tokens'],
+            reverse=True
+        )[:limit]
+
+
+class UsageTracker:
+    def __init__(self):
+        self.session = TokenUsage()
+    
+    @contextlib.contextmanager
+    def track(self, usage: TokenUsage) -> Iterator[TokenUsage]:
+        token = _current_usage.set(usage)
+        try:
+            yield usage
+        finally:
+            _current_usage.reset(token)
+    
+    def record(self, prompt_type: Optional[str], usage: Optional[dict], prompt_chars: int = 0, completion_chars: int = 0) -> None:
+        if usage and usage.get("prompt_tokens") is not None:
+            prompt_tokens = int(usage.get("prompt_tokens") or 0)
+            completion_tokens = int(usage.get("completion_tokens") or 0)
+            estimated = False
+        else:
+            prompt_tokens = prompt_chars // 4
+            completion_tokens = completion_chars // 4
+            estimated = True
+        
+        self.session.record(prompt_type, prompt_tokens, completion_tokens, estimated)
+        current = _current_usage.get()
+        if current is not None:
+            current.record(prompt_type, prompt_tokens, completion_tokens, estimated)
+
+
+_usage_tracker = UsageTracker()
+
+def get_usage_tracker() -> UsageTracker:
+    return _usage_tracker
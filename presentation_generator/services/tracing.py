@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import asyncio
+import itertools
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    def __init__(self, tracer: "Tracer", name: str, category: str, attributes: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.span_id = next(tracer._ids)
+        self.parent_id: Optional[int] = None
+        self.lane: Optional[str] = None
+        self.start = 0.0
+        self.end = 0.0
+        self._token = None
+    
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+    
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent else None
+        self.lane = self.tracer._lane()
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end = time.perf_counter()
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            pass
+        self.tracer._finish(self)
+    
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.__exit__(exc_type, exc, tb)
+    
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'category': self.category,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'lane': self.lane,
+            'start': round(self.tracer.wall_epoch + self.start - self.tracer.epoch, 6),
+            'duration_ms': round((self.end - self.start) * 1000, 3),
+            'attributes': self.attributes
+        }
+
+
+class NullSpan:
+    def set(self, **attributes) -> None:
+        pass
+    
+    def __enter__(self) -> "NullSpan":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+    
+    async def __aenter__(self) -> "NullSpan":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+class Tracer:
+    def __init__(self, enabled: bool = False, max_spans: int = 200000):
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.epoch = time.perf_counter()
+        self.wall_epoch = time.time()
+        self._ids = itertools.count(1)
+        self._null_span = NullSpan()
+        self._lock = threading.Lock()
+    
+    def configure(self, enabled: Optional[bool] = None) -> None:
+        if enabled is not None:
+            self.enabled = enabled
+    
+    def span(self, name: str, category: str = "app", **attributes):
+        if not self.enabled:
+            return self._null_span
+        return Span(self, name, category, attributes)
+    
+    def _lane(self) -> str:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            return task.get_name()
+        return threading.current_thread().name
+    
+    def _finish(self, span: Span) -> None:
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped += 1
+                return
+            self.spans.append(span)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.spans = []
+            self.dropped = 0
+            self.epoch = time.perf_counter()
+            self.wall_epoch = time.time()
+    
+    def summary(self) -> Dict[str, dict]:
+        totals: Dict[str, dict] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span.name, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            duration = span.end - span.start
+            entry['count'] += 1
+            entry['total_seconds'] += duration
+            entry['max_seconds'] = max(entry['max_seconds'], duration)
+        return totals
+    
+    def export_jsonl(self, path: Path) -> None:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        with open(path, 'w', encoding='utf-8') as f:
+            for span in spans:
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+    
+    def export_chrome_trace(self, path: Path) -> None:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+        
+        lanes: Dict[str, int] = {}
+        events = []
+        pid = os.getpid()
+        for span in spans:
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.epoch) * 1000000, 1),
+                'dur': round((span.end - span.start) * 1000000, 1),
+                'pid': pid,
+                'tid': tid,
+                'args': dict(span.attributes, span_id=span.span_id, parent_id=span.parent_id)
+            })
+        for lane, tid in lanes.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': lane}})
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False, default=str)
+    
+    def export(self, path: str) -> str:
+        export_path = Path(path)
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        if export_path.suffix == ".jsonl":
+            self.export_jsonl(export_path)
+        else:
+            self.export_chrome_trace(export_path)
+        return str(export_path.absolute())
+
+
+_tracer = Tracer()
+
+def get_tracer() -> Tracer:
+    return _tracer
@@ -1,39 +1,116 @@
 import re
 import time
+import asyncio
 from typing import List, Dict, Optional
+from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 from ddgs import DDGS
-import requests
 from bs4 import BeautifulSoup
 from ..localization.manager import get_localization_manager
+from .search_cache import SearchCache
+from .tracing import get_tracer
 
 
 class WebSearchService:
-    def __init__(self, settings_manager=None):
+    def __init__(self, settings_manager=None, cache_path: Optional[Path] = None):
         self.loc = get_localization_manager()
         self.settings = settings_manager
+        self.tracer = get_tracer()
         self.max_results = self.settings.get("search_results_count", 5) if self.settings else 5
         self.max_content_length = 2500
         self.request_delay = 1.0
+        self.search_deadline = float(self.settings.get("search_deadline_seconds", 8)) if self.settings else 8.0
+        self.page_timeout = 10
+        self.max_page_bytes = 2 * 1024 * 1024
+        self.connection_limit = 20
+        self.connection_limit_per_host = 4
+        self.max_concurrent_searches = int(self.settings.get("max_concurrent_searches", 3)) if self.settings else 3
+        self.search_interval = 0.5
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+        self._search_executor: Optional[ThreadPoolExecutor] = None
+        self._search_slots: Optional[asyncio.Semaphore] = None
+        self._search_pacing_lock: Optional[asyncio.Lock] = None
+        self._last_search_time = 0.0
+        self.search_cache = None
+        if self.settings and self.settings.get("search_cache_enabled", True):
+            self.search_cache = SearchCache(
+                db_path=cache_path,
+                results_ttl_seconds=float(self.settings.get("search_cache_results_ttl_hours", 6)) * 3600,
+                pages_ttl_seconds=float(self.settings.get("search_cache_pages_ttl_hours", 24)) * 3600,
+                max_bytes=int(float(self.settings.get("search_cache_max_mb", 50)) * 1024 * 1024)
+            )
+    
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._session and not self._session.closed and self._session_loop is loop:
+            return
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.page_timeout)
+        )
+        self._session_loop = loop
+        self._host_locks = {}
+        self._search_slots = asyncio.Semaphore(max(1, self.max_concurrent_searches))
+        self._search_pacing_lock = asyncio.Lock()
+    
+    async def close(self) -> None:
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        self._host_locks = {}
+        self._search_slots = None
+        self._search_pacing_lock = None
+        if self._search_executor:
+            self._search_executor.shutdown(wait=False, cancel_futures=True)
+            self._search_executor = None
+        if session and not session.closed:
+            await session.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if not self._session or self._session.closed or self._session_loop is not asyncio.get_running_loop():
+            await self.start()
+        return self._session
         
-    def search_information(self, query: str, language: str = None) -> Dict[str, any]:
+    async def search_information(self, query: str, language: str = None) -> Dict[str, any]:
         if language is None:
             from ..localization.manager import get_localization_manager
             loc = get_localization_manager()
             language = loc.t('language_russian')
-        try:
-            search_results = self._perform_search(query, language)
-            if not search_results:
-                return {"content": "", "sources": []}
+        with self.tracer.span("search", "search", query=query) as span:
+            try:
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + self.search_deadline
+                search_results = await asyncio.wait_for(self._perform_search(query, language), timeout=self.search_deadline)
+                if not search_results:
+                    span.set(results=0, content_bytes=0)
+                    return {"content": "", "sources": []}
                 
-            combined_content = self._extract_content_from_results(search_results)
-            truncated_content = self._truncate_content(combined_content)
-            
-            return {
-                "content": truncated_content,
-                "sources": [result.get("href", "") for result in search_results]
-            }
-        except Exception as e:
-            return {"content": "", "sources": []}
+                combined_content = await self._extract_content_from_results(search_results, deadline)
+                truncated_content = self._truncate_content(combined_content)
+                span.set(results=len(search_results), content_bytes=len(truncated_content.encode('utf-8')))
+                
+                return {
+                    "content": truncated_content,
+                    "sources": [result.get("href", "") for result in search_results]
+                }
+            except Exception as e:
+                span.set(error=type(e).__name__)
+                return {"content": "", "sources": []}
     
     async def search_for_slide(self, slide_title: str, presentation_topic: str = "") -> str:
         if not self.is_search_beneficial(slide_title):
@@ -56,7 +133,7 @@ class WebSearchService:
             print(f"{self.loc.t('search_error')} для слайда '{slide_title}': {e}")
             return ""
     
-    def _perform_search(self, query: str, language: str) -> List[Dict]:
+    async def _perform_search(self, query: str, language: str) -> List[Dict]:
         try:
             if self.settings:
                 region = self.settings.get("search_region", "ru-ru")
@@ -64,79 +141,169 @@ class WebSearchService:
                 from ..localization.manager import get_localization_manager
                 loc = get_localization_manager()
                 region = "ru-ru" if language == loc.t('language_russian') else "us-en"
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    query=query,
-                    region=region,
-                    max_results=self.max_results,
-                    safesearch="moderate",
-                    timelimit="y"
-                ))
-            return results
+            return await self._run_search(query, region)
         except Exception as e:
             print(f"{self.loc.t('search_error')}: {e}")
             return []
     
+    async def _run_search(self, query: str, region: str) -> List[Dict]:
+        with self.tracer.span("search.query", "search", region=region) as span:
+            if self.search_cache:
+                cached_results = self.search_cache.get_results(query, region, self.max_results)
+                if cached_results is not None:
+                    span.set(cache_hit=True, results=len(cached_results))
+                    return cached_results
+            
+            results = await self._run_backend_search(query, region)
+            span.set(cache_hit=False, results=len(results))
+            if results and self.search_cache:
+                self.search_cache.set_results(query, region, self.max_results, results)
+            return results
+    
+    async def _run_backend_search(self, query: str, region: str) -> List[Dict]:
+        await self.start()
+        if self._search_executor is None:
+            self._search_executor = ThreadPoolExecutor(
+                max_workers=max(1, self.max_concurrent_searches),
+                thread_name_prefix="ddgs-search"
+            )
+        
+        async with self._search_slots:
+            async with self._search_pacing_lock:
+                delay = self._last_search_time + self.search_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._last_search_time = time.monotonic()
+            
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._search_executor, self._ddgs_text, query, region)
+    
+    def _ddgs_text(self, query: str, region: str) -> List[Dict]:
+        with DDGS() as ddgs:
+            return list(ddgs.text(
+                query=query,
+                region=region,
+                max_results=self.max_results,
+                safesearch="moderate",
+                timelimit="y"
+            ))
+    
     async def _perform_search_async(self, query: str) -> str:
         try:
             region = self.settings.get("search_region", "ru-ru") if self.settings else "ru-ru"
-            with DDGS() as ddgs:
-                results = list(ddgs.text(
-                    query=query,
-                    region=region,
-                    max_results=self.max_results,
-                    safesearch="moderate",
-                    timelimit="y"
-                ))
+            results = await self._run_search(query, region)
             
             if not results:
                 return ""
                 
-            combined_content = self._extract_content_from_results(results)
+            combined_content = await self._extract_content_from_results(results)
             return self._truncate_content(combined_content)
             
         except Exception as e:
             print(f"{self.loc.t('async_search_error')}: {e}")
             return ""
     
-    def _extract_content_from_results(self, results: List[Dict]) -> str:
+    async def _extract_content_from_results(self, results: List[Dict], deadline: Optional[float] = None) -> str:
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + self.search_deadline
+        
+        scrape_tasks = {}
+        for index, result in enumerate(results):
+            url = result.get("href", "")
+            if url:
+                scrape_tasks[index] = asyncio.ensure_future(self._scrape_page_content(url))
+        
+        if scrape_tasks:
+            done, pending = await asyncio.wait(scrape_tasks.values(), timeout=max(0.0, deadline - loop.time()))
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
         all_content = []
         
-        for result in results:
+        for index, result in enumerate(results):
             snippet = result.get("body", "")
             if snippet:
                 all_content.append(snippet)
-                
-            url = result.get("href", "")
-            if url:
-                page_content = self._scrape_page_content(url)
+            
+            task = scrape_tasks.get(index)
+            if task and task.done() and not task.cancelled() and not task.exception():
+                page_content = task.result()
                 if page_content:
                     all_content.append(page_content)
                     
         return " ".join(all_content)
     
-    def _scrape_page_content(self, url: str) -> str:
-        try:
-            time.sleep(self.request_delay)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                return ""
+    async def _wait_for_host_slot(self, host: str) -> None:
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            delay = self._host_last_request.get(host, 0.0) + self.request_delay - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._host_last_request[host] = time.monotonic()
+    
+    async def _scrape_page_content(self, url: str) -> str:
+        with self.tracer.span("scrape", "search", host=urlparse(url).netloc) as span:
+            try:
+                cached_page = self.search_cache.get_page(url) if self.search_cache else None
+                if cached_page and cached_page['fresh']:
+                    span.set(cache="hit", text_bytes=len(cached_page['text'].encode('utf-8')))
+                    return cached_page['text']
                 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            for script in soup(["script", "style", "nav", "footer", "header"]):
-                script.decompose()
+                request_headers = {}
+                if cached_page:
+                    if cached_page['etag']:
+                        request_headers['If-None-Match'] = cached_page['etag']
+                    if cached_page['last_modified']:
+                        request_headers['If-Modified-Since'] = cached_page['last_modified']
                 
-            text = soup.get_text(separator=' ', strip=True)
-            cleaned_text = re.sub(r'\s+', ' ', text)
-            
-            return cleaned_text[:800]
-        except Exception:
-            return ""
+                session = await self._get_session()
+                await self._wait_for_host_slot(urlparse(url).netloc)
+                
+                async with session.get(url, headers=request_headers) as response:
+                    span.set(status=response.status)
+                    if response.status == 304 and cached_page:
+                        self.search_cache.mark_page_revalidated(url)
+                        span.set(cache="revalidated", text_bytes=len(cached_page['text'].encode('utf-8')))
+                        return cached_page['text']
+                    if response.status != 200:
+                        return ""
+                    content = await self._read_body(response)
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                
+                text = await asyncio.to_thread(self._extract_page_text, content)
+                span.set(cache="miss", page_bytes=len(content), text_bytes=len(text.encode('utf-8')))
+                if self.search_cache:
+                    self.search_cache.set_page(url, text, etag, last_modified)
+                return text
+            except asyncio.CancelledError:
+                span.set(cancelled=True)
+                raise
+            except Exception as e:
+                span.set(error=type(e).__name__)
+                return ""
+    
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(65536):
+            body += chunk
+            if len(body) >= self.max_page_bytes:
+                break
+        return bytes(body[:self.max_page_bytes])
+    
+    def _extract_page_text(self, content: bytes) -> str:
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        for script in soup(["script", "style", "nav", "footer", "header"]):
+            script.decompose()
+        
+        text = soup.get_text(separator=' ', strip=True)
+        cleaned_text = re.sub(r'\s+', ' ', text)
+        
+        return cleaned_text[:800]
     
     def _truncate_content(self, content: str) -> str:
         if len(content) <= self.max_content_length:
@@ -0,0 +1,221 @@
+import re
+import json
+import time
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from rich.console import Console
+from ..services.presentation_service import PresentationService
+from ..localization.manager import get_localization_manager
+from ..database.settings_manager import SettingsManager
+from ..config.api_config import ApiKeyManager
+
+
+class BatchInterface:
+    def __init__(
+        self,
+        topics_path: str,
+        output_dir: str = "output",
+        manifest_path: Optional[str] = None,
+        max_concurrent_decks: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+        trace_path: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+        token_budget: Optional[int] = None
+    ):
+        self.console = Console()
+        self.settings = SettingsManager()
+        self.loc = get_localization_manager()
+        
+        interface_lang = self.settings.get("interface_language", self.loc.t('language_russian'))
+        self.loc.set_language(interface_lang)
+        
+        self.topics_path = Path(topics_path)
+        self.output_dir = Path(output_dir)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.output_dir / f"{self.topics_path.stem}_manifest.jsonl"
+        self.max_concurrent_decks = max(1, max_concurrent_decks or int(self.settings.get("batch_max_concurrent_decks", 4)))
+        self.max_concurrent_requests = max(1, max_concurrent_requests or int(self.settings.get("max_concurrent_requests", 4)))
+        self.trace_path = trace_path
+        self.deadline_seconds = deadline_seconds
+        self.token_budget = token_budget
+        self.language_aliases = {
+            "ru": self.loc.t('language_russian'),
+            "russian": self.loc.t('language_russian'),
+            self.loc.t('language_russian'): self.loc.t('language_russian'),
+            "en": self.loc.t('language_english'),
+            "english": self.loc.t('language_english')
+        }
+    
+    def run(self) -> int:
+        if not self.topics_path.exists():
+            self.console.print(f"[bold red]{self.loc.t('batch_topics_not_found')}: {self.topics_path}[/bold red]")
+            return 1
+        
+        api_key = ApiKeyManager().get_saved_api_key()
+        if not api_key:
+            self.console.print(f"[bold red]{self.loc.t('batch_api_key_missing')}[/bold red]")
+            return 1
+        
+        specs = self._load_topics()
+        if not specs:
+            self.console.print(f"[yellow]{self.loc.t('batch_no_topics')}[/yellow]")
+            return 1
+        
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        service = PresentationService(api_key, output_dir=str(self.output_dir), interface_language=self.loc.current_language)
+        if self.trace_path:
+            service.tracer.configure(enabled=True)
+        
+        self.console.print(self.loc.t(
+            "batch_started",
+            count=len(specs),
+            decks=self.max_concurrent_decks,
+            requests=self.max_concurrent_requests
+        ))
+        
+        start_time = time.time()
+        results = asyncio.run(self._run_batch(service, specs))
+        
+        succeeded = sum(1 for result in results if result['status'] == 'ok')
+        failed = len(results) - succeeded
+        self.console.print(self.loc.t(
+            "batch_finished",
+            ok=succeeded,
+            failed=failed,
+            time=f"{int(time.time() - start_time)} {self.loc.t('seconds')}"
+        ))
+        self.console.print(f"{self.loc.t('batch_manifest')}: {self.manifest_path}")
+        
+        if self.trace_path:
+            self._print_trace_summary(service.get_trace_summary())
+            self.console.print(f"{self.loc.t('trace_saved')} {service.export_trace(path=self.trace_path)}")
+        
+        return 0 if failed == 0 else 1
+    
+    def _print_trace_summary(self, summary: dict) -> None:
+        for name, entry in sorted(summary.items(), key=lambda item: item[1]['total_seconds'], reverse=True):
+            self.console.print(self.loc.t(
+                "trace_summary_line",
+                name=name,
+                count=entry['count'],
+                total=f"{entry['total_seconds']:.2f}",
+                max=f"{entry['max_seconds']:.2f}"
+            ))
+    
+    def _load_topics(self) -> List[dict]:
+        specs = []
+        with open(self.topics_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                try:
+                    spec = json.loads(line)
+                    if not isinstance(spec, dict) or not str(spec.get('title', '')).strip():
+                        raise ValueError(self.loc.t('batch_missing_title'))
+                    specs.append(self._normalize_spec(spec, line_number))
+                except (ValueError, TypeError) as e:
+                    specs.append({'line': line_number, 'title': None, 'error': f"{self.loc.t('batch_invalid_spec')}: {e}"})
+        
+        return specs
+    
+    def _normalize_spec(self, spec: dict, line_number: int) -> dict:
+        language = str(spec.get('language', self.loc.t('language_russian'))).strip().lower()
+        if language not in self.language_aliases:
+            raise ValueError(f"{self.loc.t('batch_unknown_language')}: {language}")
+        
+        return {
+            'line': line_number,
+            'title': str(spec['title']).strip(),
+            'max_sections': int(spec.get('sections', spec.get('max_sections', 3))),
+            'max_slides': int(spec.get('slides', spec.get('max_slides', 4))),
+            'language': self.language_aliases[language],
+            'enable_web_search': bool(spec.get('web_search', spec.get('enable_web_search', False))),
+            'filename': spec.get('filename'),
+            'deadline_seconds': spec.get('deadline', self.deadline_seconds),
+            'token_budget': spec.get('token_budget', self.token_budget),
+            'error': None
+        }
+    
+    def _deck_filename(self, spec: dict) -> str:
+        if spec['filename']:
+            return str(spec['filename'])
+        safe_title = re.sub(r'[^\w-]+', '_', spec['title']).strip('_')[:50] or "Presentation"
+        return f"{spec['line']:04d}_{safe_title}.pptx"
+    
+    async def _run_batch(self, service: PresentationService, specs: List[dict]) -> List[dict]:
+        deck_semaphore = asyncio.Semaphore(self.max_concurrent_decks)
+        service.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        progress = {'done': 0, 'total': len(specs)}
+        
+        await service.start()
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as manifest:
+                return list(await asyncio.gather(*(
+                    self._generate_deck(service, spec, deck_semaphore, manifest, progress)
+                    for spec in specs
+                )))
+        finally:
+            service.request_semaphore = None
+            await service.close()
+    
+    async def _generate_deck(self, service: PresentationService, spec: dict, deck_semaphore: asyncio.Semaphore, manifest, progress: dict) -> dict:
+        result = {
+            'line': spec['line'],
+            'title': spec['title'],
+            'status': 'failed',
+            'file': None,
+            'presentation_id': None,
+            'sections': 0,
+            'slides': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'budget': None,
+            'started_at': None,
+            'duration_seconds': 0.0,
+            'error': spec['error']
+        }
+        
+        if not spec['error']:
+            async with deck_semaphore:
+                result['started_at'] = datetime.now().isoformat(timespec='seconds')
+                start_time = time.time()
+                try:
+                    presentation = await service.generate_presentation(
+                        title=spec['title'],
+                        max_sections=spec['max_sections'],
+                        max_slides=spec['max_slides'],
+                        language=spec['language'],
+                        enable_web_search=spec['enable_web_search'],
+                        deadline_seconds=spec['deadline_seconds'],
+                        token_budget=spec['token_budget'],
+                        smart_filename=False
+                    )
+                    result['file'] = await service.save_presentation_async(presentation, self._deck_filename(spec))
+                    result['presentation_id'] = presentation.id
+                    result['sections'] = len(presentation.sections)
+                    result['slides'] = presentation.get_total_slides()
+                    result['budget'] = presentation.budget_stats
+                    token_stats = service.get_token_usage_stats(presentation)
+                    if token_stats:
+                        result['prompt_tokens'] = token_stats['prompt_tokens']
+                        result['completion_tokens'] = token_stats['completion_tokens']
+                    result['status'] = 'ok'
+                except Exception as e:
+                    result['error'] = str(e)
+                result['duration_seconds'] = round(time.time() - start_time, 2)
+        
+        manifest.write(json.dumps(result, ensure_ascii=False) + "\n")
+        manifest.flush()
+        
+        progress['done'] += 1
+        counter = f"[{progress['done']}/{progress['total']}]"
+        if result['status'] == 'ok':
+            self.console.print(f"[green]✓ {counter}[/green] {result['title']} → {result['file']} ({result['duration_seconds']}s)")
+        else:
+            self.console.print(f"[red]× {counter}[/red] {result['title'] or self.loc.t('batch_line', line=result['line'])}: {result['error']}")
+        
+        return result
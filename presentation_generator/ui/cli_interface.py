@@ -131,7 +131,7 @@ class CLIInterface:
             'enable_web_search': enable_web_search
         }
     
-    def generate_presentation_with_progress(self, **kwargs):
+    def generate_presentation_with_progress(self, presentation_id: int = None, **kwargs):
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -146,16 +146,29 @@ class CLIInterface:
             def progress_callback(description: str, current: int, total: int):
                 progress.update(task, description=description, completed=current, total=total)
             
+            async def generate():
+                await self.service.start()
+                try:
+                    if presentation_id is not None:
+                        return await self.service.resume_presentation(
+                            presentation_id,
+                            progress_callback=progress_callback
+                        )
+                    return await self.service.generate_presentation(
+                        progress_callback=progress_callback,
+                        **kwargs
+                    )
+                finally:
+                    await self.service.close()
+            
             try:
-                presentation = asyncio.run(self.service.generate_presentation(
-                    progress_callback=progress_callback,
-                    **kwargs
-                ))
+                presentation = asyncio.run(generate())
                 
                 progress.update(task, description=self.loc.t("generation_complete"), completed=1, total=1)
             except Exception as e:
                 progress.update(task, description=self.loc.t("generation_failed"), completed=1, total=1)
                 self.console.print(f"\n[bold red]{self.loc.t('generation_error')}: {e}[/bold red]")
+                self.console.print(f"[yellow]{self.loc.t('generation_resumable')}[/yellow]")
                 return None
             
         return presentation
@@ -173,6 +186,66 @@ class CLIInterface:
         summary_table.add_row(self.loc.t("language"), stats['language'])
         summary_table.add_row(self.loc.t("created"), stats['created_at'])
         
+        cache_stats = self.service.get_cache_stats()
+        if cache_stats:
+            summary_table.add_row(
+                self.loc.t("response_cache"),
+                self.loc.t(
+                    "response_cache_stats",
+                    hits=cache_stats['hits'],
+                    misses=cache_stats['misses'],
+                    saved=f"{cache_stats['bytes_saved'] / 1024:.1f}"
+                )
+            )
+        
+        token_stats = self.service.get_token_usage_stats(presentation)
+        if token_stats:
+            summary_table.add_row(
+                self.loc.t("token_usage"),
+                self.loc.t(
+                    "token_usage_stats",
+                    total=token_stats['total_tokens'],
+                    prompt=token_stats['prompt_tokens'],
+                    completion=token_stats['completion_tokens'],
+                    requests=token_stats['requests']
+                )
+            )
+            summary_table.add_row(
+                self.loc.t("token_usage_by_type"),
+                ", ".join(
+                    f"{prompt_type} {entry['prompt_tokens'] + entry['completion_tokens']}"
+                    for prompt_type, entry in token_stats['top_types']
+                )
+            )
+            if token_stats['cost'] is not None:
+                summary_table.add_row(self.loc.t("token_cost"), f"${token_stats['cost']:.4f}")
+        
+        if presentation.budget_stats:
+            budget_stats = presentation.budget_stats
+            summary_table.add_row(
+                self.loc.t("deck_budget"),
+                self.loc.t(
+                    "deck_budget_stats",
+                    level=self.loc.t(f"budget_level_{budget_stats['level']}"),
+                    elapsed=budget_stats['elapsed_seconds'],
+                    tokens=budget_stats['tokens_spent'],
+                    web=budget_stats['web_skipped'],
+                    skipped=budget_stats['requests_skipped'] + budget_stats['requests_cut']
+                )
+            )
+        
+        hedge_stats = self.service.get_hedge_stats()
+        if hedge_stats['hedged']:
+            summary_table.add_row(
+                self.loc.t("hedged_requests"),
+                self.loc.t(
+                    "hedged_requests_stats",
+                    hedged=hedge_stats['hedged'],
+                    requests=hedge_stats['requests'],
+                    wins=hedge_stats['hedge_wins']
+                )
+            )
+        
         summary_panel = Panel(
             summary_table,
             title=f"[bold white]{self.loc.t('presentation_info')}[/bold white]",
@@ -185,11 +258,14 @@ class CLIInterface:
         self.console.print(f"\n[bold cyan]{self.loc.t('saving')}[/bold cyan]")
         
         try:
-            presentation_id = self.service.save_to_database(presentation)
-            file_path = self.service.save_presentation(presentation)
+            file_path = asyncio.run(self.service.save_presentation_async(presentation))
             
             self.console.print(f"[bold green]{self.loc.t('saved')} {file_path}[/bold green]")
-            self.console.print(f"[bold green]{self.loc.t('db_id')} {presentation_id}[/bold green]")
+            self.console.print(f"[bold green]{self.loc.t('db_id')} {presentation.id}[/bold green]")
+            
+            trace_path = self.service.export_trace(presentation)
+            if trace_path:
+                self.console.print(f"[dim]{self.loc.t('trace_saved')} {trace_path}[/dim]")
             
             self.console.print(f"\n[bold cyan]{self.loc.t('what_next')}[/bold cyan]")
             self.console.print(f"1. {self.loc.t('open_pres')}")
@@ -232,7 +308,8 @@ class CLIInterface:
             
             menu_table.add_row("1", self.loc.t("menu_show"))
             menu_table.add_row("2", self.loc.t("menu_delete"))
-            menu_table.add_row("3", self.loc.t("back_to_main"))
+            menu_table.add_row("3", self.loc.t("menu_resume"))
+            menu_table.add_row("4", self.loc.t("back_to_main"))
             
             menu_panel = Panel(
                 menu_table,
@@ -242,13 +319,15 @@ class CLIInterface:
             )
             self.console.print(menu_panel)
             
-            choice = Prompt.ask(f"\n{self.loc.t('choose_option')}", choices=["1", "2", "3"])
+            choice = Prompt.ask(f"\n{self.loc.t('choose_option')}", choices=["1", "2", "3", "4"])
             
             if choice == "1":
                 self.show_saved_presentations()
             elif choice == "2":
                 self.delete_presentation()
             elif choice == "3":
+                self.resume_unfinished_presentation()
+            elif choice == "4":
                 break
     
     def show_saved_presentations(self):
@@ -286,6 +365,46 @@ class CLIInterface:
             except Exception as e:
                 self.console.print(f"[bold red]{self.loc.t('error')} {e}[/bold red]")
     
+    def resume_unfinished_presentation(self):
+        presentations = self.service.get_unfinished_presentations()
+        
+        if not presentations:
+            self.console.print(Panel(
+                f"[yellow]{self.loc.t('no_unfinished')}[/yellow]",
+                style="yellow"
+            ))
+            return
+        
+        table = Table(title=self.loc.t("unfinished_presentations"), box=box.ROUNDED)
+        table.add_column("№", style="cyan", width=5)
+        table.add_column(self.loc.t("unfinished_title"), style="white")
+        table.add_column(self.loc.t("unfinished_progress"), style="green")
+        
+        for i, item in enumerate(presentations, 1):
+            table.add_row(str(i), item['title'], f"{item['completed_slides']}/{item['total_slides']}")
+        
+        self.console.print(table)
+        
+        try:
+            choice = IntPrompt.ask(
+                self.loc.t("enter_resume_number"),
+                show_default=False
+            )
+            
+            if 1 <= choice <= len(presentations):
+                self.console.print()
+                presentation = self.generate_presentation_with_progress(presentation_id=presentations[choice - 1]['id'])
+                
+                if presentation:
+                    self.console.print()
+                    self.show_presentation_summary(presentation)
+                    self.save_and_open_presentation(presentation)
+            else:
+                self.console.print(f"[bold red]{self.loc.t('invalid_number')}[/bold red]")
+        
+        except Exception as e:
+            self.console.print(f"[bold red]{self.loc.t('error')} {e}[/bold red]")
+    
     def delete_presentation(self):
         presentations = self.service.list_saved_presentations()
         
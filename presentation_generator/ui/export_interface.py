@@ -0,0 +1,79 @@
+import json
+import time
+from pathlib import Path
+from typing import List, Optional
+from rich.console import Console
+from ..services.presentation_service import PresentationService
+from ..localization.manager import get_localization_manager
+from ..database.settings_manager import SettingsManager
+from ..config.api_config import ApiKeyManager
+
+
+class ExportInterface:
+    def __init__(
+        self,
+        presentation_ids: Optional[List[int]] = None,
+        output_dir: str = "output",
+        manifest_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        decks_per_worker: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None
+    ):
+        self.console = Console()
+        self.settings = SettingsManager()
+        self.loc = get_localization_manager()
+        
+        interface_lang = self.settings.get("interface_language", self.loc.t('language_russian'))
+        self.loc.set_language(interface_lang)
+        
+        self.presentation_ids = presentation_ids or None
+        self.output_dir = Path(output_dir)
+        self.manifest_path = Path(manifest_path) if manifest_path else self.output_dir / "export_manifest.jsonl"
+        self.max_workers = max_workers
+        self.decks_per_worker = decks_per_worker
+        self.memory_limit_mb = memory_limit_mb
+    
+    def run(self) -> int:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        api_key = ApiKeyManager().get_saved_api_key() or ""
+        service = PresentationService(api_key, output_dir=str(self.output_dir), interface_language=self.loc.current_language)
+        
+        results = service.export_presentations(
+            self.presentation_ids,
+            max_workers=self.max_workers,
+            decks_per_worker=self.decks_per_worker,
+            memory_limit_mb=self.memory_limit_mb
+        )
+        self.console.print(self.loc.t(
+            "export_started",
+            workers=service.batch_renderer.max_workers,
+            decks=service.batch_renderer.decks_per_worker or "∞",
+            memory=f"{service.batch_renderer.memory_limit_mb} MB" if service.batch_renderer.memory_limit_mb else "∞"
+        ))
+        
+        start_time = time.time()
+        done = 0
+        with open(self.manifest_path, 'w', encoding='utf-8') as manifest:
+            for result in results:
+                done += 1
+                manifest.write(json.dumps(result, ensure_ascii=False) + "\n")
+                manifest.flush()
+                if result['status'] == 'ok':
+                    self.console.print(f"[green]✓ [{done}][/green] {result['title']} → {result['file']} ({result['render_seconds']}s, pid {result['worker']})")
+                else:
+                    self.console.print(f"[red]× [{done}][/red] {result['title'] or result['key']}: {result['error']}")
+        
+        stats = service.get_export_stats()
+        self.console.print(self.loc.t(
+            "export_finished",
+            ok=stats['rendered'],
+            failed=stats['failed'],
+            restarts=stats['pool_restarts'],
+            memory=stats['peak_rss_mb'],
+            time=f"{time.time() - start_time:.1f} {self.loc.t('seconds')}"
+        ))
+        self.console.print(f"{self.loc.t('batch_manifest')}: {self.manifest_path}")
+        
+        return 0 if stats['failed'] == 0 else 1
@@ -3,6 +3,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt
 from rich import box
+from pathlib import Path
 
 
 class SettingsInterface:
@@ -94,6 +95,13 @@ class SettingsInterface:
         else:
             self.console.print(f"\n[bold green]{self.loc.t('dev_mode_disabled')}[/bold green]")
         
+        current_tracing = self.settings.get("tracing_enabled", False)
+        self.console.print(f"\n{self.loc.t('tracing_enabled')}: [yellow]{'✓' if current_tracing else '✗'}[/yellow]")
+        self.console.print(f"{self.loc.t('tracing_info')}")
+        
+        tracing = Confirm.ask(f"{self.loc.t('tracing_enabled')}", default=current_tracing)
+        self.settings.set("tracing_enabled", tracing)
+        
         self.console.print(f"\n[bold green]✓ {self.loc.t('settings_saved')}[/bold green]")
     
     def show_presentation_settings(self):
@@ -115,6 +123,38 @@ class SettingsInterface:
         auto_open = Confirm.ask(f"{self.loc.t('auto_open')}?", default=current_auto_open)
         self.settings.set("auto_open_presentation", auto_open)
         
+        self.console.print(f"\n{self.loc.t('deck_budget_info')}")
+        
+        deadline = IntPrompt.ask(
+            self.loc.t('deck_deadline_seconds'),
+            default=int(self.settings.get("deck_deadline_seconds", 0)),
+            show_default=True
+        )
+        if deadline >= 0:
+            self.settings.set("deck_deadline_seconds", deadline)
+        
+        token_budget = IntPrompt.ask(
+            self.loc.t('deck_token_budget'),
+            default=int(self.settings.get("deck_token_budget", 0)),
+            show_default=True
+        )
+        if token_budget >= 0:
+            self.settings.set("deck_token_budget", token_budget)
+        
+        self.console.print(f"\n{self.loc.t('pptx_template_info')}")
+        
+        template_path = Prompt.ask(
+            self.loc.t('pptx_template_path'),
+            default=self.settings.get("pptx_template_path", ""),
+            show_default=True
+        ).strip()
+        if template_path == "-":
+            self.settings.set("pptx_template_path", "")
+        elif template_path and not Path(template_path).is_file():
+            self.console.print(f"[red]{self.loc.t('pptx_template_not_found')}: {template_path}[/red]")
+        else:
+            self.settings.set("pptx_template_path", template_path)
+        
         self.console.print(f"\n[bold green]✓ {self.loc.t('settings_saved')}[/bold green]")
     
     def show_ai_settings(self):
@@ -145,6 +185,46 @@ class SettingsInterface:
                 self.console.print(f"\n[bold red]{self.loc.t('invalid_choice')}[/bold red]")
         except:
             self.console.print(f"\n[bold red]{self.loc.t('invalid_input')}[/bold red]")
+        
+        current_concurrent = self.settings.get("concurrent_generation", True)
+        self.console.print(f"\n{self.loc.t('concurrent_generation')}: [yellow]{'✓' if current_concurrent else '✗'}[/yellow]")
+        self.console.print(f"{self.loc.t('concurrent_generation_info')}")
+        
+        concurrent = Confirm.ask(f"{self.loc.t('concurrent_generation')}?", default=current_concurrent)
+        self.settings.set("concurrent_generation", concurrent)
+        
+        if concurrent:
+            current_limit = self.settings.get("max_concurrent_requests", 4)
+            limit = IntPrompt.ask(
+                f"{self.loc.t('max_concurrent_requests')} (1-16)",
+                default=current_limit,
+                show_default=True
+            )
+            if 1 <= limit <= 16:
+                self.settings.set("max_concurrent_requests", limit)
+        
+        current_cache = self.settings.get("response_cache_enabled", False)
+        self.console.print(f"\n{self.loc.t('response_cache')}: [yellow]{'✓' if current_cache else '✗'}[/yellow]")
+        self.console.print(f"{self.loc.t('response_cache_info')}")
+        
+        cache_enabled = Confirm.ask(f"{self.loc.t('response_cache')}?", default=current_cache)
+        self.settings.set("response_cache_enabled", cache_enabled)
+        
+        current_stream = self.settings.get("stream_responses", True)
+        self.console.print(f"\n{self.loc.t('stream_responses')}: [yellow]{'✓' if current_stream else '✗'}[/yellow]")
+        self.console.print(f"{self.loc.t('stream_responses_info')}")
+        
+        stream_enabled = Confirm.ask(f"{self.loc.t('stream_responses')}?", default=current_stream)
+        self.settings.set("stream_responses", stream_enabled)
+        
+        current_section_batch = self.settings.get("section_batch_generation", False)
+        self.console.print(f"\n{self.loc.t('section_batch_generation')}: [yellow]{'✓' if current_section_batch else '✗'}[/yellow]")
+        self.console.print(f"{self.loc.t('section_batch_generation_info')}")
+        
+        section_batch_enabled = Confirm.ask(f"{self.loc.t('section_batch_generation')}?", default=current_section_batch)
+        self.settings.set("section_batch_generation", section_batch_enabled)
+        
+        self.console.print(f"\n[bold green]✓ {self.loc.t('settings_saved')}[/bold green]")
     
     def show_search_settings(self):
         current_engine = self.settings.get("search_engine", "DuckDuckGo")
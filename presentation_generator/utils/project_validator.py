@@ -101,8 +101,6 @@ class ProjectValidator:
             'python-pptx': 'pptx',
             'aiohttp': 'aiohttp',
             'rich': 'rich',
-            'requests': 'requests',
-            'urllib3': 'urllib3',
             'ddgs': 'ddgs',
             'beautifulsoup4': 'bs4',
             'psutil': 'psutil'
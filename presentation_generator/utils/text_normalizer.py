@@ -0,0 +1,180 @@
+import re
+from typing import List
+
+LIST_INTRO_WORDS = [
+    'основные', 'ключевые', 'главные', 'важные', 'преимущества', 'недостатки', 'этапы', 'шаги', 'причины',
+    'результаты', 'направления', 'включают', 'будет', 'рост', 'повышение', 'новые', 'этапы роста', 'олицетворяли',
+    'символизировал', 'подчеркивает', 'выражает', 'оборачивался'
+]
+
+ENUMERATION_WORDS = [
+    'позволяющее', 'зависит', 'такие как', 'в то время как', 'отличаются', 'потерей', 'беспомощность', 'утрату',
+    'каждый', 'уравнение', 'технологический', 'разрушение', 'сломанный'
+]
+
+MARKDOWN_TRIGGER = re.compile(r'[*_~`\[#>|]|^[ \t]*(?:[-+][ \t]|\d+\.[ \t]|-{3})', re.MULTILINE)
+BLANK_RUNS = re.compile(r'\n\s*\n\s*\n+')
+LINE_MARKUP = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<fence>```)'
+    r'|(?P<rule>-{3,}[ \t]*$)'
+    r'|(?P<table>\|.*\|)'
+    r'|(?P<heading>#{1,6}(?:[ \t]+|$))'
+    r'|(?P<quote>>[ \t]?)'
+    r'|(?P<bullet>(?:[-*+]|\d+[.)])[ \t]+)'
+    r')'
+)
+INLINE_MARKUP = re.compile(
+    r'\*\*(.+?)\*\*'
+    r'|__(.+?)__'
+    r'|~~(.+?)~~'
+    r'|`+([^`]*)`+'
+    r'|!\[([^\]]*)\]\([^)]*\)'
+    r'|\[([^\]]+)\]\([^)]*\)'
+    r'|(?<![\w*])\*(?![\s*])(.+?)(?<![\s*])\*'
+    r'|(?<!\w)_(?![\s_])(.+?)(?<![\s_])_(?!\w)'
+)
+INLINE_TRIGGER = re.compile(r'[*_~`\[]')
+SENTENCE_END = re.compile(r'[.!?]\s+')
+LIST_INTRO = re.compile('|'.join(re.escape(word) for word in LIST_INTRO_WORDS))
+ENUMERATION = re.compile('|'.join(re.escape(word) for word in ENUMERATION_WORDS))
+
+
+class TextNormalizer:
+    def __init__(self, line_width: int = 45, line_slack: int = 50):
+        self.line_width = line_width
+        self.line_slack = line_slack
+    
+    def normalize(self, content: str) -> str:
+        if not content or len(content.strip()) < 10:
+            return content
+        if content.strip().startswith('TABLE|'):
+            return content
+        return self.add_line_breaks(self.strip_markdown(content))
+    
+    def strip_markdown(self, content: str) -> str:
+        if not content:
+            return content
+        if not MARKDOWN_TRIGGER.search(content):
+            return BLANK_RUNS.sub('\n\n', content).strip()
+        
+        lines: List[str] = []
+        in_fence = False
+        blank = True
+        
+        for line in content.split('\n'):
+            markup = LINE_MARKUP.match(line)
+            kind = markup.lastgroup if markup else None
+            
+            if kind == 'fence':
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            
+            if kind in ('rule', 'table'):
+                line = ''
+            elif kind == 'bullet':
+                line = '• ' + line[markup.end():]
+            elif kind is not None:
+                line = line[markup.end():]
+            
+            if INLINE_TRIGGER.search(line):
+                line = self._strip_inline(line)
+            
+            if not line.strip():
+                if not blank:
+                    lines.append('')
+                blank = True
+                continue
+            
+            lines.append(line.rstrip())
+            blank = False
+        
+        while lines and not lines[-1]:
+            lines.pop()
+        return '\n'.join(lines).strip()
+    
+    def _strip_inline(self, line: str) -> str:
+        for _ in range(3):
+            stripped = INLINE_MARKUP.sub(lambda match: match.group(match.lastindex) or '', line)
+            if stripped == line:
+                break
+            line = stripped
+        return line
+    
+    def add_line_breaks(self, content: str) -> str:
+        if not content:
+            return content
+        
+        lines: List[str] = []
+        
+        if ':' in content and LIST_INTRO.search(content.lower()):
+            intro, items_text = content.split(':', 1)
+            lines.append(intro.strip() + ':')
+            items_text = items_text.strip()
+            
+            if '•' in items_text:
+                items = items_text.split('•')
+            else:
+                items = items_text.replace('.', '').split(',')
+            lines.extend('• ' + item.strip() for item in items if item.strip())
+        else:
+            for sentence in SENTENCE_END.split(content):
+                sentence = sentence.strip()
+                if not sentence:
+                    continue
+                if not sentence.endswith(('.', '!', '?')):
+                    sentence += '.'
+                
+                if '•' in sentence:
+                    head, *items = sentence.split('•')
+                    if head.strip():
+                        lines.append(head.strip())
+                    lines.extend('• ' + item.strip() for item in items if item.strip())
+                elif ',' in sentence and ENUMERATION.search(sentence.lower()):
+                    head, items_text = sentence.split(',', 1)
+                    lines.append(head.strip())
+                    lines.extend('• ' + item.strip() for item in items_text.replace('.', '').split(',') if item.strip())
+                else:
+                    lines.append(sentence)
+        
+        result_lines: List[str] = []
+        for line in lines:
+            if len(line) > self.line_width:
+                result_lines.extend(self._wrap(line))
+            else:
+                result_lines.append(line)
+        
+        result = '\n'.join(result_lines)
+        if len(result) < len(content) * 0.7:
+            return content
+        return result
+    
+    def _wrap(self, line: str) -> List[str]:
+        wrapped: List[str] = []
+        words = line.split()
+        current_line = ""
+        
+        for index, word in enumerate(words):
+            if len(current_line) + 1 + len(word) <= self.line_width:
+                current_line = f"{current_line} {word}" if current_line else word
+            elif not current_line:
+                current_line = word
+            else:
+                last_word = current_line.rsplit(' ', 1)[-1]
+                if len(last_word) < 3 and index < len(words) - 1 and len(current_line) + 1 + len(word) <= self.line_slack:
+                    current_line += " " + word
+                else:
+                    wrapped.append(current_line)
+                    current_line = word
+        
+        if current_line:
+            wrapped.append(current_line)
+        return wrapped
+
+
+_text_normalizer = TextNormalizer()
+
+def get_text_normalizer() -> TextNormalizer:
+    return _text_normalizer
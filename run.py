@@ -2,6 +2,7 @@
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 os.environ['PYTHONHTTPSVERIFY'] = '0'
@@ -27,6 +28,16 @@ def check_project():
         input()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from presentation_generator.main import batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+    
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        from presentation_generator.main import export_main
+        sys.exit(export_main(sys.argv[2:]))
+    
     check_project()
     
     from presentation_generator.main import main
@@ -0,0 +1,44 @@
+import asyncio
+import unittest
+from aiohttp import web
+from presentation_generator.services.web_search_service import WebSearchService
+
+
+class ScrapePageContentTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        app = web.Application()
+        app.router.add_get("/page", self._chunked_page)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}/page"
+        self.service = WebSearchService()
+        self.service.request_delay = 0
+    
+    async def asyncTearDown(self):
+        await self.service.close()
+        await self.runner.cleanup()
+    
+    async def _chunked_page(self, request):
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        await response.prepare(request)
+        await response.write(b"<html><head><style>body { color: red; }</style></head>")
+        await asyncio.sleep(0.05)
+        await response.write(b"<body><p>Solar panels convert sunlight into electricity.</p></body></html>")
+        await response.write_eof()
+        return response
+    
+    async def test_reads_body_sent_in_several_chunks(self):
+        text = await self.service._scrape_page_content(self.url)
+        self.assertEqual(text, "Solar panels convert sunlight into electricity.")
+    
+    async def test_stops_reading_at_page_size_limit(self):
+        self.service.max_page_bytes = 20
+        text = await self.service._scrape_page_content(self.url)
+        self.assertEqual(text, "")
+
+
+if __name__ == "__main__":
+    unittest.main()